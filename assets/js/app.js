@@ -1,53 +1,104 @@
 // Main Application Logic
-import { rawLibraries, domainMap } from '../data/libraries.js';
+import { loadCatalog } from './catalog.js';
 import { initCharts } from './charts.js';
 import { initComparator } from './comparator.js';
 import { openModal, closeModal, copyInstall } from './modal.js';
 import { initNaturalSearch } from './natural-search.js';
 
-// Process raw libraries into full objects
-export const libraries = rawLibraries.map((lib, index) => {
-    let dom = "Utilities";
-    for (const [key, value] of Object.entries(domainMap)) {
-        if (key === lib.c) { dom = value; break; }
-    }
+// Manifest and detail shards written by tools/convert_to_app_format.py
+const CATALOG_URL = new URL('../data/catalog/', import.meta.url);
+let catalog = null;
+
+// Cards rendered per page; more are added as the end of the grid scrolls into view
+const PAGE_SIZE = 48;
+
+// Library objects, built from the manifest once it loads. The card summary,
+// full description and link arrive with the library's detail shard.
+export const libraries = [];
 
-    // Generate popularity score
-    let basePop = 60;
-    if (lib.d.toLowerCase().includes("very widely used") || lib.d.toLowerCase().includes("extremely popular")) basePop = 95;
-    else if (lib.d.toLowerCase().includes("widely used")) basePop = 85;
-    else if (lib.d.toLowerCase().includes("niche")) basePop = 45;
+function toLibrary(lib, index) {
+    const dom = catalog.domainMap[lib.c] || "Utilities";
+
+    // Generate popularity score (the converter reads the wording that raises or lowers it)
+    const basePop = lib.p ?? 60;
 
     const randomVar = Math.floor(Math.random() * 10);
 
     return {
         id: `lib_${index}`,
+        index,
         name: lib.n,
         category: lib.c,
         domain: dom,
-        description: lib.d,
+        summary: '',
+        description: '',
+        tags: lib.t,
+        detailed: false,
         popularity: Math.min(basePop + randomVar, 100),
         install: `pip install ${lib.n.toLowerCase().replace(/\s+/g, '-').replace(/[()]/g, '')}`,
         snippet: `import ${lib.n.toLowerCase().split(/[ .]/)[0].replace(/[()]/g, '')}\n# Initializing ${lib.n}...`,
-        link: lib.l
+        link: ''
     };
-});
+}
+
+function addDetails(index, { s, d, l }) {
+    Object.assign(libraries[index], { summary: s, description: d, link: l, detailed: true });
+}
+
+// Fill in every library of the detail shards holding these ones
+function loadDetails(libs) {
+    const shards = new Set(libs.filter(lib => !lib.detailed).map(lib => catalog.shardOf(lib.index)));
+    return Promise.all([...shards].map(k => catalog.shardDetails(k).then(details => {
+        details.forEach((detail, index) => addDetails(index, detail));
+    })));
+}
 
 // Application state
 export const state = {
     search: "",
     activeCategories: [],
-    sortBy: "relevance"
+    sortBy: "relevance",
+    journalismFilter: false
 };
 
-// Fuse.js instance for fuzzy search
+// Fuse.js instance for fuzzy search, over the index the converter prebuilds
+// (keys and weights match SEARCH_KEYS in tools/convert_to_app_format.py)
+const FUSE_OPTIONS = {
+    keys: [
+        { name: 'name', weight: 0.4 },
+        { name: 'description', weight: 0.3 },
+        { name: 'domain', weight: 0.2 },
+        { name: 'category', weight: 0.1 }
+    ],
+    threshold: 0.4,
+    includeScore: true,
+    minMatchCharLength: 2
+};
 let fuse = null;
+let searchReady = null;
+
+function ensureSearch() {
+    if (!searchReady) {
+        searchReady = catalog.loadSearchIndex()
+            .then(index => {
+                fuse = new Fuse(libraries, FUSE_OPTIONS, Fuse.parseIndex(index));
+            })
+            .catch(error => {
+                searchReady = null;  // let the next search retry
+                throw error;
+            });
+    }
+    return searchReady;
+}
 
 // DOM References
 let grid, filterList, searchInput, filterSearch, activeFiltersContainer;
 
+// Grid paging
+let results = [], shown = 0, sentinel, observer;
+
 // Initialize application
-export function init() {
+export async function init() {
     // Get DOM references
     grid = document.getElementById('grid');
     filterList = document.getElementById('categoryList');
@@ -60,18 +111,27 @@ export function init() {
         return;
     }
 
-    // Initialize Fuse.js for fuzzy search
-    fuse = new Fuse(libraries, {
-        keys: [
-            { name: 'name', weight: 0.4 },
-            { name: 'description', weight: 0.3 },
-            { name: 'domain', weight: 0.2 },
-            { name: 'category', weight: 0.1 }
-        ],
-        threshold: 0.4,
-        includeScore: true,
-        minMatchCharLength: 2
-    });
+    try {
+        catalog = await loadCatalog(CATALOG_URL);
+    } catch (error) {
+        console.error('Could not load the library catalog', error);
+        return;
+    }
+    libraries.push(...catalog.summaries.map(toLibrary));
+
+    // The first page of cards comes from the first shard; later ones fetch theirs as they render
+    try {
+        await loadDetails(libraries.slice(0, PAGE_SIZE));
+    } catch (error) {
+        console.warn('Could not load library summaries', error);
+    }
+
+    sentinel = document.createElement('div');
+    sentinel.setAttribute('aria-hidden', 'true');
+    grid.after(sentinel);
+    observer = new IntersectionObserver(entries => {
+        if (entries.some(entry => entry.isIntersecting)) renderMoreCards();
+    }, { rootMargin: '600px' });
 
     renderFilters();
     renderGrid();
@@ -89,8 +149,15 @@ export function init() {
 
     initNaturalSearch(handleNaturalSearch);
 
+    // Nothing else loads until it is needed: the search index when the search
+    // box is first used, a detail shard when its cards or a library are shown
+    searchInput.addEventListener('focus', () => {
+        ensureSearch().catch(error => console.warn('Could not load the search index', error));
+    }, { once: true });
+
     searchInput.addEventListener('input', (e) => {
         state.search = e.target.value.toLowerCase();
+        state.journalismFilter = false;
         renderGrid();
     });
 
@@ -114,13 +181,27 @@ export function init() {
     window.toggleFilter = toggleFilter;
     window.resetFilters = resetFilters;
     window.scrollToSection = scrollToSection;
-    window.openModal = (id) => openModal(id, libraries);
+    window.openModal = openLibrary;
     window.closeModal = closeModal;
     window.copyInstall = copyInstall;
     window.filterJournalismLibs = filterJournalismLibs;
     window.generateRequirementsTxt = generateRequirementsTxt;
 }
 
+async function openLibrary(id) {
+    const index = libraries.findIndex(l => l.id === id);
+    if (index < 0) return;
+    if (!libraries[index].detailed) {
+        try {
+            addDetails(index, await catalog.details(index));
+        } catch (error) {
+            // Still show what the manifest has
+            console.warn('Could not load library details', error);
+        }
+    }
+    openModal(id, libraries);
+}
+
 function updateStats() {
     document.getElementById('totalCount').innerText = libraries.length;
     document.getElementById('categoryCount').innerText = [...new Set(libraries.map(l => l.category))].length;
@@ -147,6 +228,7 @@ function toggleFilter(cat) {
     } else {
         state.activeCategories.push(cat);
     }
+    state.journalismFilter = false;
     renderActiveFilters();
     renderGrid();
 }
@@ -165,6 +247,7 @@ function renderActiveFilters() {
 
 function resetFilters() {
     state.activeCategories = [];
+    state.journalismFilter = false;
     state.search = "";
     searchInput.value = "";
     renderActiveFilters();
@@ -174,8 +257,16 @@ function resetFilters() {
 function renderGrid() {
     let filtered;
 
+    if (state.journalismFilter) {
+        filtered = libraries.filter(lib => lib.tags.includes('JOURNALISM'));
+    }
     // Use fuzzy search if there's a search term, otherwise show all
-    if (state.search.trim()) {
+    else if (state.search.trim()) {
+        if (!fuse) {
+            // Search again once the index is in
+            ensureSearch().then(renderGrid, error => console.warn('Could not load the search index', error));
+            return;
+        }
         const fuseResults = fuse.search(state.search);
         filtered = fuseResults.map(result => result.item);
     } else {
@@ -189,15 +280,26 @@ function renderGrid() {
 
     document.getElementById('resultCount').innerText = `[ RESULTS: ${filtered.length} ]`;
 
+    results = filtered;
+    shown = 0;
+    grid.innerHTML = '';
+
     if (filtered.length === 0) {
-        grid.innerHTML = '';
+        sentinel.classList.add('hidden');
         document.getElementById('noResults').classList.remove('hidden');
         return;
     }
 
     document.getElementById('noResults').classList.add('hidden');
+    renderMoreCards();
+}
 
-    grid.innerHTML = filtered.map(lib => `
+function renderMoreCards() {
+    if (shown >= results.length) return;
+    const page = results.slice(shown, shown + PAGE_SIZE);
+    shown += page.length;
+
+    grid.insertAdjacentHTML('beforeend', page.map(lib => `
         <div onclick="openModal('${lib.id}')" class="bg-panel border-2 border-white/10 p-5 relative group hover:border-acid transition-all cursor-pointer flex flex-col min-h-[240px]">
             <div class="absolute inset-0 bg-acid/5 opacity-0 group-hover:opacity-100 transition-opacity z-0"></div>
 
@@ -215,7 +317,7 @@ function renderGrid() {
 
                 <!-- Description - takes available space -->
                 <div class="flex-1 mb-4">
-                    <p class="text-sm font-mono text-gray-400 leading-relaxed line-clamp-3">${lib.description}</p>
+                    <p id="summary-${lib.id}" class="text-sm font-mono text-gray-400 leading-relaxed line-clamp-3">${lib.summary}</p>
                 </div>
 
                 <!-- Footer - always at bottom -->
@@ -228,9 +330,23 @@ function renderGrid() {
                 </div>
             </div>
         </div>
-    `).join('');
+    `).join(''));
 
     lucide.createIcons();
+
+    // Cards whose shard hasn't arrived yet get their summary when it does
+    const pending = page.filter(lib => !lib.detailed);
+    if (pending.length) {
+        loadDetails(pending).then(() => pending.forEach(lib => {
+            const summary = document.getElementById(`summary-${lib.id}`);
+            if (summary) summary.textContent = lib.summary;
+        }), error => console.warn('Could not load library summaries', error));
+    }
+
+    // Re-observing reports the sentinel again if it is still on screen
+    sentinel.classList.toggle('hidden', shown >= results.length);
+    observer.unobserve(sentinel);
+    if (shown < results.length) observer.observe(sentinel);
 }
 
 function scrollToSection(id) {
@@ -245,7 +361,8 @@ function handleNaturalSearch(searchTerm) {
 
 function filterJournalismLibs() {
     // Filter to show only journalism-tagged libraries
-    state.search = "[JOURNALISM]";
+    state.journalismFilter = true;
+    state.search = "";
     searchInput.value = "";
     state.activeCategories = [];
     renderActiveFilters();
@@ -255,16 +372,17 @@ function filterJournalismLibs() {
     scrollToSection('explorer');
 }
 
-function generateRequirementsTxt(type = 'all') {
+async function generateRequirementsTxt(type = 'all') {
     let libsToExport;
 
     if (type === 'journalism') {
         // Export journalism libraries
-        libsToExport = libraries.filter(lib => lib.description.includes('[JOURNALISM]'));
+        libsToExport = libraries.filter(lib => lib.tags.includes('JOURNALISM'));
     } else if (type === 'current') {
         // Export currently filtered/visible libraries
         let filtered;
         if (state.search.trim()) {
+            await ensureSearch();
             const fuseResults = fuse.search(state.search);
             filtered = fuseResults.map(result => result.item);
         } else {
@@ -1,382 +1,1201 @@
 // Python Libraries Data
 // Auto-generated from awesome-python collection
 
-export const rawLibraries = [
-    { n: "ajenti", c: "Utilities", d: "A web-based admin dashboard that makes it easy to manage and monitor your servers without using complicated command-line tools.", l: "https://github.com/ajenti/ajenti" },
-    { n: "django-grappelli", c: "Utilities", d: "Makes Django's admin interface look prettier and more modern so it's nicer to use for managing your website's data. [JOURNALISM]", l: "https://github.com/sehmaschine/django-grappelli" },
-    { n: "flask-admin", c: "Utilities", d: "Quickly create an admin panel for your Flask web app to manage your data without building one from scratch. [JOURNALISM]", l: "https://github.com/flask-admin/flask-admin" },
-    { n: "flower", c: "Utilities", d: "A web interface to watch what's happening with your background tasks in Celery and see if they're running smoothly.", l: "https://github.com/mher/flower" },
-    { n: "jet-bridge", c: "Utilities", d: "Automatically generate a polished admin panel for any Python application so you can manage your data through a nice interface.", l: "https://github.com/jet-admin/jet-bridge" },
-    { n: "wooey", c: "Utilities", d: "Turn your Python scripts into interactive web forms so anyone can use them without touching the command line.", l: "https://github.com/wooey/wooey" },
-    { n: "streamlit", c: "Utilities", d: "Build interactive dashboards and data apps in minutes using simple Python code, perfect for sharing analysis and reports. [JOURNALISM]", l: "https://github.com/streamlit/streamlit" },
-    { n: "daphne", c: "Web Frameworks", d: "A fast server that runs modern web applications built with Django, handling real-time features like WebSockets.", l: "https://github.com/django/daphne" },
-    { n: "uvicorn", c: "Web Frameworks", d: "An extremely fast web server that runs modern Python web frameworks, built for speed and performance.", l: "https://github.com/encode/uvicorn" },
-    { n: "hypercorn", c: "Web Frameworks", d: "A flexible web server similar to Gunicorn but designed to work with newer Python web frameworks for better performance.", l: "https://github.com/pgjones/hypercorn" },
-    { n: "asyncio", c: "Utilities", d: "Python's built-in tool for writing programs that handle many tasks at once, like talking to multiple users or services simultaneously.", l: "https://docs.python.org/3/library/asyncio.html" },
-    { n: "concurrent.futures", c: "Utilities", d: "A built-in Python tool that lets you run multiple tasks at the same time to make your programs faster and more responsive.", l: "https://docs.python.org/3/library/concurrent.futures.html" },
-    { n: "multiprocessing", c: "Utilities", d: "Python's standard way to split work across multiple processor cores, letting you do heavy computations much faster.", l: "https://docs.python.org/3/library/multiprocessing.html" },
-    { n: "trio", c: "Utilities", d: "A friendly library for writing programs that do multiple things at once, with clearer and easier-to-understand code than asyncio.", l: "https://github.com/python-trio/trio" },
-    { n: "twisted", c: "Utilities", d: "A powerful framework for building programs that handle many network connections at once, like chat servers or web scrapers.", l: "https://github.com/twisted/twisted" },
-    { n: "uvloop", c: "Utilities", d: "A super-fast replacement for Python's async engine that makes your concurrent programs run significantly faster.", l: "https://github.com/MagicStack/uvloop" },
-    { n: "eventlet", c: "Utilities", d: "A library that lets you handle many network connections at once without writing complicated async code.", l: "https://github.com/eventlet/eventlet" },
-    { n: "gevent", c: "Utilities", d: "A library that makes it easy to write programs handling many tasks simultaneously using lightweight threads.", l: "https://github.com/gevent/gevent" },
-    { n: "bitbake", c: "Build Tools", d: "A build tool designed for creating custom embedded Linux systems, similar to Make but specifically for Linux projects.", l: "https://github.com/openembedded/bitbake" },
-    { n: "buildout", c: "Build Tools", d: "A tool that automates building and assembling complex applications made of many separate parts.", l: "https://github.com/buildout/buildout" },
-    { n: "platformio", c: "Build Tools", d: "Helps you write and compile code for embedded devices like Arduino and microcontrollers in a unified way.", l: "https://github.com/platformio/platformio-core" },
-    { n: "pybuilder", c: "Build Tools", d: "An automation tool for building Python projects, handling tests, packaging, and publishing all in one place.", l: "https://github.com/pybuilder/pybuilder" },
-    { n: "scons", c: "Build Tools", d: "A powerful build tool that automates compiling code and managing project dependencies across different systems.", l: "https://github.com/SCons/scons" },
-    { n: "attrs", c: "Utilities", d: "Reduces boilerplate code in Python classes by automatically generating common methods like __init__ and __repr__.", l: "https://github.com/python-attrs/attrs" },
-    { n: "bidict", c: "Utilities", d: "A specialized dictionary that lets you look up values in both directions, useful for maintaining two-way relationships.", l: "https://github.com/jab/bidict" },
-    { n: "box", c: "Utilities", d: "A Python dictionary that lets you access items using dot notation (like obj.key) instead of bracket notation (like obj['key']).", l: "https://github.com/cdgriffith/Box" },
-    { n: "dataclasses", c: "Utilities", d: "Python's built-in way to create simple classes for storing data with automatic methods for initialization and representation.", l: "https://docs.python.org/3/library/dataclasses.html" },
-    { n: "dotteddict", c: "Utilities", d: "Lets you access nested dictionaries and lists using dot notation, like accessing 'config.database.host' as a path.", l: "https://github.com/carlosescri/DottedDict" },
-    { n: "feincms", c: "Utilities", d: "A powerful content management system built on Django for creating and managing website content without coding.", l: "https://github.com/feincms/feincms" },
-    { n: "indico", c: "Utilities", d: "A full-featured event management system for planning conferences, meetings, and gatherings with registration and scheduling.", l: "https://github.com/indico/indico" },
-    { n: "wagtail", c: "Utilities", d: "A content management system for Django that makes it easy to create and edit website pages with a user-friendly interface. [JOURNALISM]", l: "https://github.com/wagtail/wagtail" },
-    { n: "beaker", c: "Utilities", d: "A web middleware that handles storing user session data and caching information to make websites faster.", l: "https://github.com/bbangert/beaker" },
-    { n: "django-cache-machine", c: "Utilities", d: "Automatically stores Django database results in cache and updates the cache when data changes, improving performance.", l: "https://github.com/django-cache-machine/django-cache-machine" },
-    { n: "django-cacheops", c: "Utilities", d: "A smart caching tool for Django that automatically figures out what to refresh when your data changes.", l: "https://github.com/Suor/django-cacheops" },
-    { n: "dogpile.cache", c: "Utilities", d: "A modern caching library that works with databases and web frameworks to speed up your application.", l: "https://github.com/sqlalchemy/dogpile.cache" },
-    { n: "hermescache", c: "Utilities", d: "A Python caching system that organizes cached data with tags so you can selectively refresh only what you need.", l: "https://pypi.org/project/HermesCache/" },
-    { n: "pylibmc", c: "Utilities", d: "A Python connection to Memcached, a popular tool for temporarily storing data to make websites run much faster.", l: "https://github.com/lericson/pylibmc" },
-    { n: "python-diskcache", c: "Utilities", d: "Stores cached data on disk using a database, offering better performance and persistence than traditional memory caches.", l: "https://github.com/grantjenks/python-diskcache" },
-    { n: "errbot", c: "Utilities", d: "A chatbot framework that lets you automate tasks through chat platforms, enabling team automation and notifications.", l: "https://github.com/errbotio/errbot/" },
-    { n: "easyocr", c: "Computer Vision", d: "Extracts text from images automatically, supporting over 40 languages with minimal setup or configuration needed. [JOURNALISM]", l: "https://github.com/JaidedAI/EasyOCR" },
-    { n: "kornia", c: "Computer Vision", d: "A computer vision library for PyTorch that provides advanced image processing tools for machine learning projects.", l: "https://github.com/kornia/kornia/" },
-    { n: "opencv", c: "Computer Vision", d: "A comprehensive library for image and video processing, used for everything from face detection to video analysis. [JOURNALISM]", l: "https://opencv.org/" },
-    { n: "pytesseract", c: "Computer Vision", d: "A simple Python wrapper around Google's Tesseract tool for converting images and scanned documents into readable text. [JOURNALISM]", l: "https://github.com/madmaze/pytesseract" },
-    { n: "tesserocr", c: "Computer Vision", d: "An alternative wrapper for Tesseract OCR that's easy to use with image libraries and works well for text extraction.", l: "https://github.com/sirfz/tesserocr" },
-    { n: "configparser", c: "Utilities", d: "Python's built-in tool for reading and writing configuration files (INI format), making your apps customizable.", l: "https://docs.python.org/3/library/configparser.html" },
-    { n: "configobj", c: "Utilities", d: "Reads configuration files with the ability to validate the values, ensuring your settings are correct before use.", l: "https://github.com/DiffSK/configobj" },
-    { n: "hydra", c: "Utilities", d: "A framework that makes managing complex application settings easy, especially useful for machine learning experiments.", l: "https://github.com/facebookresearch/hydra" },
-    { n: "python-decouple", c: "Utilities", d: "Keeps sensitive information like passwords and API keys separate from your code using environment variables.", l: "https://github.com/HBNetwork/python-decouple" },
-    { n: "cryptography", c: "Security", d: "Provides tools for encrypting and decrypting data, creating secure communication channels, and protecting sensitive information.", l: "https://github.com/pyca/cryptography" },
-    { n: "paramiko", c: "Security", d: "Lets you connect to remote servers and run commands over SSH directly from Python, automating server management tasks.", l: "https://github.com/paramiko/paramiko" },
-    { n: "pynacl", c: "Security", d: "A library for keeping your data secure by encrypting and decrypting information so only the right people can read it.", l: "https://github.com/pyca/pynacl" },
-    { n: "pandas", c: "Data Analysis", d: "Makes it easy to work with spreadsheet-like data in Python—sort it, filter it, analyze it, and create charts all in code. [JOURNALISM]", l: "http://pandas.pydata.org/" },
-    { n: "aws-sdk-pandas", c: "Data Analysis", d: "Lets you use pandas to work directly with data stored on Amazon Web Services without downloading it first.", l: "https://github.com/aws/aws-sdk-pandas" },
-    { n: "datasette", c: "Data Analysis", d: "A tool that lets you explore databases and publish them on the web so others can search and analyze your data. [JOURNALISM]", l: "https://github.com/simonw/datasette" },
-    { n: "desbordante", c: "Data Analysis", d: "Automatically examines your data to find patterns, errors, and relationships you might have missed manually.", l: "https://github.com/desbordante/desbordante-core/" },
-    { n: "optimus", c: "Data Analysis", d: "Makes it simpler to process really large amounts of data using PySpark without getting bogged down in complex code.", l: "https://github.com/hi-primus/optimus" },
-    { n: "cerberus", c: "Data Analysis", d: "Checks if your data is correct and matches the rules you set up before you use or save it.", l: "https://github.com/pyeve/cerberus" },
-    { n: "colander", c: "Data Analysis", d: "Takes messy data from websites or APIs, checks if it's valid, and converts it into clean Python data you can use.", l: "https://github.com/Pylons/colander" },
-    { n: "jsonschema", c: "Data Analysis", d: "Verifies that JSON data (common format from APIs) matches the structure and rules you expect.", l: "https://github.com/python-jsonschema/jsonschema" },
-    { n: "schema", c: "Data Analysis", d: "A simple way to define and check that Python data structures (lists, dictionaries) have the right shape and types.", l: "https://github.com/keleshev/schema" },
-    { n: "schematics", c: "Data Analysis", d: "Validates and transforms data into proper formats, useful when handling information from forms or APIs.", l: "https://github.com/schematics/schematics" },
-    { n: "voluptuous", c: "Data Analysis", d: "Makes sure your Python data is correct by checking it against rules you define in an easy-to-read way.", l: "https://github.com/alecthomas/voluptuous" },
-    { n: "pydantic", c: "Data Analysis", d: "Uses Python's type hints to automatically validate and convert your data into the correct types.", l: "https://github.com/pydantic/pydantic" },
-    { n: "altair", c: "Data Visualization", d: "Create beautiful, interactive charts and graphs from your data using simple, readable code. [JOURNALISM]", l: "https://github.com/altair-viz/altair" },
-    { n: "bokeh", c: "Data Visualization", d: "Make interactive web-based charts and visualizations that users can zoom, pan, and explore in their browser. [JOURNALISM]", l: "https://github.com/bokeh/bokeh" },
-    { n: "bqplot", c: "Data Visualization", d: "Create interactive graphs directly inside Jupyter notebooks that you can click and explore.", l: "https://github.com/bloomberg/bqplot" },
-    { n: "cartopy", c: "Data Visualization", d: "Draw maps and geographic data visualizations so you can display information on real-world locations. [JOURNALISM]", l: "https://github.com/SciTools/cartopy" },
-    { n: "diagrams", c: "Data Visualization", d: "Generate professional system diagrams (like architecture or flowcharts) by writing code instead of using drawing tools. [JOURNALISM]", l: "https://github.com/mingrammer/diagrams" },
-    { n: "matplotlib", c: "Data Visualization", d: "Python's go-to library for making all kinds of plots, charts, and graphs to visualize your data. [JOURNALISM]", l: "https://github.com/matplotlib/matplotlib" },
-    { n: "plotnine", c: "Data Visualization", d: "Create beautiful charts using a grammar-of-graphics approach similar to R's ggplot2.", l: "https://github.com/has2k1/plotnine" },
-    { n: "pygal", c: "Data Visualization", d: "Generate clean, scalable charts as SVG files that look great on websites and in documents.", l: "https://github.com/Kozea/pygal" },
-    { n: "pygraphviz", c: "Data Visualization", d: "Visualize networks, graphs, and relationships using the powerful Graphviz layout engine from Python.", l: "https://github.com/pygraphviz/pygraphviz/" },
-    { n: "pyqtgraph", c: "Data Visualization", d: "Build real-time, interactive scientific plots and dashboards with fast performance for live data.", l: "https://github.com/pyqtgraph/pyqtgraph" },
-    { n: "seaborn", c: "Data Visualization", d: "Makes statistical charts and plots look beautiful and professional with just a few lines of code. [JOURNALISM]", l: "https://github.com/mwaskom/seaborn" },
-    { n: "vispy", c: "Data Visualization", d: "Create extremely fast, high-quality 3D and scientific visualizations using your computer's graphics card.", l: "https://github.com/vispy/vispy" },
-    { n: "pickleDB", c: "Database", d: "A lightweight database that stores key-value pairs (like a dictionary) without needing complex setup.", l: "https://github.com/patx/pickledb" },
-    { n: "tinydb", c: "Database", d: "A lightweight database perfect for small projects where you want to store and query documents without SQL.", l: "https://github.com/msiemens/tinydb" },
-    { n: "zodb", c: "Database", d: "Store Python objects directly in a database without having to convert them to SQL or JSON first.", l: "https://github.com/zopefoundation/ZODB" },
-    { n: "arrow", c: "Utilities", d: "Work with dates and times in Python in a much simpler, more intuitive way than the built-in tools.", l: "https://github.com/arrow-py/arrow" },
-    { n: "dateutil", c: "Utilities", d: "Extends Python's date/time tools with extra features like parsing dates in any format and handling timezones.", l: "https://github.com/dateutil/dateutil" },
-    { n: "pendulum", c: "Utilities", d: "Simplifies working with dates and times in Python, making timezone handling and date math much easier.", l: "https://github.com/sdispater/pendulum" },
-    { n: "pytz", c: "Utilities", d: "Handles all the world's timezones so you can work with dates correctly no matter where users are located.", l: "https://pypi.org/project/pytz/" },
-    { n: "keras", c: "Deep Learning", d: "A beginner-friendly library for building artificial neural networks (AI models) with simple, readable code.", l: "https://github.com/keras-team/keras" },
-    { n: "pytorch", c: "Deep Learning", d: "A powerful library for building and training AI models with the speed and flexibility that researchers love.", l: "https://github.com/pytorch/pytorch" },
-    { n: "pytorch-lightning", c: "Deep Learning", d: "Streamlines the process of training AI models in PyTorch, handling tedious details so you focus on your model.", l: "https://github.com/Lightning-AI/pytorch-lightning" },
-    { n: "stable-baselines3", c: "Deep Learning", d: "Pre-built algorithms for training AI agents to learn tasks through trial and error (reinforcement learning).", l: "https://github.com/DLR-RM/stable-baselines3" },
-    { n: "tensorflow", c: "Deep Learning", d: "Google's industry-standard library for building, training, and deploying machine learning and AI models at scale.", l: "https://github.com/tensorflow/tensorflow" },
-    { n: "theano", c: "Deep Learning", d: "A library designed for fast mathematical computations on large arrays, often used for deep learning research.", l: "https://github.com/Theano/Theano" },
-    { n: "py2app", c: "Utilities", d: "Convert your Python script into a standalone app that Mac users can run without needing Python installed.", l: "https://github.com/ronaldoussoren/py2app" },
-    { n: "py2exe", c: "Utilities", d: "Convert your Python script into a standalone .exe file so Windows users can run it without installing Python.", l: "https://github.com/py2exe/py2exe" },
-    { n: "pyarmor", c: "Utilities", d: "Protects your Python code by encrypting it so people can't easily read or modify what you've written.", l: "https://github.com/dashingsoft/pyarmor" },
-    { n: "pyinstaller", c: "Utilities", d: "Convert your Python scripts into executable files that work on Windows, Mac, or Linux without needing Python installed.", l: "https://github.com/pyinstaller/pyinstaller" },
-    { n: "shiv", c: "Utilities", d: "Bundle your Python program with all its dependencies into a single file that runs anywhere.", l: "https://github.com/linkedin/shiv" },
-    { n: "sphinx", c: "Utilities", d: "Automatically generate professional documentation for your Python code from docstrings and markdown files.", l: "https://github.com/sphinx-doc/sphinx/" },
-    { n: "pdoc", c: "Utilities", d: "Quickly generate clean, readable API documentation for your Python library with minimal setup.", l: "https://github.com/mitmproxy/pdoc" },
-    { n: "akshare", c: "Utilities", d: "Access financial market data (stocks, crypto, bonds) easily from Chinese and international sources.", l: "https://github.com/jindaxiang/akshare" },
-    { n: "s3cmd", c: "Utilities", d: "A command-line tool for uploading, downloading, and managing files stored on Amazon's S3 cloud storage.", l: "https://github.com/s3tools/s3cmd" },
-    { n: "youtube-dl", c: "Utilities", d: "Download videos from YouTube and other video websites directly from the command line. [JOURNALISM]", l: "https://github.com/ytdl-org/youtube-dl/" },
-    { n: "pyenv", c: "Utilities", d: "Easily switch between different Python versions on your computer without conflicts or complicated setup.", l: "https://github.com/pyenv/pyenv" },
-    { n: "virtualenv", c: "Utilities", d: "Create isolated Python environments on your computer so different projects don't interfere with each other's packages.", l: "https://github.com/pypa/virtualenv" },
-    { n: "mimetypes", c: "Utilities", d: "Automatically identifies what type of file you're dealing with by looking at its name or content, so your program knows whether it's handling a picture, document, video, etc.", l: "https://docs.python.org/3/library/mimetypes.html" },
-    { n: "pathlib", c: "Utilities", d: "Makes it easy to work with file and folder paths in your code without worrying about whether you're on Windows, Mac, or Linux—it handles the differences automatically.", l: "https://docs.python.org/3/library/pathlib.html" },
-    { n: "path.py", c: "Utilities", d: "Simplifies working with file paths by providing a cleaner, more intuitive way to navigate and manipulate files and folders in your Python code.", l: "https://github.com/jaraco/path.py" },
-    { n: "python-magic", c: "Utilities", d: "Detects what type of file you have by examining its actual content rather than just its extension, making it harder to fool with mislabeled files.", l: "https://github.com/ahupp/python-magic" },
-    { n: "watchdog", c: "Utilities", d: "Lets your program automatically detect and react when files change, get created, or deleted in a folder without constantly checking—perfect for auto-saving or syncing tools.", l: "https://github.com/gorakhargosh/watchdog" },
-    { n: "coconut", c: "Utilities", d: "An alternative Python syntax that makes it easier and cleaner to write certain types of code, especially when you want a more functional programming style.", l: "https://github.com/evhub/coconut" },
-    { n: "funcy", c: "Utilities", d: "Provides handy shortcuts and tools for working with data in creative ways, making complex operations simpler and more readable.", l: "https://github.com/Suor/funcy" },
-    { n: "more-itertools", c: "Utilities", d: "Offers extra power tools for looping through and manipulating lists and data collections beyond what Python provides built-in.", l: "https://github.com/erikrose/more-itertools" },
-    { n: "returns", c: "Utilities", d: "Helps you write more predictable, safer code by providing organized ways to handle different outcomes (success, failure, or special cases) without catching exceptions.", l: "https://github.com/dry-python/returns" },
-    { n: "cytoolz", c: "Utilities", d: "A super-fast version of functional programming tools that uses compiled code under the hood for handling large datasets without slowing down.", l: "https://github.com/pytoolz/cytoolz/" },
-    { n: "toolz", c: "Utilities", d: "A collection of helper functions for working with lists, dictionaries, and data transformations in a clean, functional programming style.", l: "https://github.com/pytoolz/toolz" },
-    { n: "curses", c: "GUI Development", d: "Lets you build text-based, interactive user interfaces in the terminal with windows, buttons, and menus—great for command-line tools.", l: "https://docs.python.org/3/library/curses.html" },
-    { n: "Eel", c: "GUI Development", d: "Combines Python code with web technologies to create desktop applications that look modern and work offline without needing an internet connection.", l: "https://github.com/ChrisKnott/Eel" },
-    { n: "enaml", c: "GUI Development", d: "Makes it simple to design user interfaces by writing them in a clean, declarative way that's easier to read than traditional code.", l: "https://github.com/nucleic/enaml" },
-    { n: "Flet", c: "GUI Development", d: "Write one Python program that runs on Windows, Mac, Linux, phones, and web browsers—perfect if you want to reach multiple platforms without rewriting your code.", l: "https://flet.dev/" },
-    { n: "Flexx", c: "GUI Development", d: "Creates desktop applications using web technology and Python, so you can build beautiful, interactive programs with the flexibility of web design.", l: "https://github.com/zoofIO/flexx" },
-    { n: "Gooey", c: "GUI Development", d: "Transform your simple command-line program into a full graphical application with a single line of code—no GUI experience needed.", l: "https://github.com/chriskiehl/Gooey" },
-    { n: "kivy", c: "GUI Development", d: "Build touch-friendly mobile and desktop apps in pure Python that work on phones, tablets, and computers with the same code.", l: "https://kivy.org/" },
-    { n: "pyglet", c: "GUI Development", d: "A lightweight toolkit for creating games and multimedia applications with graphics, sound, and animations that work across different operating systems.", l: "https://github.com/pyglet/pyglet" },
-    { n: "PyGObject", c: "GUI Development", d: "Connect Python to GTK, giving you access to the same graphics tools that power many Linux desktop applications.", l: "https://pygobject.readthedocs.io/" },
-    { n: "PyQt", c: "GUI Development", d: "Build professional desktop applications for Windows, Mac, and Linux using the same powerful tools that professionals use to create traditional software.", l: "https://doc.qt.io/qtforpython/" },
-    { n: "PySimpleGUI", c: "GUI Development", d: "The easiest way to add buttons, windows, and menus to your Python script—works with multiple graphics frameworks without you having to learn them all.", l: "https://github.com/PySimpleGUI/PySimpleGUI" },
-    { n: "pywebview", c: "GUI Development", d: "Wrap a web interface around your Python code to create a desktop app that looks modern and uses web technologies like HTML and JavaScript.", l: "https://github.com/r0x0r/pywebview/" },
-    { n: "Tkinter", c: "GUI Development", d: "Python's built-in tool for creating simple desktop applications with windows, buttons, and text boxes—easy to learn and comes with Python.", l: "https://wiki.python.org/moin/TkInter" },
-    { n: "Toga", c: "GUI Development", d: "Write one Python program that automatically looks native on Windows, Mac, iOS, and Android—matching each platform's design style perfectly.", l: "https://github.com/pybee/toga" },
-    { n: "urwid", c: "GUI Development", d: "Build sophisticated text-based user interfaces for the terminal with support for colors, animations, and interactive elements.", l: "http://urwid.org/" },
-    { n: "wxPython", c: "GUI Development", d: "Create native-looking desktop applications for Windows, Mac, and Linux that feel like real software rather than a web app.", l: "https://wxpython.org/" },
-    { n: "DearPyGui", c: "GUI Development", d: "Build fast, beautiful user interfaces with GPU acceleration, perfect when you need top performance or complex visualizations.", l: "https://github.com/RaylockLLC/DearPyGui/" },
-    { n: "graphene", c: "Utilities", d: "Easily create modern APIs that let your applications share data efficiently—popular with web developers who want flexible, powerful APIs.", l: "https://github.com/graphql-python/graphene/" },
-    { n: "Arcade", c: "Game Development", d: "A beginner-friendly library for making 2D games with Python, complete with graphics, sounds, and all the tools you need to bring your game ideas to life.", l: "https://api.arcade.academy/en/latest/" },
-    { n: "Cocos2d", c: "Game Development", d: "Build 2D games and animated applications with a framework designed to make graphics and interactions feel smooth and responsive.", l: "https://www.cocos.com/en/cocos2d-x" },
-    { n: "Harfang3D", c: "Game Development", d: "Create 3D games and virtual reality experiences with Python, giving you access to powerful 3D graphics without complex C++ code.", l: "http://www.harfang3d.com/" },
-    { n: "Panda3D", c: "Game Development", d: "A professional 3D game engine created by Disney that's free for everyone—build games and 3D applications with industrial-strength tools.", l: "https://www.panda3d.org/" },
-    { n: "Pygame", c: "Game Development", d: "The most popular Python tool for making 2D games—provides everything you need: graphics, sound, input, and collision detection.", l: "http://www.pygame.org/news.html" },
-    { n: "PyOgre", c: "Game Development", d: "Access professional 3D rendering technology through Python for games, simulations, and any application that needs impressive 3D visuals.", l: "http://www.ogre3d.org/tikiwiki/PyOgre" },
-    { n: "PyOpenGL", c: "Game Development", d: "Direct access to low-level graphics programming for creating custom 3D effects and high-performance visualizations.", l: "http://pyopengl.sourceforge.net/" },
-    { n: "PySDL2", c: "Game Development", d: "Use the powerful SDL game development library from Python to create games and multimedia applications across multiple platforms.", l: "https://pysdl2.readthedocs.io/" },
-    { n: "RenPy", c: "Game Development", d: "Specialized tool for creating visual novels and interactive story games where players make choices that affect the narrative.", l: "https://www.renpy.org/" },
-    { n: "django-countries", c: "Utilities", d: "Quickly add country selection fields to your Django website, automatically handling all country names and codes for you.", l: "https://github.com/SmileyChris/django-countries" },
-    { n: "geodjango", c: "Utilities", d: "Add location-based features to your website, like maps and location searches, with built-in geographic database support. [JOURNALISM]", l: "https://docs.djangoproject.com/en/dev/ref/contrib/gis/" },
-    { n: "geojson", c: "Utilities", d: "Work with map data in Python by reading and writing GeoJSON—a standard format for sharing geographic information.", l: "https://github.com/jazzband/geojson" },
-    { n: "geopy", c: "Utilities", d: "Convert addresses to coordinates and coordinates to addresses, or calculate distances between locations—all with a few lines of code. [JOURNALISM]", l: "https://github.com/geopy/geopy" },
-    { n: "beautifulsoup", c: "Utilities", d: "Extract data from websites by parsing HTML, making it easy to scrape information and automate web tasks without complex code. [JOURNALISM]", l: "https://www.crummy.com/software/BeautifulSoup/bs4/doc/" },
-    { n: "bleach", c: "Utilities", d: "Clean up user-submitted HTML to remove dangerous code while keeping the safe, formatted content—essential for websites that accept user input.", l: "https://github.com/mozilla/bleach" },
-    { n: "cssutils", c: "Utilities", d: "Parse, validate, and manipulate CSS stylesheets in Python, useful for analyzing web styling or programmatically generating styles.", l: "https://pypi.org/project/cssutils/" },
-    { n: "html5lib", c: "Utilities", d: "Parse and fix broken HTML the way web browsers do, making it reliable for extracting data from messy or malformed web pages.", l: "https://github.com/html5lib/html5lib-python" },
-    { n: "lxml", c: "Utilities", d: "Lightning-fast library for reading and manipulating HTML and XML documents—much faster than alternatives when dealing with large files.", l: "http://lxml.de/" },
-    { n: "markupsafe", c: "Utilities", d: "Safely handle text that contains special characters and HTML, preventing security vulnerabilities when displaying user input on websites.", l: "https://github.com/pallets/markupsafe" },
-    { n: "pyquery", c: "Utilities", d: "Query and manipulate HTML documents using jQuery-style syntax, making web scraping feel familiar if you know JavaScript.", l: "https://github.com/gawel/pyquery" },
-    { n: "untangle", c: "Utilities", d: "Convert XML files into simple Python objects, making it natural to access and work with structured data without parsing complexity.", l: "https://github.com/stchris/untangle" },
-    { n: "WeasyPrint", c: "Utilities", d: "Convert HTML and CSS documents into beautiful PDF files programmatically, perfect for generating invoices, reports, or any document from web content. [JOURNALISM]", l: "http://weasyprint.org/" },
-    { n: "xmldataset", c: "Utilities", d: "Easily read and parse XML files without complicated code, making it simple to extract data from XML documents.", l: "https://xmldataset.readthedocs.io/en/latest/" },
-    { n: "xmltodict", c: "Utilities", d: "Transform XML files into Python dictionaries so you can work with XML data just like you would with JSON.", l: "https://github.com/martinblech/xmltodict" },
-    { n: "httpx", c: "HTTP Clients", d: "A modern tool for sending HTTP requests to websites and APIs, with better features than older alternatives. [JOURNALISM]", l: "https://github.com/encode/httpx" },
-    { n: "requests", c: "HTTP Clients", d: "The easiest way to download web pages and interact with web APIs in Python, designed to be simple and intuitive. [JOURNALISM]", l: "https://github.com/psf/requests" },
-    { n: "treq", c: "HTTP Clients", d: "An HTTP library that works like requests but is built for asynchronous operations when you need faster, non-blocking web requests.", l: "https://github.com/twisted/treq" },
-    { n: "urllib3", c: "HTTP Clients", d: "A powerful HTTP library that handles connection pooling efficiently and safely manages multiple web requests at once.", l: "https://github.com/urllib3/urllib3" },
-    { n: "keyboard", c: "Utilities", d: "Monitor and control keyboard inputs on your computer, allowing you to detect key presses or simulate typing programmatically.", l: "https://github.com/boppreh/keyboard" },
-    { n: "mouse", c: "Utilities", d: "Track and control mouse movements and clicks on your computer, useful for automation or testing applications.", l: "https://github.com/boppreh/mouse" },
-    { n: "pynput", c: "Utilities", d: "Control and monitor your keyboard and mouse inputs, perfect for building automated scripts or testing software.", l: "https://github.com/moses-palmer/pynput" },
-    { n: "scapy", c: "Utilities", d: "Create, send, and analyze network packets to understand network traffic, test network security, or develop network tools.", l: "https://github.com/secdev/scapy" },
-    { n: "pillow", c: "Image Processing", d: "Edit and create images with Python, letting you resize, crop, rotate, and modify photos and graphics easily. [JOURNALISM]", l: "https://github.com/python-pillow/Pillow" },
-    { n: "python-barcode", c: "Image Processing", d: "Generate barcode images that you can use in your applications without needing extra software dependencies.", l: "https://github.com/WhyNotHugo/python-barcode" },
-    { n: "pymatting", c: "Image Processing", d: "Remove backgrounds from images or extract subjects with professional-quality transparency effects.", l: "http://github.com/pymatting/pymatting" },
-    { n: "python-qrcode", c: "Image Processing", d: "Create QR codes that people can scan with their phones, useful for sharing links or information in a compact format.", l: "https://github.com/lincolnloop/python-qrcode" },
-    { n: "pywal", c: "Image Processing", d: "Automatically extract color palettes from images to create matching color schemes for your applications or designs.", l: "https://github.com/dylanaraps/pywal" },
-    { n: "pyvips", c: "Image Processing", d: "Process images extremely fast and efficiently, even when working with very large images that would use too much memory otherwise.", l: "https://github.com/libvips/pyvips" },
-    { n: "quads", c: "Image Processing", d: "Turn photos into abstract art by breaking them down into colored squares, creating stylized digital paintings.", l: "https://github.com/fogleman/Quads" },
-    { n: "scikit-image", c: "Image Processing", d: "A comprehensive library for analyzing and processing images scientifically, useful for computer vision and image analysis projects.", l: "http://scikit-image.org/" },
-    { n: "thumbor", c: "Image Processing", d: "Automatically resize, crop, and flip images on demand, perfect for serving optimized images to websites and apps.", l: "https://github.com/thumbor/thumbor" },
-    { n: "wand", c: "Image Processing", d: "Use ImageMagick's powerful image processing capabilities from Python, giving you professional-grade image editing features.", l: "https://github.com/emcconville/wand" },
-    { n: "cpython", c: "Utilities", d: "The standard Python interpreter written in C, which powers most Python installations and is what you're using when you run Python normally.", l: "https://github.com/python/cpython" },
-    { n: "cython", c: "Utilities", d: "Speed up your Python code dramatically by converting it to C, making performance-critical applications much faster.", l: "https://github.com/cython/cython" },
-    { n: "clpython", c: "Utilities", d: "Run Python code using Common Lisp as the foundation instead of C, for specialized programming environments.", l: "https://github.com/metawilm/cl-python" },
-    { n: "ironpython", c: "Utilities", d: "Run Python code on the Microsoft .NET platform, letting you use Python with Windows-specific libraries and tools.", l: "https://github.com/IronLanguages/ironpython3" },
-    { n: "micropython", c: "Utilities", d: "Run Python on tiny devices like microcontrollers and single-board computers with minimal memory.", l: "https://github.com/micropython/micropython" },
-    { n: "numba", c: "Utilities", d: "Make math-heavy and scientific Python code run much faster by automatically compiling it to machine code.", l: "https://github.com/numba/numba" },
-    { n: "peachpy", c: "Utilities", d: "Write ultra-optimized low-level processor instructions directly from Python for maximum performance in specialized cases.", l: "https://github.com/Maratyszcza/PeachPy" },
-    { n: "pypy", c: "Utilities", d: "An alternative Python interpreter that runs code much faster than standard Python through clever optimization techniques.", l: "https://foss.heptapod.net/pypy/pypy" },
-    { n: "pyston", c: "Utilities", d: "A faster version of Python that uses just-in-time compilation to speed up your programs automatically.", l: "https://github.com/pyston/pyston/" },
-    { n: "bpython", c: "Utilities", d: "A friendlier interactive Python shell with color-coding, auto-completion, and better navigation than the standard interpreter.", l: "https://github.com/bpython/bpython" },
-    { n: "Jupyter Notebook (IPython)", c: "Utilities", d: "Create interactive notebooks that mix code, documentation, and visualizations in your browser, perfect for learning, exploring data, and sharing results.", l: "https://jupyter.org/" },
-    { n: "ptpython", c: "Utilities", d: "An advanced Python shell with syntax highlighting, better auto-completion, and a cleaner interface for interactive coding.", l: "https://github.com/jonathanslenders/ptpython" },
-    { n: "Babel", c: "Utilities", d: "Support multiple languages and regions in your application by handling translations, date formatting, and localization automatically.", l: "http://babel.pocoo.org/en/latest/" },
-    { n: "PyICU", c: "Utilities", d: "Handle international text properly by supporting multiple languages, character sets, and cultural conventions in your Python programs.", l: "https://github.com/ovalhub/pyicu" },
-    { n: "Airflow", c: "Job Scheduler", d: "Design, schedule, and monitor complex workflows and data pipelines visually, perfect for automating recurring data tasks.", l: "https://airflow.apache.org/" },
-    { n: "APScheduler", c: "Job Scheduler", d: "Schedule Python functions to run at specific times or intervals, like a task scheduler built right into your code. [JOURNALISM]", l: "http://apscheduler.readthedocs.io/en/latest/" },
-    { n: "django-schedule", c: "Job Scheduler", d: "Add calendar scheduling features to Django websites, letting users book appointments or manage events.", l: "https://github.com/thauber/django-schedule" },
-    { n: "doit", c: "Job Scheduler", d: "Automate and manage tasks in your projects, similar to build tools like Make but easier to use with Python.", l: "http://pydoit.org/" },
-    { n: "gunnery", c: "Job Scheduler", d: "Run tasks across multiple machines with a web interface to manage and monitor them from one place.", l: "https://github.com/gunnery/gunnery" },
-    { n: "Joblib", c: "Job Scheduler", d: "Speed up your code by running parts of it in parallel on multiple cores, great for data processing and machine learning.", l: "https://joblib.readthedocs.io/" },
-    { n: "Plan", c: "Job Scheduler", d: "Write scheduled tasks in Python instead of cryptic crontab syntax, making scheduling jobs on servers much easier.", l: "https://github.com/fengsp/plan" },
-    { n: "Prefect", c: "Job Scheduler", d: "Build reliable data pipelines that automatically handle failures and send alerts, making data processing production-ready.", l: "https://github.com/PrefectHQ/prefect" },
-    { n: "schedule", c: "Job Scheduler", d: "Schedule Python functions to run at specific times using simple, readable code that anyone can understand. [JOURNALISM]", l: "https://github.com/dbader/schedule" },
-    { n: "Spiff", c: "Job Scheduler", d: "Create complex workflows and state machines that manage how tasks flow through your application.", l: "https://github.com/knipknap/SpiffWorkflow" },
-    { n: "TaskFlow", c: "Job Scheduler", d: "Execute tasks reliably with automatic error handling and recovery, ensuring your processes complete successfully even when something goes wrong.", l: "https://docs.openstack.org/developer/taskflow/" },
-    { n: "logbook", c: "Logging", d: "Record what your program is doing in an easier and more flexible way than Python's standard logging system.", l: "http://logbook.readthedocs.io/en/stable/" },
-    { n: "logging", c: "Logging", d: "Track what your program is doing by recording messages at different importance levels, essential for understanding how your code behaves.", l: "https://docs.python.org/3/library/logging.html" },
-    { n: "loguru", c: "Logging", d: "Make logging in Python enjoyable with colorful output, easy configuration, and automatic file rotation for a better development experience.", l: "https://github.com/Delgan/loguru" },
-    { n: "sentry-python", c: "Logging", d: "Automatically catch and report errors that happen in production, letting your team know immediately when something breaks.", l: "https://github.com/getsentry/sentry-python" },
-    { n: "structlog", c: "Logging", d: "Makes it easy to keep organized records of what your Python program is doing by logging information in a structured, readable format.", l: "https://www.structlog.org/en/stable/" },
-    { n: "gym", c: "Machine Learning", d: "A practice environment where you can teach a computer program to learn and make decisions, like training a bot to play games.", l: "https://github.com/openai/gym" },
-    { n: "H2O", c: "Machine Learning", d: "A machine learning platform that helps you build predictive models quickly, even with very large datasets.", l: "https://github.com/h2oai/h2o-3" },
-    { n: "Metrics", c: "Machine Learning", d: "Provides tools to measure how accurate your machine learning models are so you know if they're working well.", l: "https://github.com/benhamner/Metrics" },
-    { n: "NuPIC", c: "Machine Learning", d: "A framework for building intelligent programs that can learn patterns from data and make predictions over time.", l: "https://github.com/numenta/nupic" },
-    { n: "scikit-learn", c: "Machine Learning", d: "The most beginner-friendly Python tool for machine learning, with simple functions to train models and make predictions.", l: "http://scikit-learn.org/" },
-    { n: "Spark ML", c: "Machine Learning", d: "Apache Spark's machine learning library that lets you build and train models on massive amounts of data across multiple computers.", l: "http://spark.apache.org/docs/latest/ml-guide.html" },
-    { n: "vowpal\_porpoise", c: "Machine Learning", d: "A lightweight Python wrapper for [Vowpal Wabbit](https://github.com/JohnLangford/vowpal_wabbit/).", l: "https://github.com/josephreisinger/vowpal_porpoise" },
-    { n: "xgboost", c: "Machine Learning", d: "A powerful and fast machine learning algorithm that works especially well for competitions and real-world prediction problems.", l: "https://github.com/dmlc/xgboost" },
-    { n: "MindsDB", c: "Machine Learning", d: "An AI layer for databases that makes it easy to add machine learning predictions directly to your data without complex setup.", l: "https://github.com/mindsdb/mindsdb" },
-    { n: "Python(x,y)", c: "Utilities", d: "A ready-to-use Python package that comes pre-installed with popular scientific tools for data analysis and visualization.", l: "http://python-xy.github.io/" },
-    { n: "pythonlibs", c: "Utilities", d: "A collection of pre-built Python libraries for Windows that are hard to install normally, ready to download and use.", l: "http://www.lfd.uci.edu/~gohlke/pythonlibs/" },
-    { n: "PythonNet", c: "Utilities", d: "Lets you use Python code alongside .NET libraries and programs on Windows, bridging two different programming worlds.", l: "https://github.com/pythonnet/pythonnet" },
-    { n: "PyWin32", c: "Utilities", d: "Gives Python access to Windows-specific features like the file system, registry, and other system tools.", l: "https://github.com/mhammond/pywin32" },
-    { n: "WinPython", c: "Utilities", d: "A portable version of Python designed for Windows that includes scientific tools and doesn't require installation.", l: "https://winpython.github.io/" },
-    { n: "blinker", c: "Utilities", d: "A simple messaging system that lets different parts of your Python program send signals to each other when events happen.", l: "https://github.com/jek/blinker" },
-    { n: "boltons", c: "Utilities", d: "A collection of handy utility functions that make common Python tasks easier and faster to code.", l: "https://github.com/mahmoud/boltons" },
-    { n: "itsdangerous", c: "Utilities", d: "Helps you safely pass data through untrusted environments (like user browsers) by digitally signing it so you know it hasn't been changed.", l: "https://github.com/pallets/itsdangerous" },
-    { n: "magenta", c: "Utilities", d: "A Google tool that uses AI to automatically generate original music and art from simple ideas or patterns.", l: "https://github.com/magenta/magenta" },
-    { n: "pluginbase", c: "Utilities", d: "Makes it easy to build Python programs that can be extended with plugins, letting users add new features without modifying the main code.", l: "https://github.com/mitsuhiko/pluginbase" },
-    { n: "tryton", c: "Utilities", d: "A complete business software framework for building accounting, inventory, and sales applications quickly.", l: "http://www.tryton.org/" },
-    { n: "mininet", c: "Utilities", d: "A tool that creates a pretend computer network on your machine so you can test network software without real hardware.", l: "https://github.com/mininet/mininet" },
-    { n: "napalm", c: "Utilities", d: "Simplifies managing network equipment from different vendors by giving you a single, simple way to control them all.", l: "https://github.com/napalm-automation/napalm" },
-    { n: "pox", c: "Utilities", d: "A Python framework for writing software-defined network controllers that manage how network traffic flows.", l: "https://github.com/noxrepo/pox" },
-    { n: "django-activity-stream", c: "Utilities", d: "Automatically tracks and records user actions on your website (likes, comments, follows) so you can show activity feeds.", l: "https://github.com/justquick/django-activity-stream" },
-    { n: "Stream Framework", c: "Utilities", d: "Builds fast, scalable news feeds and notifications for websites using fast databases in the background.", l: "https://github.com/tschellenbach/Stream-Framework" },
-    { n: "pip", c: "Utilities", d: "The standard tool for installing Python libraries from the internet so you can use them in your projects.", l: "https://pip.pypa.io/en/stable/" },
-    { n: "conda", c: "Utilities", d: "A package manager that installs not just Python libraries but also complex scientific tools with all their dependencies.", l: "https://github.com/conda/conda/" },
-    { n: "poetry", c: "Utilities", d: "A modern tool that handles installing libraries and managing project dependencies while keeping everything organized and reproducible.", l: "https://github.com/sdispater/poetry" },
-    { n: "uv", c: "Utilities", d: "An extremely fast, modern package manager built in Rust that installs Python libraries and manages projects lightning quick.", l: "https://github.com/astral-sh/uv" },
-    { n: "bandersnatch", c: "Utilities", d: "A tool for creating a local copy of the entire Python library repository so you can access packages without internet.", l: "https://github.com/pypa/bandersnatch/" },
-    { n: "devpi", c: "Utilities", d: "A private Python package server that lets you store, test, and release your own libraries internally before sharing them.", l: "https://github.com/devpi/devpi" },
-    { n: "localshop", c: "Utilities", d: "A simple local Python package server that caches libraries and lets you host your own private packages.", l: "https://github.com/jazzband/localshop" },
-    { n: "warehouse", c: "Utilities", d: "The modern software behind the official Python Package Repository (PyPI) where all Python libraries are hosted.", l: "https://github.com/pypa/warehouse" },
-    { n: "fsociety", c: "Utilities", d: "A framework with tools for security testing and ethical hacking to find vulnerabilities in systems.", l: "https://github.com/Manisso/fsociety" },
-    { n: "setoolkit", c: "Utilities", d: "A toolkit for security professionals to test how vulnerable organizations are to social engineering attacks.", l: "https://github.com/trustedsec/social-engineer-toolkit" },
-    { n: "sqlmap", c: "Utilities", d: "An automated security testing tool that checks if websites are vulnerable to SQL injection attacks.", l: "https://github.com/sqlmapproject/sqlmap" },
-    { n: "django-guardian", c: "Utilities", d: "Adds fine-grained permission control to Django websites so you can control who can access specific database records.", l: "https://github.com/django-guardian/django-guardian" },
-    { n: "django-rules", c: "Utilities", d: "A lightweight permission system for Django that lets you define access rules without storing extra database records.", l: "https://github.com/dfunckt/django-rules" },
-    { n: "delegator.py", c: "Processes", d: "Makes running system commands from Python simpler and cleaner, letting your code control other programs easily.", l: "https://github.com/amitt001/delegator.py" },
-    { n: "sarge", c: "Processes", d: "A simpler, more powerful way to run other programs from your Python code with better control over input and output.", l: "https://sarge.readthedocs.io/en/latest/" },
-    { n: "sh", c: "Processes", d: "Lets you call system commands in Python as if they were regular Python functions, making scripts easier to write.", l: "https://github.com/amoffat/sh" },
-    { n: "annoy", c: "Utilities", d: "A fast, memory-efficient tool for finding similar items in your data, useful for search and recommendation systems.", l: "https://github.com/spotify/annoy" },
-    { n: "fastFM", c: "Utilities", d: "A fast library for building recommendation systems that predict user preferences based on patterns in data.", l: "https://github.com/ibayer/fastFM" },
-    { n: "implicit", c: "Utilities", d: "A high-speed recommendation engine that learns from user behavior (clicks, purchases) to suggest relevant products.", l: "https://github.com/benfred/implicit" },
-    { n: "libffm", c: "Utilities", d: "A specialized library for building predictive models that consider relationships between different features in your data.", l: "https://github.com/guestwalk/libffm" },
-    { n: "lightfm", c: "Utilities", d: "An easy-to-use Python library for building recommendation systems that suggest items users might like.", l: "https://github.com/lyst/lightfm" },
-    { n: "spotlight", c: "Utilities", d: "Uses deep learning and PyTorch to build advanced recommendation systems that predict what items users will prefer.", l: "https://github.com/maciejkula/spotlight" },
-    { n: "Surprise", c: "Utilities", d: "A beginner-friendly toolkit for building and testing recommendation systems that suggest movies, products, or content.", l: "https://github.com/NicolasHug/Surprise" },
-    { n: "tensorrec", c: "Utilities", d: "A framework built on TensorFlow for creating recommendation systems that predict what users will enjoy.", l: "https://github.com/jfkirk/tensorrec" },
-    { n: "Bicycle Repair Man", c: "Utilities", d: "A refactoring tool that helps you automatically rename, reorganize, and improve the structure of your Python code without breaking it.", l: "http://bicyclerepair.sourceforge.net/" },
-    { n: "Bowler", c: "Utilities", d: "A modern tool that safely refactors your Python code by automatically finding and fixing code patterns across your entire project.", l: "https://pybowler.io/" },
-    { n: "Rope", c: "Utilities", d: "A Python refactoring library that helps you rename variables, extract functions, and reorganize code programmatically.", l: "https://github.com/python-rope/rope" },
-    { n: "PythonRobotics", c: "Utilities", d: "A collection of robot movement and navigation algorithms with visual demonstrations, perfect for learning how robots plan paths and avoid obstacles.", l: "https://github.com/AtsushiSakai/PythonRobotics" },
-    { n: "rospy", c: "Utilities", d: "A library for writing Python programs that control and communicate with robots using the Robot Operating System (ROS).", l: "http://wiki.ros.org/rospy" },
-    { n: "zeroRPC", c: "Utilities", d: "A tool for calling Python functions across different computers or programs over the network with minimal setup.", l: "https://github.com/0rpc/zerorpc-python" },
-    { n: "astropy", c: "Science", d: "A toolbox for astronomers and space scientists to analyze data from telescopes and study stars and galaxies.", l: "http://www.astropy.org/" },
-    { n: "bcbio-nextgen", c: "Science", d: "A automated pipeline for analyzing DNA sequencing data from genetic research projects quickly and reliably.", l: "https://github.com/chapmanb/bcbio-nextgen" },
-    { n: "bccb", c: "Science", d: "A collection of useful tools for biological research, including code for analyzing genetic data and protein sequences.", l: "https://github.com/chapmanb/bcbb" },
-    { n: "Biopython", c: "Science", d: "A toolkit for biologists to work with DNA sequences, proteins, and other biological data in Python.", l: "http://biopython.org/wiki/Main_Page" },
-    { n: "cclib", c: "Science", d: "A tool that reads and interprets data from chemistry software, making it easy to analyze molecular simulation results.", l: "http://cclib.github.io/" },
-    { n: "Colour", c: "Science", d: "A library for working with colors and light in scientific applications, including color conversion and visual rendering calculations.", l: "http://colour-science.org/" },
-    { n: "Karate Club", c: "Science", d: "A machine learning toolkit for finding patterns and communities in network data, like social media connections or relationships.", l: "https://github.com/benedekrozemberczki/karateclub" },
-    { n: "NetworkX", c: "Science", d: "A powerful library for creating, analyzing, and visualizing networks like social networks, computer networks, or biological systems.", l: "https://networkx.github.io/" },
-    { n: "NIPY", c: "Science", d: "A collection of tools for analyzing brain imaging data from MRI and fMRI scans used in neuroscience research.", l: "http://nipy.org/" },
-    { n: "NumPy", c: "Science", d: "The foundation of scientific computing in Python, providing fast arrays and math operations that make data analysis practical.", l: "http://www.numpy.org/" },
-    { n: "ObsPy", c: "Science", d: "A toolbox for seismologists to download, process, and analyze earthquake and seismic wave data from monitoring networks.", l: "https://github.com/obspy/obspy/wiki/" },
-    { n: "Open Babel", c: "Science", d: "A chemistry tool that converts between different molecular data formats, making it easy to work with chemical structures.", l: "https://open-babel.readthedocs.io/" },
-    { n: "PyDy", c: "Science", d: "A library for modeling and simulating systems that move and change over time, like robots, vehicles, or mechanical structures.", l: "http://www.pydy.org/" },
-    { n: "PyMC", c: "Science", d: "A tool for solving uncertainty problems by using statistical sampling to explore possible solutions and their probabilities.", l: "https://github.com/pymc-devs/pymc3" },
-    { n: "QuTiP", c: "Science", d: "A toolkit for quantum mechanics calculations, used to simulate and analyze quantum systems and quantum computing.", l: "http://qutip.org/" },
-    { n: "RDKit", c: "Science", d: "A chemistry library that helps you work with molecular structures, predict chemical properties, and apply machine learning to drug discovery.", l: "http://www.rdkit.org/" },
-    { n: "SciPy", c: "Science", d: "A comprehensive science toolkit that extends NumPy with algorithms for optimization, statistics, signal processing, and more.", l: "https://www.scipy.org/" },
-    { n: "SimPy", c: "Science", d: "A simulation library for modeling real-world processes like traffic flow, queues, or manufacturing systems to predict outcomes.", l: "https://gitlab.com/team-simpy/simpy" },
-    { n: "statsmodels", c: "Science", d: "A library for building and testing statistical models and analyzing economic and financial data.", l: "https://github.com/statsmodels/statsmodels" },
-    { n: "SymPy", c: "Science", d: "A tool for symbolic mathematics that can solve equations, simplify expressions, and perform calculus like a math textbook.", l: "https://github.com/sympy/sympy" },
-    { n: "Zipline", c: "Science", d: "A framework for testing and backtesting stock trading strategies using historical market data.", l: "https://github.com/quantopian/zipline" },
-    { n: "django-haystack", c: "Utilities", d: "A search plugin for Django websites that lets you add powerful search functionality to your web applications.", l: "https://github.com/django-haystack/django-haystack" },
-    { n: "elasticsearch-dsl-py", c: "Utilities", d: "An easy-to-use tool for building search applications that can handle billions of documents and find results in milliseconds.", l: "https://github.com/elastic/elasticsearch-dsl-py" },
-    { n: "elasticsearch-py", c: "Utilities", d: "The official low-level client for connecting Python code to Elasticsearch search engines for customized search behavior.", l: "https://www.elastic.co/guide/en/elasticsearch/client/python-api/current/index.html" },
-    { n: "pysolr", c: "Utilities", d: "A simple Python connector for Apache Solr that lets you index and search large amounts of text data.", l: "https://github.com/django-haystack/pysolr" },
-    { n: "whoosh", c: "Utilities", d: "A pure Python search engine library that you can embed directly in your Python programs without external dependencies.", l: "http://whoosh.readthedocs.io/en/latest/" },
-    { n: "marshmallow", c: "Utilities", d: "A tool for converting between complex Python objects and simple formats like JSON, useful for APIs and data validation.", l: "https://github.com/marshmallow-code/marshmallow" },
-    { n: "pysimdjson", c: "Utilities", d: "An extremely fast JSON parser that uses modern computer processor tricks to read JSON files at lightning speeds.", l: "https://github.com/TkTech/pysimdjson" },
-    { n: "python-rapidjson", c: "Utilities", d: "A high-performance JSON reader and writer that's much faster than Python's built-in JSON module.", l: "https://github.com/python-rapidjson/python-rapidjson" },
-    { n: "toonify", c: "Utilities", d: "A compact data format that uses fewer tokens than JSON, perfect for reducing costs when working with AI language models.", l: "https://github.com/ScrapeGraphAI/toonify" },
-    { n: "ultrajson", c: "Utilities", d: "An ultra-fast JSON encoder and decoder written in C that dramatically speeds up processing large JSON data.", l: "https://github.com/esnme/ultrajson" },
-    { n: "python-lambda", c: "Utilities", d: "A toolkit that makes it easy to write and deploy Python code to AWS Lambda for running serverless functions. [JOURNALISM]", l: "https://github.com/nficano/python-lambda" },
-    { n: "Zappa", c: "Utilities", d: "A deployment tool that lets you host Django and other Python web applications on AWS Lambda without managing servers. [JOURNALISM]", l: "https://github.com/zappa/Zappa" },
-    { n: "xonsh", c: "Utilities", d: "A shell that combines Python programming language with Unix commands, giving you the power of both in one place.", l: "https://github.com/xonsh/xonsh/" },
-    { n: "lektor", c: "Utilities", d: "A simple content management system and blog platform that generates static websites from easy-to-edit content files.", l: "https://github.com/lektor/lektor" },
-    { n: "mkdocs", c: "Utilities", d: "A documentation generator that turns Markdown files into beautiful, professional-looking websites automatically. [JOURNALISM]", l: "https://github.com/mkdocs/mkdocs/" },
-    { n: "makesite", c: "Utilities", d: "A tiny, straightforward static site generator that creates websites from files without complex configuration or magic.", l: "https://github.com/sunainapai/makesite" },
-    { n: "nikola", c: "Utilities", d: "A flexible static website and blog generator that supports multiple content formats and powerful customization.", l: "https://github.com/getnikola/nikola" },
-    { n: "pelican", c: "Utilities", d: "A static blog generator that converts Markdown and other text formats into a complete, ready-to-deploy website. [JOURNALISM]", l: "https://github.com/getpelican/pelican" },
-    { n: "django-taggit", c: "Utilities", d: "A simple plugin for Django that adds tagging capability to your website, letting you organize content with labels. [JOURNALISM]", l: "https://github.com/jazzband/django-taggit" },
-    { n: "celery", c: "Task Queues", d: "A task scheduler that lets you run Python code in the background and across multiple computers to handle long-running jobs.", l: "https://docs.celeryproject.org/en/stable/" },
-    { n: "dramatiq", c: "Task Queues", d: "A lightweight task queue that processes background jobs reliably, simpler to set up than more complex alternatives.", l: "https://github.com/Bogdanp/dramatiq" },
-    { n: "huey", c: "Task Queues", d: "A small task queue system for running background jobs in Python with minimal configuration and overhead.", l: "https://github.com/coleifer/huey" },
-    { n: "mrq", c: "Task Queues", d: "A distributed task queue that uses Redis to coordinate Python workers across multiple computers for processing jobs at scale.", l: "https://github.com/pricingassistant/mrq" },
-    { n: "rq", c: "Task Queues", d: "A simple tool for managing background jobs in Python, letting you run tasks without blocking your main application.", l: "https://github.com/rq/rq" },
-    { n: "Genshi", c: "Utilities", d: "A templating tool that generates web pages by combining your data with HTML templates, keeping code and design separate.", l: "https://genshi.edgewall.org/" },
-    { n: "Jinja2", c: "Utilities", d: "A powerful and easy-to-use templating engine for creating dynamic web pages by inserting data into HTML templates.", l: "https://github.com/pallets/jinja" },
-    { n: "Mako", c: "Utilities", d: "A lightweight, fast templating library for Python that quickly converts your data into formatted text or web pages.", l: "http://www.makotemplates.org/" },
-    { n: "apache-libcloud", c: "Utilities", d: "One unified library to interact with different cloud providers like Amazon, Google Cloud, and Microsoft Azure from a single codebase.", l: "https://libcloud.apache.org/" },
-    { n: "boto3", c: "Utilities", d: "The official Python library for interacting with Amazon Web Services, letting you manage AWS resources programmatically.", l: "https://github.com/boto/boto3" },
-    { n: "django-wordpress", c: "Utilities", d: "Bridges Django and WordPress, letting you use WordPress content and functionality within your Django web application.", l: "https://github.com/istrategylabs/django-wordpress" },
-    { n: "facebook-sdk", c: "Utilities", d: "An official tool that lets your Python app interact with Facebook's features, like posting, reading user data, or managing ads.", l: "https://github.com/mobolic/facebook-sdk" },
-    { n: "google-api-python-client", c: "Utilities", d: "Access Google's services like Gmail, Drive, and YouTube directly from Python code without using a web browser.", l: "https://github.com/google/google-api-python-client" },
-    { n: "gspread", c: "Utilities", d: "Read and write to Google Sheets directly from Python, treating spreadsheets like a simple database. [JOURNALISM]", l: "https://github.com/burnash/gspread" },
-    { n: "twython", c: "Utilities", d: "A Python library that lets your app interact with Twitter's API to read tweets, post content, and manage followers.", l: "https://github.com/ryanmcgrath/twython" },
-    { n: "furl", c: "Utilities", d: "Makes working with URLs simple by providing an easy way to parse, build, and modify web addresses in Python.", l: "https://github.com/gruns/furl" },
-    { n: "purl", c: "Utilities", d: "A clean, simple tool for breaking down and working with URLs in your Python code without messy string manipulation.", l: "https://github.com/codeinthehole/purl" },
-    { n: "pyshorteners", c: "Utilities", d: "Converts long URLs into short, shareable links using services like Bitly or TinyURL from your Python code.", l: "https://github.com/ellisonleao/pyshorteners" },
-    { n: "webargs", c: "Utilities", d: "Automatically extracts and validates data from web requests in your Flask or Django app, saving you from manual parsing.", l: "https://github.com/marshmallow-code/webargs" },
-    { n: "moviepy", c: "Video", d: "Create, edit, and combine videos and animated GIFs using Python code instead of video editing software. [JOURNALISM]", l: "https://zulko.github.io/moviepy/" },
-    { n: "scikit-video", c: "Video", d: "A video processing library that works with Python's scientific computing tools for analyzing and manipulating video files.", l: "https://github.com/aizvorski/scikit-video" },
-    { n: "vidgear", c: "Video", d: "A powerful, fast video processing framework for Python that handles multiple videos simultaneously without slowing down. [JOURNALISM]", l: "https://github.com/abhiTronix/vidgear" },
-    { n: "django-compressor", c: "Utilities", d: "Automatically combines and compresses your CSS and JavaScript files on your Django website to make it load faster.", l: "https://github.com/django-compressor/django-compressor" },
-    { n: "django-pipeline", c: "Utilities", d: "Manages and optimizes static files (images, CSS, JavaScript) in your Django app for better website performance.", l: "https://github.com/jazzband/django-pipeline" },
-    { n: "django-storages", c: "Utilities", d: "Extends Django to store files on cloud services like S3 or Google Cloud Storage instead of your server's disk.", l: "https://github.com/jschneier/django-storages" },
-    { n: "fanstatic", c: "Utilities", d: "Bundles your JavaScript and CSS files as reusable Python packages with automatic caching and delivery.", l: "http://www.fanstatic.org/en/latest/" },
-    { n: "fileconveyor", c: "Utilities", d: "Automatically watches your files and syncs them to content delivery networks or cloud storage like S3 when they change.", l: "http://wimleers.com/fileconveyor" },
-    { n: "flask-assets", c: "Utilities", d: "Optimizes and combines CSS and JavaScript files in Flask apps to improve website loading speed.", l: "https://github.com/miracle2k/flask-assets" },
-    { n: "webassets", c: "Utilities", d: "Bundles and optimizes static website files while managing unique URLs to prevent browsers from using old cached versions.", l: "https://github.com/miracle2k/webassets" },
-    { n: "html2text", c: "Web Content Extracting", d: "Converts HTML web pages into readable Markdown format, useful for extracting content from websites.", l: "https://github.com/Alir3z4/html2text" },
-    { n: "lassie", c: "Web Content Extracting", d: "Pulls metadata and content from web pages automatically, extracting titles, images, and descriptions.", l: "https://github.com/michaelhelmick/lassie" },
-    { n: "micawber", c: "Web Content Extracting", d: "Extracts embedded media and rich content from URLs, like previews from YouTube videos or Twitter posts.", l: "https://github.com/coleifer/micawber" },
-    { n: "newspaper", c: "Web Content Extracting", d: "Extracts news articles and content from websites, cleaning up the text and organizing it into readable formats. [JOURNALISM]", l: "https://github.com/codelucas/newspaper" },
-    { n: "python-readability", c: "Web Content Extracting", d: "Removes clutter from web pages and extracts the main article content, similar to browser reader modes. [JOURNALISM]", l: "https://github.com/buriy/python-readability" },
-    { n: "requests-html", c: "Web Content Extracting", d: "A beginner-friendly library for downloading and parsing HTML from websites with clean, readable code.", l: "https://github.com/psf/requests-html" },
-    { n: "sumy", c: "Web Content Extracting", d: "Automatically summarizes long documents or web pages into shorter versions that capture the main ideas. [JOURNALISM]", l: "https://github.com/miso-belica/sumy" },
-    { n: "textract", c: "Web Content Extracting", d: "Pulls text out of any document type like Word files, PDFs, and PowerPoint presentations in one simple command. [JOURNALISM]", l: "https://github.com/deanmalmgren/textract" },
-    { n: "toapi", c: "Web Content Extracting", d: "Turns any website into an API, letting you access website content as structured data without official API support.", l: "https://github.com/gaojiuli/toapi" },
-    { n: "feedparser", c: "Web Crawling", d: "Reads blog feeds and news feeds from websites, parsing RSS and Atom content into usable Python data. [JOURNALISM]", l: "https://github.com/kurtmckee/feedparser" },
-    { n: "grab", c: "Web Crawling", d: "A complete framework for scraping websites and collecting data at scale with built-in tools for handling complex sites.", l: "https://github.com/lorien/grab" },
-    { n: "mechanicalsoup", c: "Web Crawling", d: "Automates interactions with websites like filling forms and clicking buttons, useful for testing or data collection.", l: "https://github.com/MechanicalSoup/MechanicalSoup" },
-    { n: "scrapy", c: "Web Crawling", d: "A professional framework for building web scrapers that can efficiently collect data from large websites. [JOURNALISM]", l: "https://github.com/scrapy/scrapy" },
-    { n: "autobahn-python", c: "WebSocket", d: "Enables real-time two-way communication between web browsers and Python servers using WebSocket connections.", l: "https://github.com/crossbario/autobahn-python" },
-    { n: "channels", c: "WebSocket", d: "Adds real-time features like live notifications and chat to Django apps by supporting WebSocket connections.", l: "https://github.com/django/channels" },
-    { n: "websockets", c: "WebSocket", d: "A simple, reliable library for creating real-time connections between Python apps and web browsers or other clients.", l: "https://github.com/aaugustin/websockets" },
-    { n: "gunicorn", c: "Web Frameworks", d: "A web server that runs your Python web app and handles multiple requests from users at the same time.", l: "https://github.com/benoitc/gunicorn" },
-    { n: "uwsgi", c: "Web Frameworks", d: "A powerful, high-performance web server for running Python web applications in production environments.", l: "https://uwsgi-docs.readthedocs.io/en/latest/" },
-    { n: "waitress", c: "Web Frameworks", d: "A simple web server for running Python web apps, especially popular with the Pyramid framework.", l: "https://github.com/Pylons/waitress" },
-    { n: "werkzeug", c: "Web Frameworks", d: "A utility library that powers Flask and provides tools for handling web requests, cookies, and file uploads.", l: "https://github.com/pallets/werkzeug" }
-];
-
-// Domain mapping for categorization
-export const domainMap = {
-    "Web Frameworks": "Web", "HTTP Clients": "Web", "Web Content Extracting": "Web",
-    "Web Crawling": "Web", "WebSocket": "Web", "WSGI Servers": "Web",
-    "RESTful API": "Web", "ASGI Servers": "Web",
-
-    "Data Analysis": "Data Science", "Science": "Data Science",
-    "Data Visualization": "Data Science", "Machine Learning": "Data Science",
-    "Deep Learning": "Data Science", "Natural Language Processing": "Data Science",
-    "Computer Vision": "Data Science",
-
-    "Data Engineering": "Data Engineering", "ORM": "Data Engineering",
-    "Database": "Data Engineering", "Database Drivers": "Data Engineering",
-    "Distributed Computing": "Data Engineering", "Task Queues": "Data Engineering",
+// Parallel columns: n name, d description, c category and o URL origin
+// (indexes into strings), l the rest of the URL. See tools/js_literals.py.
+export const columns = {
+n: [
+"ajenti",
+"django-grappelli",
+"flask-admin",
+"flower",
+"jet-bridge",
+"wooey",
+"streamlit",
+"daphne",
+"uvicorn",
+"hypercorn",
+"asyncio",
+"concurrent.futures",
+"multiprocessing",
+"trio",
+"twisted",
+"uvloop",
+"eventlet",
+"gevent",
+"bitbake",
+"buildout",
+"platformio",
+"pybuilder",
+"scons",
+"attrs",
+"bidict",
+"box",
+"dataclasses",
+"dotteddict",
+"feincms",
+"indico",
+"wagtail",
+"beaker",
+"django-cache-machine",
+"django-cacheops",
+"dogpile.cache",
+"hermescache",
+"pylibmc",
+"python-diskcache",
+"errbot",
+"easyocr",
+"kornia",
+"opencv",
+"pytesseract",
+"tesserocr",
+"configparser",
+"configobj",
+"hydra",
+"python-decouple",
+"cryptography",
+"paramiko",
+"pynacl",
+"pandas",
+"aws-sdk-pandas",
+"datasette",
+"desbordante",
+"optimus",
+"cerberus",
+"colander",
+"jsonschema",
+"schema",
+"schematics",
+"voluptuous",
+"pydantic",
+"altair",
+"bokeh",
+"bqplot",
+"cartopy",
+"diagrams",
+"matplotlib",
+"plotnine",
+"pygal",
+"pygraphviz",
+"pyqtgraph",
+"seaborn",
+"vispy",
+"pickleDB",
+"tinydb",
+"zodb",
+"arrow",
+"dateutil",
+"pendulum",
+"pytz",
+"keras",
+"pytorch",
+"pytorch-lightning",
+"stable-baselines3",
+"tensorflow",
+"theano",
+"py2app",
+"py2exe",
+"pyarmor",
+"pyinstaller",
+"shiv",
+"sphinx",
+"pdoc",
+"akshare",
+"s3cmd",
+"youtube-dl",
+"pyenv",
+"virtualenv",
+"mimetypes",
+"pathlib",
+"path.py",
+"python-magic",
+"watchdog",
+"coconut",
+"funcy",
+"more-itertools",
+"returns",
+"cytoolz",
+"toolz",
+"curses",
+"Eel",
+"enaml",
+"Flet",
+"Flexx",
+"Gooey",
+"kivy",
+"pyglet",
+"PyGObject",
+"PyQt",
+"PySimpleGUI",
+"pywebview",
+"Tkinter",
+"Toga",
+"urwid",
+"wxPython",
+"DearPyGui",
+"graphene",
+"Arcade",
+"Cocos2d",
+"Harfang3D",
+"Panda3D",
+"Pygame",
+"PyOgre",
+"PyOpenGL",
+"PySDL2",
+"RenPy",
+"django-countries",
+"geodjango",
+"geojson",
+"geopy",
+"beautifulsoup",
+"bleach",
+"cssutils",
+"html5lib",
+"lxml",
+"markupsafe",
+"pyquery",
+"untangle",
+"WeasyPrint",
+"xmldataset",
+"xmltodict",
+"httpx",
+"requests",
+"treq",
+"urllib3",
+"keyboard",
+"mouse",
+"pynput",
+"scapy",
+"pillow",
+"python-barcode",
+"pymatting",
+"python-qrcode",
+"pywal",
+"pyvips",
+"quads",
+"scikit-image",
+"thumbor",
+"wand",
+"cpython",
+"cython",
+"clpython",
+"ironpython",
+"micropython",
+"numba",
+"peachpy",
+"pypy",
+"pyston",
+"bpython",
+"Jupyter Notebook (IPython)",
+"ptpython",
+"Babel",
+"PyICU",
+"Airflow",
+"APScheduler",
+"django-schedule",
+"doit",
+"gunnery",
+"Joblib",
+"Plan",
+"Prefect",
+"schedule",
+"Spiff",
+"TaskFlow",
+"logbook",
+"logging",
+"loguru",
+"sentry-python",
+"structlog",
+"gym",
+"H2O",
+"Metrics",
+"NuPIC",
+"scikit-learn",
+"Spark ML",
+"vowpal_porpoise",
+"xgboost",
+"MindsDB",
+"Python(x,y)",
+"pythonlibs",
+"PythonNet",
+"PyWin32",
+"WinPython",
+"blinker",
+"boltons",
+"itsdangerous",
+"magenta",
+"pluginbase",
+"tryton",
+"mininet",
+"napalm",
+"pox",
+"django-activity-stream",
+"Stream Framework",
+"pip",
+"conda",
+"poetry",
+"uv",
+"bandersnatch",
+"devpi",
+"localshop",
+"warehouse",
+"fsociety",
+"setoolkit",
+"sqlmap",
+"django-guardian",
+"django-rules",
+"delegator.py",
+"sarge",
+"sh",
+"annoy",
+"fastFM",
+"implicit",
+"libffm",
+"lightfm",
+"spotlight",
+"Surprise",
+"tensorrec",
+"Bicycle Repair Man",
+"Bowler",
+"Rope",
+"PythonRobotics",
+"rospy",
+"zeroRPC",
+"astropy",
+"bcbio-nextgen",
+"bccb",
+"Biopython",
+"cclib",
+"Colour",
+"Karate Club",
+"NetworkX",
+"NIPY",
+"NumPy",
+"ObsPy",
+"Open Babel",
+"PyDy",
+"PyMC",
+"QuTiP",
+"RDKit",
+"SciPy",
+"SimPy",
+"statsmodels",
+"SymPy",
+"Zipline",
+"django-haystack",
+"elasticsearch-dsl-py",
+"elasticsearch-py",
+"pysolr",
+"whoosh",
+"marshmallow",
+"pysimdjson",
+"python-rapidjson",
+"toonify",
+"ultrajson",
+"python-lambda",
+"Zappa",
+"xonsh",
+"lektor",
+"mkdocs",
+"makesite",
+"nikola",
+"pelican",
+"django-taggit",
+"celery",
+"dramatiq",
+"huey",
+"mrq",
+"rq",
+"Genshi",
+"Jinja2",
+"Mako",
+"apache-libcloud",
+"boto3",
+"django-wordpress",
+"facebook-sdk",
+"google-api-python-client",
+"gspread",
+"twython",
+"furl",
+"purl",
+"pyshorteners",
+"webargs",
+"moviepy",
+"scikit-video",
+"vidgear",
+"django-compressor",
+"django-pipeline",
+"django-storages",
+"fanstatic",
+"fileconveyor",
+"flask-assets",
+"webassets",
+"html2text",
+"lassie",
+"micawber",
+"newspaper",
+"python-readability",
+"requests-html",
+"sumy",
+"textract",
+"toapi",
+"feedparser",
+"grab",
+"mechanicalsoup",
+"scrapy",
+"autobahn-python",
+"channels",
+"websockets",
+"gunicorn",
+"uwsgi",
+"waitress",
+"werkzeug",
 
-    "Job Scheduler": "DevOps", "DevOps Tools": "DevOps",
-    "Build Tools": "DevOps", "Processes": "DevOps",
+],
+d: [
+"A web-based admin dashboard that makes it easy to manage and monitor your servers without using complicated command-line tools.",
+"Makes Django's admin interface look prettier and more modern so it's nicer to use for managing your website's data. [JOURNALISM]",
+"Quickly create an admin panel for your Flask web app to manage your data without building one from scratch. [JOURNALISM]",
+"A web interface to watch what's happening with your background tasks in Celery and see if they're running smoothly.",
+"Automatically generate a polished admin panel for any Python application so you can manage your data through a nice interface.",
+"Turn your Python scripts into interactive web forms so anyone can use them without touching the command line.",
+"Build interactive dashboards and data apps in minutes using simple Python code, perfect for sharing analysis and reports. [JOURNALISM]",
+"A fast server that runs modern web applications built with Django, handling real-time features like WebSockets.",
+"An extremely fast web server that runs modern Python web frameworks, built for speed and performance.",
+"A flexible web server similar to Gunicorn but designed to work with newer Python web frameworks for better performance.",
+"Python's built-in tool for writing programs that handle many tasks at once, like talking to multiple users or services simultaneously.",
+"A built-in Python tool that lets you run multiple tasks at the same time to make your programs faster and more responsive.",
+"Python's standard way to split work across multiple processor cores, letting you do heavy computations much faster.",
+"A friendly library for writing programs that do multiple things at once, with clearer and easier-to-understand code than asyncio.",
+"A powerful framework for building programs that handle many network connections at once, like chat servers or web scrapers.",
+"A super-fast replacement for Python's async engine that makes your concurrent programs run significantly faster.",
+"A library that lets you handle many network connections at once without writing complicated async code.",
+"A library that makes it easy to write programs handling many tasks simultaneously using lightweight threads.",
+"A build tool designed for creating custom embedded Linux systems, similar to Make but specifically for Linux projects.",
+"A tool that automates building and assembling complex applications made of many separate parts.",
+"Helps you write and compile code for embedded devices like Arduino and microcontrollers in a unified way.",
+"An automation tool for building Python projects, handling tests, packaging, and publishing all in one place.",
+"A powerful build tool that automates compiling code and managing project dependencies across different systems.",
+"Reduces boilerplate code in Python classes by automatically generating common methods like __init__ and __repr__.",
+"A specialized dictionary that lets you look up values in both directions, useful for maintaining two-way relationships.",
+"A Python dictionary that lets you access items using dot notation (like obj.key) instead of bracket notation (like obj['key']).",
+"Python's built-in way to create simple classes for storing data with automatic methods for initialization and representation.",
+"Lets you access nested dictionaries and lists using dot notation, like accessing 'config.database.host' as a path.",
+"A powerful content management system built on Django for creating and managing website content without coding.",
+"A full-featured event management system for planning conferences, meetings, and gatherings with registration and scheduling.",
+"A content management system for Django that makes it easy to create and edit website pages with a user-friendly interface. [JOURNALISM]",
+"A web middleware that handles storing user session data and caching information to make websites faster.",
+"Automatically stores Django database results in cache and updates the cache when data changes, improving performance.",
+"A smart caching tool for Django that automatically figures out what to refresh when your data changes.",
+"A modern caching library that works with databases and web frameworks to speed up your application.",
+"A Python caching system that organizes cached data with tags so you can selectively refresh only what you need.",
+"A Python connection to Memcached, a popular tool for temporarily storing data to make websites run much faster.",
+"Stores cached data on disk using a database, offering better performance and persistence than traditional memory caches.",
+"A chatbot framework that lets you automate tasks through chat platforms, enabling team automation and notifications.",
+"Extracts text from images automatically, supporting over 40 languages with minimal setup or configuration needed. [JOURNALISM]",
+"A computer vision library for PyTorch that provides advanced image processing tools for machine learning projects.",
+"A comprehensive library for image and video processing, used for everything from face detection to video analysis. [JOURNALISM]",
+"A simple Python wrapper around Google's Tesseract tool for converting images and scanned documents into readable text. [JOURNALISM]",
+"An alternative wrapper for Tesseract OCR that's easy to use with image libraries and works well for text extraction.",
+"Python's built-in tool for reading and writing configuration files (INI format), making your apps customizable.",
+"Reads configuration files with the ability to validate the values, ensuring your settings are correct before use.",
+"A framework that makes managing complex application settings easy, especially useful for machine learning experiments.",
+"Keeps sensitive information like passwords and API keys separate from your code using environment variables.",
+"Provides tools for encrypting and decrypting data, creating secure communication channels, and protecting sensitive information.",
+"Lets you connect to remote servers and run commands over SSH directly from Python, automating server management tasks.",
+"A library for keeping your data secure by encrypting and decrypting information so only the right people can read it.",
+"Makes it easy to work with spreadsheet-like data in Python—sort it, filter it, analyze it, and create charts all in code. [JOURNALISM]",
+"Lets you use pandas to work directly with data stored on Amazon Web Services without downloading it first.",
+"A tool that lets you explore databases and publish them on the web so others can search and analyze your data. [JOURNALISM]",
+"Automatically examines your data to find patterns, errors, and relationships you might have missed manually.",
+"Makes it simpler to process really large amounts of data using PySpark without getting bogged down in complex code.",
+"Checks if your data is correct and matches the rules you set up before you use or save it.",
+"Takes messy data from websites or APIs, checks if it's valid, and converts it into clean Python data you can use.",
+"Verifies that JSON data (common format from APIs) matches the structure and rules you expect.",
+"A simple way to define and check that Python data structures (lists, dictionaries) have the right shape and types.",
+"Validates and transforms data into proper formats, useful when handling information from forms or APIs.",
+"Makes sure your Python data is correct by checking it against rules you define in an easy-to-read way.",
+"Uses Python's type hints to automatically validate and convert your data into the correct types.",
+"Create beautiful, interactive charts and graphs from your data using simple, readable code. [JOURNALISM]",
+"Make interactive web-based charts and visualizations that users can zoom, pan, and explore in their browser. [JOURNALISM]",
+"Create interactive graphs directly inside Jupyter notebooks that you can click and explore.",
+"Draw maps and geographic data visualizations so you can display information on real-world locations. [JOURNALISM]",
+"Generate professional system diagrams (like architecture or flowcharts) by writing code instead of using drawing tools. [JOURNALISM]",
+"Python's go-to library for making all kinds of plots, charts, and graphs to visualize your data. [JOURNALISM]",
+"Create beautiful charts using a grammar-of-graphics approach similar to R's ggplot2.",
+"Generate clean, scalable charts as SVG files that look great on websites and in documents.",
+"Visualize networks, graphs, and relationships using the powerful Graphviz layout engine from Python.",
+"Build real-time, interactive scientific plots and dashboards with fast performance for live data.",
+"Makes statistical charts and plots look beautiful and professional with just a few lines of code. [JOURNALISM]",
+"Create extremely fast, high-quality 3D and scientific visualizations using your computer's graphics card.",
+"A lightweight database that stores key-value pairs (like a dictionary) without needing complex setup.",
+"A lightweight database perfect for small projects where you want to store and query documents without SQL.",
+"Store Python objects directly in a database without having to convert them to SQL or JSON first.",
+"Work with dates and times in Python in a much simpler, more intuitive way than the built-in tools.",
+"Extends Python's date/time tools with extra features like parsing dates in any format and handling timezones.",
+"Simplifies working with dates and times in Python, making timezone handling and date math much easier.",
+"Handles all the world's timezones so you can work with dates correctly no matter where users are located.",
+"A beginner-friendly library for building artificial neural networks (AI models) with simple, readable code.",
+"A powerful library for building and training AI models with the speed and flexibility that researchers love.",
+"Streamlines the process of training AI models in PyTorch, handling tedious details so you focus on your model.",
+"Pre-built algorithms for training AI agents to learn tasks through trial and error (reinforcement learning).",
+"Google's industry-standard library for building, training, and deploying machine learning and AI models at scale.",
+"A library designed for fast mathematical computations on large arrays, often used for deep learning research.",
+"Convert your Python script into a standalone app that Mac users can run without needing Python installed.",
+"Convert your Python script into a standalone .exe file so Windows users can run it without installing Python.",
+"Protects your Python code by encrypting it so people can't easily read or modify what you've written.",
+"Convert your Python scripts into executable files that work on Windows, Mac, or Linux without needing Python installed.",
+"Bundle your Python program with all its dependencies into a single file that runs anywhere.",
+"Automatically generate professional documentation for your Python code from docstrings and markdown files.",
+"Quickly generate clean, readable API documentation for your Python library with minimal setup.",
+"Access financial market data (stocks, crypto, bonds) easily from Chinese and international sources.",
+"A command-line tool for uploading, downloading, and managing files stored on Amazon's S3 cloud storage.",
+"Download videos from YouTube and other video websites directly from the command line. [JOURNALISM]",
+"Easily switch between different Python versions on your computer without conflicts or complicated setup.",
+"Create isolated Python environments on your computer so different projects don't interfere with each other's packages.",
+"Automatically identifies what type of file you're dealing with by looking at its name or content, so your program knows whether it's handling a picture, document, video, etc.",
+"Makes it easy to work with file and folder paths in your code without worrying about whether you're on Windows, Mac, or Linux—it handles the differences automatically.",
+"Simplifies working with file paths by providing a cleaner, more intuitive way to navigate and manipulate files and folders in your Python code.",
+"Detects what type of file you have by examining its actual content rather than just its extension, making it harder to fool with mislabeled files.",
+"Lets your program automatically detect and react when files change, get created, or deleted in a folder without constantly checking—perfect for auto-saving or syncing tools.",
+"An alternative Python syntax that makes it easier and cleaner to write certain types of code, especially when you want a more functional programming style.",
+"Provides handy shortcuts and tools for working with data in creative ways, making complex operations simpler and more readable.",
+"Offers extra power tools for looping through and manipulating lists and data collections beyond what Python provides built-in.",
+"Helps you write more predictable, safer code by providing organized ways to handle different outcomes (success, failure, or special cases) without catching exceptions.",
+"A super-fast version of functional programming tools that uses compiled code under the hood for handling large datasets without slowing down.",
+"A collection of helper functions for working with lists, dictionaries, and data transformations in a clean, functional programming style.",
+"Lets you build text-based, interactive user interfaces in the terminal with windows, buttons, and menus—great for command-line tools.",
+"Combines Python code with web technologies to create desktop applications that look modern and work offline without needing an internet connection.",
+"Makes it simple to design user interfaces by writing them in a clean, declarative way that's easier to read than traditional code.",
+"Write one Python program that runs on Windows, Mac, Linux, phones, and web browsers—perfect if you want to reach multiple platforms without rewriting your code.",
+"Creates desktop applications using web technology and Python, so you can build beautiful, interactive programs with the flexibility of web design.",
+"Transform your simple command-line program into a full graphical application with a single line of code—no GUI experience needed.",
+"Build touch-friendly mobile and desktop apps in pure Python that work on phones, tablets, and computers with the same code.",
+"A lightweight toolkit for creating games and multimedia applications with graphics, sound, and animations that work across different operating systems.",
+"Connect Python to GTK, giving you access to the same graphics tools that power many Linux desktop applications.",
+"Build professional desktop applications for Windows, Mac, and Linux using the same powerful tools that professionals use to create traditional software.",
+"The easiest way to add buttons, windows, and menus to your Python script—works with multiple graphics frameworks without you having to learn them all.",
+"Wrap a web interface around your Python code to create a desktop app that looks modern and uses web technologies like HTML and JavaScript.",
+"Python's built-in tool for creating simple desktop applications with windows, buttons, and text boxes—easy to learn and comes with Python.",
+"Write one Python program that automatically looks native on Windows, Mac, iOS, and Android—matching each platform's design style perfectly.",
+"Build sophisticated text-based user interfaces for the terminal with support for colors, animations, and interactive elements.",
+"Create native-looking desktop applications for Windows, Mac, and Linux that feel like real software rather than a web app.",
+"Build fast, beautiful user interfaces with GPU acceleration, perfect when you need top performance or complex visualizations.",
+"Easily create modern APIs that let your applications share data efficiently—popular with web developers who want flexible, powerful APIs.",
+"A beginner-friendly library for making 2D games with Python, complete with graphics, sounds, and all the tools you need to bring your game ideas to life.",
+"Build 2D games and animated applications with a framework designed to make graphics and interactions feel smooth and responsive.",
+"Create 3D games and virtual reality experiences with Python, giving you access to powerful 3D graphics without complex C++ code.",
+"A professional 3D game engine created by Disney that's free for everyone—build games and 3D applications with industrial-strength tools.",
+"The most popular Python tool for making 2D games—provides everything you need: graphics, sound, input, and collision detection.",
+"Access professional 3D rendering technology through Python for games, simulations, and any application that needs impressive 3D visuals.",
+"Direct access to low-level graphics programming for creating custom 3D effects and high-performance visualizations.",
+"Use the powerful SDL game development library from Python to create games and multimedia applications across multiple platforms.",
+"Specialized tool for creating visual novels and interactive story games where players make choices that affect the narrative.",
+"Quickly add country selection fields to your Django website, automatically handling all country names and codes for you.",
+"Add location-based features to your website, like maps and location searches, with built-in geographic database support. [JOURNALISM]",
+"Work with map data in Python by reading and writing GeoJSON—a standard format for sharing geographic information.",
+"Convert addresses to coordinates and coordinates to addresses, or calculate distances between locations—all with a few lines of code. [JOURNALISM]",
+"Extract data from websites by parsing HTML, making it easy to scrape information and automate web tasks without complex code. [JOURNALISM]",
+"Clean up user-submitted HTML to remove dangerous code while keeping the safe, formatted content—essential for websites that accept user input.",
+"Parse, validate, and manipulate CSS stylesheets in Python, useful for analyzing web styling or programmatically generating styles.",
+"Parse and fix broken HTML the way web browsers do, making it reliable for extracting data from messy or malformed web pages.",
+"Lightning-fast library for reading and manipulating HTML and XML documents—much faster than alternatives when dealing with large files.",
+"Safely handle text that contains special characters and HTML, preventing security vulnerabilities when displaying user input on websites.",
+"Query and manipulate HTML documents using jQuery-style syntax, making web scraping feel familiar if you know JavaScript.",
+"Convert XML files into simple Python objects, making it natural to access and work with structured data without parsing complexity.",
+"Convert HTML and CSS documents into beautiful PDF files programmatically, perfect for generating invoices, reports, or any document from web content. [JOURNALISM]",
+"Easily read and parse XML files without complicated code, making it simple to extract data from XML documents.",
+"Transform XML files into Python dictionaries so you can work with XML data just like you would with JSON.",
+"A modern tool for sending HTTP requests to websites and APIs, with better features than older alternatives. [JOURNALISM]",
+"The easiest way to download web pages and interact with web APIs in Python, designed to be simple and intuitive. [JOURNALISM]",
+"An HTTP library that works like requests but is built for asynchronous operations when you need faster, non-blocking web requests.",
+"A powerful HTTP library that handles connection pooling efficiently and safely manages multiple web requests at once.",
+"Monitor and control keyboard inputs on your computer, allowing you to detect key presses or simulate typing programmatically.",
+"Track and control mouse movements and clicks on your computer, useful for automation or testing applications.",
+"Control and monitor your keyboard and mouse inputs, perfect for building automated scripts or testing software.",
+"Create, send, and analyze network packets to understand network traffic, test network security, or develop network tools.",
+"Edit and create images with Python, letting you resize, crop, rotate, and modify photos and graphics easily. [JOURNALISM]",
+"Generate barcode images that you can use in your applications without needing extra software dependencies.",
+"Remove backgrounds from images or extract subjects with professional-quality transparency effects.",
+"Create QR codes that people can scan with their phones, useful for sharing links or information in a compact format.",
+"Automatically extract color palettes from images to create matching color schemes for your applications or designs.",
+"Process images extremely fast and efficiently, even when working with very large images that would use too much memory otherwise.",
+"Turn photos into abstract art by breaking them down into colored squares, creating stylized digital paintings.",
+"A comprehensive library for analyzing and processing images scientifically, useful for computer vision and image analysis projects.",
+"Automatically resize, crop, and flip images on demand, perfect for serving optimized images to websites and apps.",
+"Use ImageMagick's powerful image processing capabilities from Python, giving you professional-grade image editing features.",
+"The standard Python interpreter written in C, which powers most Python installations and is what you're using when you run Python normally.",
+"Speed up your Python code dramatically by converting it to C, making performance-critical applications much faster.",
+"Run Python code using Common Lisp as the foundation instead of C, for specialized programming environments.",
+"Run Python code on the Microsoft .NET platform, letting you use Python with Windows-specific libraries and tools.",
+"Run Python on tiny devices like microcontrollers and single-board computers with minimal memory.",
+"Make math-heavy and scientific Python code run much faster by automatically compiling it to machine code.",
+"Write ultra-optimized low-level processor instructions directly from Python for maximum performance in specialized cases.",
+"An alternative Python interpreter that runs code much faster than standard Python through clever optimization techniques.",
+"A faster version of Python that uses just-in-time compilation to speed up your programs automatically.",
+"A friendlier interactive Python shell with color-coding, auto-completion, and better navigation than the standard interpreter.",
+"Create interactive notebooks that mix code, documentation, and visualizations in your browser, perfect for learning, exploring data, and sharing results.",
+"An advanced Python shell with syntax highlighting, better auto-completion, and a cleaner interface for interactive coding.",
+"Support multiple languages and regions in your application by handling translations, date formatting, and localization automatically.",
+"Handle international text properly by supporting multiple languages, character sets, and cultural conventions in your Python programs.",
+"Design, schedule, and monitor complex workflows and data pipelines visually, perfect for automating recurring data tasks.",
+"Schedule Python functions to run at specific times or intervals, like a task scheduler built right into your code. [JOURNALISM]",
+"Add calendar scheduling features to Django websites, letting users book appointments or manage events.",
+"Automate and manage tasks in your projects, similar to build tools like Make but easier to use with Python.",
+"Run tasks across multiple machines with a web interface to manage and monitor them from one place.",
+"Speed up your code by running parts of it in parallel on multiple cores, great for data processing and machine learning.",
+"Write scheduled tasks in Python instead of cryptic crontab syntax, making scheduling jobs on servers much easier.",
+"Build reliable data pipelines that automatically handle failures and send alerts, making data processing production-ready.",
+"Schedule Python functions to run at specific times using simple, readable code that anyone can understand. [JOURNALISM]",
+"Create complex workflows and state machines that manage how tasks flow through your application.",
+"Execute tasks reliably with automatic error handling and recovery, ensuring your processes complete successfully even when something goes wrong.",
+"Record what your program is doing in an easier and more flexible way than Python's standard logging system.",
+"Track what your program is doing by recording messages at different importance levels, essential for understanding how your code behaves.",
+"Make logging in Python enjoyable with colorful output, easy configuration, and automatic file rotation for a better development experience.",
+"Automatically catch and report errors that happen in production, letting your team know immediately when something breaks.",
+"Makes it easy to keep organized records of what your Python program is doing by logging information in a structured, readable format.",
+"A practice environment where you can teach a computer program to learn and make decisions, like training a bot to play games.",
+"A machine learning platform that helps you build predictive models quickly, even with very large datasets.",
+"Provides tools to measure how accurate your machine learning models are so you know if they're working well.",
+"A framework for building intelligent programs that can learn patterns from data and make predictions over time.",
+"The most beginner-friendly Python tool for machine learning, with simple functions to train models and make predictions.",
+"Apache Spark's machine learning library that lets you build and train models on massive amounts of data across multiple computers.",
+"A lightweight Python wrapper for [Vowpal Wabbit](https://github.com/JohnLangford/vowpal_wabbit/).",
+"A powerful and fast machine learning algorithm that works especially well for competitions and real-world prediction problems.",
+"An AI layer for databases that makes it easy to add machine learning predictions directly to your data without complex setup.",
+"A ready-to-use Python package that comes pre-installed with popular scientific tools for data analysis and visualization.",
+"A collection of pre-built Python libraries for Windows that are hard to install normally, ready to download and use.",
+"Lets you use Python code alongside .NET libraries and programs on Windows, bridging two different programming worlds.",
+"Gives Python access to Windows-specific features like the file system, registry, and other system tools.",
+"A portable version of Python designed for Windows that includes scientific tools and doesn't require installation.",
+"A simple messaging system that lets different parts of your Python program send signals to each other when events happen.",
+"A collection of handy utility functions that make common Python tasks easier and faster to code.",
+"Helps you safely pass data through untrusted environments (like user browsers) by digitally signing it so you know it hasn't been changed.",
+"A Google tool that uses AI to automatically generate original music and art from simple ideas or patterns.",
+"Makes it easy to build Python programs that can be extended with plugins, letting users add new features without modifying the main code.",
+"A complete business software framework for building accounting, inventory, and sales applications quickly.",
+"A tool that creates a pretend computer network on your machine so you can test network software without real hardware.",
+"Simplifies managing network equipment from different vendors by giving you a single, simple way to control them all.",
+"A Python framework for writing software-defined network controllers that manage how network traffic flows.",
+"Automatically tracks and records user actions on your website (likes, comments, follows) so you can show activity feeds.",
+"Builds fast, scalable news feeds and notifications for websites using fast databases in the background.",
+"The standard tool for installing Python libraries from the internet so you can use them in your projects.",
+"A package manager that installs not just Python libraries but also complex scientific tools with all their dependencies.",
+"A modern tool that handles installing libraries and managing project dependencies while keeping everything organized and reproducible.",
+"An extremely fast, modern package manager built in Rust that installs Python libraries and manages projects lightning quick.",
+"A tool for creating a local copy of the entire Python library repository so you can access packages without internet.",
+"A private Python package server that lets you store, test, and release your own libraries internally before sharing them.",
+"A simple local Python package server that caches libraries and lets you host your own private packages.",
+"The modern software behind the official Python Package Repository (PyPI) where all Python libraries are hosted.",
+"A framework with tools for security testing and ethical hacking to find vulnerabilities in systems.",
+"A toolkit for security professionals to test how vulnerable organizations are to social engineering attacks.",
+"An automated security testing tool that checks if websites are vulnerable to SQL injection attacks.",
+"Adds fine-grained permission control to Django websites so you can control who can access specific database records.",
+"A lightweight permission system for Django that lets you define access rules without storing extra database records.",
+"Makes running system commands from Python simpler and cleaner, letting your code control other programs easily.",
+"A simpler, more powerful way to run other programs from your Python code with better control over input and output.",
+"Lets you call system commands in Python as if they were regular Python functions, making scripts easier to write.",
+"A fast, memory-efficient tool for finding similar items in your data, useful for search and recommendation systems.",
+"A fast library for building recommendation systems that predict user preferences based on patterns in data.",
+"A high-speed recommendation engine that learns from user behavior (clicks, purchases) to suggest relevant products.",
+"A specialized library for building predictive models that consider relationships between different features in your data.",
+"An easy-to-use Python library for building recommendation systems that suggest items users might like.",
+"Uses deep learning and PyTorch to build advanced recommendation systems that predict what items users will prefer.",
+"A beginner-friendly toolkit for building and testing recommendation systems that suggest movies, products, or content.",
+"A framework built on TensorFlow for creating recommendation systems that predict what users will enjoy.",
+"A refactoring tool that helps you automatically rename, reorganize, and improve the structure of your Python code without breaking it.",
+"A modern tool that safely refactors your Python code by automatically finding and fixing code patterns across your entire project.",
+"A Python refactoring library that helps you rename variables, extract functions, and reorganize code programmatically.",
+"A collection of robot movement and navigation algorithms with visual demonstrations, perfect for learning how robots plan paths and avoid obstacles.",
+"A library for writing Python programs that control and communicate with robots using the Robot Operating System (ROS).",
+"A tool for calling Python functions across different computers or programs over the network with minimal setup.",
+"A toolbox for astronomers and space scientists to analyze data from telescopes and study stars and galaxies.",
+"A automated pipeline for analyzing DNA sequencing data from genetic research projects quickly and reliably.",
+"A collection of useful tools for biological research, including code for analyzing genetic data and protein sequences.",
+"A toolkit for biologists to work with DNA sequences, proteins, and other biological data in Python.",
+"A tool that reads and interprets data from chemistry software, making it easy to analyze molecular simulation results.",
+"A library for working with colors and light in scientific applications, including color conversion and visual rendering calculations.",
+"A machine learning toolkit for finding patterns and communities in network data, like social media connections or relationships.",
+"A powerful library for creating, analyzing, and visualizing networks like social networks, computer networks, or biological systems.",
+"A collection of tools for analyzing brain imaging data from MRI and fMRI scans used in neuroscience research.",
+"The foundation of scientific computing in Python, providing fast arrays and math operations that make data analysis practical.",
+"A toolbox for seismologists to download, process, and analyze earthquake and seismic wave data from monitoring networks.",
+"A chemistry tool that converts between different molecular data formats, making it easy to work with chemical structures.",
+"A library for modeling and simulating systems that move and change over time, like robots, vehicles, or mechanical structures.",
+"A tool for solving uncertainty problems by using statistical sampling to explore possible solutions and their probabilities.",
+"A toolkit for quantum mechanics calculations, used to simulate and analyze quantum systems and quantum computing.",
+"A chemistry library that helps you work with molecular structures, predict chemical properties, and apply machine learning to drug discovery.",
+"A comprehensive science toolkit that extends NumPy with algorithms for optimization, statistics, signal processing, and more.",
+"A simulation library for modeling real-world processes like traffic flow, queues, or manufacturing systems to predict outcomes.",
+"A library for building and testing statistical models and analyzing economic and financial data.",
+"A tool for symbolic mathematics that can solve equations, simplify expressions, and perform calculus like a math textbook.",
+"A framework for testing and backtesting stock trading strategies using historical market data.",
+"A search plugin for Django websites that lets you add powerful search functionality to your web applications.",
+"An easy-to-use tool for building search applications that can handle billions of documents and find results in milliseconds.",
+"The official low-level client for connecting Python code to Elasticsearch search engines for customized search behavior.",
+"A simple Python connector for Apache Solr that lets you index and search large amounts of text data.",
+"A pure Python search engine library that you can embed directly in your Python programs without external dependencies.",
+"A tool for converting between complex Python objects and simple formats like JSON, useful for APIs and data validation.",
+"An extremely fast JSON parser that uses modern computer processor tricks to read JSON files at lightning speeds.",
+"A high-performance JSON reader and writer that's much faster than Python's built-in JSON module.",
+"A compact data format that uses fewer tokens than JSON, perfect for reducing costs when working with AI language models.",
+"An ultra-fast JSON encoder and decoder written in C that dramatically speeds up processing large JSON data.",
+"A toolkit that makes it easy to write and deploy Python code to AWS Lambda for running serverless functions. [JOURNALISM]",
+"A deployment tool that lets you host Django and other Python web applications on AWS Lambda without managing servers. [JOURNALISM]",
+"A shell that combines Python programming language with Unix commands, giving you the power of both in one place.",
+"A simple content management system and blog platform that generates static websites from easy-to-edit content files.",
+"A documentation generator that turns Markdown files into beautiful, professional-looking websites automatically. [JOURNALISM]",
+"A tiny, straightforward static site generator that creates websites from files without complex configuration or magic.",
+"A flexible static website and blog generator that supports multiple content formats and powerful customization.",
+"A static blog generator that converts Markdown and other text formats into a complete, ready-to-deploy website. [JOURNALISM]",
+"A simple plugin for Django that adds tagging capability to your website, letting you organize content with labels. [JOURNALISM]",
+"A task scheduler that lets you run Python code in the background and across multiple computers to handle long-running jobs.",
+"A lightweight task queue that processes background jobs reliably, simpler to set up than more complex alternatives.",
+"A small task queue system for running background jobs in Python with minimal configuration and overhead.",
+"A distributed task queue that uses Redis to coordinate Python workers across multiple computers for processing jobs at scale.",
+"A simple tool for managing background jobs in Python, letting you run tasks without blocking your main application.",
+"A templating tool that generates web pages by combining your data with HTML templates, keeping code and design separate.",
+"A powerful and easy-to-use templating engine for creating dynamic web pages by inserting data into HTML templates.",
+"A lightweight, fast templating library for Python that quickly converts your data into formatted text or web pages.",
+"One unified library to interact with different cloud providers like Amazon, Google Cloud, and Microsoft Azure from a single codebase.",
+"The official Python library for interacting with Amazon Web Services, letting you manage AWS resources programmatically.",
+"Bridges Django and WordPress, letting you use WordPress content and functionality within your Django web application.",
+"An official tool that lets your Python app interact with Facebook's features, like posting, reading user data, or managing ads.",
+"Access Google's services like Gmail, Drive, and YouTube directly from Python code without using a web browser.",
+"Read and write to Google Sheets directly from Python, treating spreadsheets like a simple database. [JOURNALISM]",
+"A Python library that lets your app interact with Twitter's API to read tweets, post content, and manage followers.",
+"Makes working with URLs simple by providing an easy way to parse, build, and modify web addresses in Python.",
+"A clean, simple tool for breaking down and working with URLs in your Python code without messy string manipulation.",
+"Converts long URLs into short, shareable links using services like Bitly or TinyURL from your Python code.",
+"Automatically extracts and validates data from web requests in your Flask or Django app, saving you from manual parsing.",
+"Create, edit, and combine videos and animated GIFs using Python code instead of video editing software. [JOURNALISM]",
+"A video processing library that works with Python's scientific computing tools for analyzing and manipulating video files.",
+"A powerful, fast video processing framework for Python that handles multiple videos simultaneously without slowing down. [JOURNALISM]",
+"Automatically combines and compresses your CSS and JavaScript files on your Django website to make it load faster.",
+"Manages and optimizes static files (images, CSS, JavaScript) in your Django app for better website performance.",
+"Extends Django to store files on cloud services like S3 or Google Cloud Storage instead of your server's disk.",
+"Bundles your JavaScript and CSS files as reusable Python packages with automatic caching and delivery.",
+"Automatically watches your files and syncs them to content delivery networks or cloud storage like S3 when they change.",
+"Optimizes and combines CSS and JavaScript files in Flask apps to improve website loading speed.",
+"Bundles and optimizes static website files while managing unique URLs to prevent browsers from using old cached versions.",
+"Converts HTML web pages into readable Markdown format, useful for extracting content from websites.",
+"Pulls metadata and content from web pages automatically, extracting titles, images, and descriptions.",
+"Extracts embedded media and rich content from URLs, like previews from YouTube videos or Twitter posts.",
+"Extracts news articles and content from websites, cleaning up the text and organizing it into readable formats. [JOURNALISM]",
+"Removes clutter from web pages and extracts the main article content, similar to browser reader modes. [JOURNALISM]",
+"A beginner-friendly library for downloading and parsing HTML from websites with clean, readable code.",
+"Automatically summarizes long documents or web pages into shorter versions that capture the main ideas. [JOURNALISM]",
+"Pulls text out of any document type like Word files, PDFs, and PowerPoint presentations in one simple command. [JOURNALISM]",
+"Turns any website into an API, letting you access website content as structured data without official API support.",
+"Reads blog feeds and news feeds from websites, parsing RSS and Atom content into usable Python data. [JOURNALISM]",
+"A complete framework for scraping websites and collecting data at scale with built-in tools for handling complex sites.",
+"Automates interactions with websites like filling forms and clicking buttons, useful for testing or data collection.",
+"A professional framework for building web scrapers that can efficiently collect data from large websites. [JOURNALISM]",
+"Enables real-time two-way communication between web browsers and Python servers using WebSocket connections.",
+"Adds real-time features like live notifications and chat to Django apps by supporting WebSocket connections.",
+"A simple, reliable library for creating real-time connections between Python apps and web browsers or other clients.",
+"A web server that runs your Python web app and handles multiple requests from users at the same time.",
+"A powerful, high-performance web server for running Python web applications in production environments.",
+"A simple web server for running Python web apps, especially popular with the Pyramid framework.",
+"A utility library that powers Flask and provides tools for handling web requests, cookies, and file uploads.",
 
-    "GUI Development": "Interface", "Game Development": "Interface",
+],
+c: [
+0,0,0,0,0,0,0,2,2,2,0,0,0,0,0,0,0,0,4,4,4,4,4,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,6,6,6,6,6,0,0,0,0,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,11,
+11,11,11,11,11,11,11,11,11,11,11,12,12,12,0,0,0,0,13,13,13,13,13,13,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,
+0,22,22,22,22,22,22,22,22,22,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,37,37,37,37,0,0,0,
+0,38,38,38,38,38,38,38,38,38,38,0,0,0,0,0,0,0,0,0,0,0,0,0,0,44,44,44,44,44,44,44,
+44,44,44,44,50,50,50,50,50,53,53,53,53,53,53,53,53,53,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,61,61,61,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,82,82,82,82,82,0,0,0,0,0,0,0,0,0,0,0,0,0,0,87,87,87,0,0,
+0,0,0,0,0,91,91,91,91,91,91,91,91,91,92,92,92,92,93,93,93,2,2,2,2,
+],
+o: [
+1,1,1,1,1,1,1,1,1,1,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,
+1,1,1,5,1,1,1,1,1,7,1,1,3,1,1,1,1,1,1,10,1,1,1,1,1,1,1,1,1,1,1,1,
+1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+1,1,1,1,3,3,1,1,1,1,1,1,1,1,1,3,1,1,15,1,1,16,1,17,18,1,1,19,1,20,21,1,
+1,23,24,25,26,27,28,29,30,31,1,32,1,1,33,1,5,1,34,1,1,1,35,36,1,1,1,1,1,1,1,1,
+1,1,1,39,1,1,1,1,40,1,1,1,1,1,1,1,1,1,41,1,1,42,1,43,1,45,46,1,47,1,48,1,
+1,1,1,49,51,3,1,1,52,1,1,1,1,54,55,1,1,1,56,57,1,1,58,1,1,1,1,1,59,1,1,1,
+1,1,60,1,1,1,1,1,1,1,1,1,1,1,1,1,62,1,1,1,1,1,1,1,1,1,63,64,1,1,65,1,
+67,1,1,68,69,70,1,71,72,73,1,74,75,1,76,77,78,79,1,1,1,1,1,80,1,81,1,1,1,1,1,1,
+1,1,1,1,1,1,1,1,83,1,1,1,1,84,1,85,86,1,1,1,1,1,1,1,1,1,1,88,1,1,1,1,
+1,89,90,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,94,1,1,
+],
+l: [
+"ajenti/ajenti",
+"sehmaschine/django-grappelli",
+"flask-admin/flask-admin",
+"mher/flower",
+"jet-admin/jet-bridge",
+"wooey/wooey",
+"streamlit/streamlit",
+"django/daphne",
+"encode/uvicorn",
+"pgjones/hypercorn",
+"3/library/asyncio.html",
+"3/library/concurrent.futures.html",
+"3/library/multiprocessing.html",
+"python-trio/trio",
+"twisted/twisted",
+"MagicStack/uvloop",
+"eventlet/eventlet",
+"gevent/gevent",
+"openembedded/bitbake",
+"buildout/buildout",
+"platformio/platformio-core",
+"pybuilder/pybuilder",
+"SCons/scons",
+"python-attrs/attrs",
+"jab/bidict",
+"cdgriffith/Box",
+"3/library/dataclasses.html",
+"carlosescri/DottedDict",
+"feincms/feincms",
+"indico/indico",
+"wagtail/wagtail",
+"bbangert/beaker",
+"django-cache-machine/django-cache-machine",
+"Suor/django-cacheops",
+"sqlalchemy/dogpile.cache",
+"project/HermesCache/",
+"lericson/pylibmc",
+"grantjenks/python-diskcache",
+"errbotio/errbot/",
+"JaidedAI/EasyOCR",
+"kornia/kornia/",
+"",
+"madmaze/pytesseract",
+"sirfz/tesserocr",
+"3/library/configparser.html",
+"DiffSK/configobj",
+"facebookresearch/hydra",
+"HBNetwork/python-decouple",
+"pyca/cryptography",
+"paramiko/paramiko",
+"pyca/pynacl",
+"",
+"aws/aws-sdk-pandas",
+"simonw/datasette",
+"desbordante/desbordante-core/",
+"hi-primus/optimus",
+"pyeve/cerberus",
+"Pylons/colander",
+"python-jsonschema/jsonschema",
+"keleshev/schema",
+"schematics/schematics",
+"alecthomas/voluptuous",
+"pydantic/pydantic",
+"altair-viz/altair",
+"bokeh/bokeh",
+"bloomberg/bqplot",
+"SciTools/cartopy",
+"mingrammer/diagrams",
+"matplotlib/matplotlib",
+"has2k1/plotnine",
+"Kozea/pygal",
+"pygraphviz/pygraphviz/",
+"pyqtgraph/pyqtgraph",
+"mwaskom/seaborn",
+"vispy/vispy",
+"patx/pickledb",
+"msiemens/tinydb",
+"zopefoundation/ZODB",
+"arrow-py/arrow",
+"dateutil/dateutil",
+"sdispater/pendulum",
+"project/pytz/",
+"keras-team/keras",
+"pytorch/pytorch",
+"Lightning-AI/pytorch-lightning",
+"DLR-RM/stable-baselines3",
+"tensorflow/tensorflow",
+"Theano/Theano",
+"ronaldoussoren/py2app",
+"py2exe/py2exe",
+"dashingsoft/pyarmor",
+"pyinstaller/pyinstaller",
+"linkedin/shiv",
+"sphinx-doc/sphinx/",
+"mitmproxy/pdoc",
+"jindaxiang/akshare",
+"s3tools/s3cmd",
+"ytdl-org/youtube-dl/",
+"pyenv/pyenv",
+"pypa/virtualenv",
+"3/library/mimetypes.html",
+"3/library/pathlib.html",
+"jaraco/path.py",
+"ahupp/python-magic",
+"gorakhargosh/watchdog",
+"evhub/coconut",
+"Suor/funcy",
+"erikrose/more-itertools",
+"dry-python/returns",
+"pytoolz/cytoolz/",
+"pytoolz/toolz",
+"3/library/curses.html",
+"ChrisKnott/Eel",
+"nucleic/enaml",
+"",
+"zoofIO/flexx",
+"chriskiehl/Gooey",
+"",
+"pyglet/pyglet",
+"",
+"qtforpython/",
+"PySimpleGUI/PySimpleGUI",
+"r0x0r/pywebview/",
+"moin/TkInter",
+"pybee/toga",
+"",
+"",
+"RaylockLLC/DearPyGui/",
+"graphql-python/graphene/",
+"en/latest/",
+"en/cocos2d-x",
+"",
+"",
+"news.html",
+"tikiwiki/PyOgre",
+"",
+"",
+"",
+"SmileyChris/django-countries",
+"en/dev/ref/contrib/gis/",
+"jazzband/geojson",
+"geopy/geopy",
+"software/BeautifulSoup/bs4/doc/",
+"mozilla/bleach",
+"project/cssutils/",
+"html5lib/html5lib-python",
+"",
+"pallets/markupsafe",
+"gawel/pyquery",
+"stchris/untangle",
+"",
+"en/latest/",
+"martinblech/xmltodict",
+"encode/httpx",
+"psf/requests",
+"twisted/treq",
+"urllib3/urllib3",
+"boppreh/keyboard",
+"boppreh/mouse",
+"moses-palmer/pynput",
+"secdev/scapy",
+"python-pillow/Pillow",
+"WhyNotHugo/python-barcode",
+"pymatting/pymatting",
+"lincolnloop/python-qrcode",
+"dylanaraps/pywal",
+"libvips/pyvips",
+"fogleman/Quads",
+"",
+"thumbor/thumbor",
+"emcconville/wand",
+"python/cpython",
+"cython/cython",
+"metawilm/cl-python",
+"IronLanguages/ironpython3",
+"micropython/micropython",
+"numba/numba",
+"Maratyszcza/PeachPy",
+"pypy/pypy",
+"pyston/pyston/",
+"bpython/bpython",
+"",
+"jonathanslenders/ptpython",
+"en/latest/",
+"ovalhub/pyicu",
+"",
+"en/latest/",
+"thauber/django-schedule",
+"",
+"gunnery/gunnery",
+"",
+"fengsp/plan",
+"PrefectHQ/prefect",
+"dbader/schedule",
+"knipknap/SpiffWorkflow",
+"developer/taskflow/",
+"en/stable/",
+"3/library/logging.html",
+"Delgan/loguru",
+"getsentry/sentry-python",
+"en/stable/",
+"openai/gym",
+"h2oai/h2o-3",
+"benhamner/Metrics",
+"numenta/nupic",
+"",
+"docs/latest/ml-guide.html",
+"josephreisinger/vowpal_porpoise",
+"dmlc/xgboost",
+"mindsdb/mindsdb",
+"",
+"~gohlke/pythonlibs/",
+"pythonnet/pythonnet",
+"mhammond/pywin32",
+"",
+"jek/blinker",
+"mahmoud/boltons",
+"pallets/itsdangerous",
+"magenta/magenta",
+"mitsuhiko/pluginbase",
+"",
+"mininet/mininet",
+"napalm-automation/napalm",
+"noxrepo/pox",
+"justquick/django-activity-stream",
+"tschellenbach/Stream-Framework",
+"en/stable/",
+"conda/conda/",
+"sdispater/poetry",
+"astral-sh/uv",
+"pypa/bandersnatch/",
+"devpi/devpi",
+"jazzband/localshop",
+"pypa/warehouse",
+"Manisso/fsociety",
+"trustedsec/social-engineer-toolkit",
+"sqlmapproject/sqlmap",
+"django-guardian/django-guardian",
+"dfunckt/django-rules",
+"amitt001/delegator.py",
+"en/latest/",
+"amoffat/sh",
+"spotify/annoy",
+"ibayer/fastFM",
+"benfred/implicit",
+"guestwalk/libffm",
+"lyst/lightfm",
+"maciejkula/spotlight",
+"NicolasHug/Surprise",
+"jfkirk/tensorrec",
+"",
+"",
+"python-rope/rope",
+"AtsushiSakai/PythonRobotics",
+"rospy",
+"0rpc/zerorpc-python",
+"",
+"chapmanb/bcbio-nextgen",
+"chapmanb/bcbb",
+"wiki/Main_Page",
+"",
+"",
+"benedekrozemberczki/karateclub",
+"",
+"",
+"",
+"obspy/obspy/wiki/",
+"",
+"",
+"pymc-devs/pymc3",
+"",
+"",
+"",
+"team-simpy/simpy",
+"statsmodels/statsmodels",
+"sympy/sympy",
+"quantopian/zipline",
+"django-haystack/django-haystack",
+"elastic/elasticsearch-dsl-py",
+"guide/en/elasticsearch/client/python-api/current/index.html",
+"django-haystack/pysolr",
+"en/latest/",
+"marshmallow-code/marshmallow",
+"TkTech/pysimdjson",
+"python-rapidjson/python-rapidjson",
+"ScrapeGraphAI/toonify",
+"esnme/ultrajson",
+"nficano/python-lambda",
+"zappa/Zappa",
+"xonsh/xonsh/",
+"lektor/lektor",
+"mkdocs/mkdocs/",
+"sunainapai/makesite",
+"getnikola/nikola",
+"getpelican/pelican",
+"jazzband/django-taggit",
+"en/stable/",
+"Bogdanp/dramatiq",
+"coleifer/huey",
+"pricingassistant/mrq",
+"rq/rq",
+"",
+"pallets/jinja",
+"",
+"",
+"boto/boto3",
+"istrategylabs/django-wordpress",
+"mobolic/facebook-sdk",
+"google/google-api-python-client",
+"burnash/gspread",
+"ryanmcgrath/twython",
+"gruns/furl",
+"codeinthehole/purl",
+"ellisonleao/pyshorteners",
+"marshmallow-code/webargs",
+"moviepy/",
+"aizvorski/scikit-video",
+"abhiTronix/vidgear",
+"django-compressor/django-compressor",
+"jazzband/django-pipeline",
+"jschneier/django-storages",
+"en/latest/",
+"fileconveyor",
+"miracle2k/flask-assets",
+"miracle2k/webassets",
+"Alir3z4/html2text",
+"michaelhelmick/lassie",
+"coleifer/micawber",
+"codelucas/newspaper",
+"buriy/python-readability",
+"psf/requests-html",
+"miso-belica/sumy",
+"deanmalmgren/textract",
+"gaojiuli/toapi",
+"kurtmckee/feedparser",
+"lorien/grab",
+"MechanicalSoup/MechanicalSoup",
+"scrapy/scrapy",
+"crossbario/autobahn-python",
+"django/channels",
+"aaugustin/websockets",
+"benoitc/gunicorn",
+"en/latest/",
+"Pylons/waitress",
+"pallets/werkzeug",
 
-    "Image Processing": "Media", "Video": "Media", "Audio": "Media",
-    "Design": "Media",
-
-    "Testing": "Development Tools", "Code Analysis": "Development Tools",
-    "Debugging Tools": "Development Tools", "Logging": "Development Tools",
-    "Command-line Tools": "Development Tools",
+],
+};
 
-    "Security": "Security", "Cryptography": "Security", "Authentication": "Security",
+export const strings = [
+"Utilities",
+"https://github.com/",
+"Web Frameworks",
+"https://docs.python.org/",
+"Build Tools",
+"https://pypi.org/",
+"Computer Vision",
+"https://opencv.org/",
+"Security",
+"Data Analysis",
+"http://pandas.pydata.org/",
+"Data Visualization",
+"Database",
+"Deep Learning",
+"GUI Development",
+"https://flet.dev/",
+"https://kivy.org/",
+"https://pygobject.readthedocs.io/",
+"https://doc.qt.io/",
+"https://wiki.python.org/",
+"http://urwid.org/",
+"https://wxpython.org/",
+"Game Development",
+"https://api.arcade.academy/",
+"https://www.cocos.com/",
+"http://www.harfang3d.com/",
+"https://www.panda3d.org/",
+"http://www.pygame.org/",
+"http://www.ogre3d.org/",
+"http://pyopengl.sourceforge.net/",
+"https://pysdl2.readthedocs.io/",
+"https://www.renpy.org/",
+"https://docs.djangoproject.com/",
+"https://www.crummy.com/",
+"http://lxml.de/",
+"http://weasyprint.org/",
+"https://xmldataset.readthedocs.io/",
+"HTTP Clients",
+"Image Processing",
+"http://github.com/",
+"http://scikit-image.org/",
+"https://foss.heptapod.net/",
+"https://jupyter.org/",
+"http://babel.pocoo.org/",
+"Job Scheduler",
+"https://airflow.apache.org/",
+"http://apscheduler.readthedocs.io/",
+"http://pydoit.org/",
+"https://joblib.readthedocs.io/",
+"https://docs.openstack.org/",
+"Logging",
+"http://logbook.readthedocs.io/",
+"https://www.structlog.org/",
+"Machine Learning",
+"http://scikit-learn.org/",
+"http://spark.apache.org/",
+"http://python-xy.github.io/",
+"http://www.lfd.uci.edu/",
+"https://winpython.github.io/",
+"http://www.tryton.org/",
+"https://pip.pypa.io/",
+"Processes",
+"https://sarge.readthedocs.io/",
+"http://bicyclerepair.sourceforge.net/",
+"https://pybowler.io/",
+"http://wiki.ros.org/",
+"Science",
+"http://www.astropy.org/",
+"http://biopython.org/",
+"http://cclib.github.io/",
+"http://colour-science.org/",
+"https://networkx.github.io/",
+"http://nipy.org/",
+"http://www.numpy.org/",
+"https://open-babel.readthedocs.io/",
+"http://www.pydy.org/",
+"http://qutip.org/",
+"http://www.rdkit.org/",
+"https://www.scipy.org/",
+"https://gitlab.com/",
+"https://www.elastic.co/",
+"http://whoosh.readthedocs.io/",
+"Task Queues",
+"https://docs.celeryproject.org/",
+"https://genshi.edgewall.org/",
+"http://www.makotemplates.org/",
+"https://libcloud.apache.org/",
+"Video",
+"https://zulko.github.io/",
+"http://www.fanstatic.org/",
+"http://wimleers.com/",
+"Web Content Extracting",
+"Web Crawling",
+"WebSocket",
+"https://uwsgi-docs.readthedocs.io/",
+"Web",
+"WSGI Servers",
+"RESTful API",
+"ASGI Servers",
+"Data Science",
+"Natural Language Processing",
+"Data Engineering",
+"ORM",
+"Database Drivers",
+"Distributed Computing",
+"DevOps",
+"DevOps Tools",
+"Interface",
+"Media",
+"Audio",
+"Design",
+"Testing",
+"Development Tools",
+"Code Analysis",
+"Debugging Tools",
+"Command-line Tools",
+"Cryptography",
+"Authentication",
+];
 
-    "Utilities": "Utilities"
-};
+// [category, domain, ...] pairs of indexes into strings
+export const domains = [2, 95, 37, 95, 91, 95, 92, 95, 93, 95, 96, 95, 97, 95, 98, 95, 9, 99, 66, 99, 11, 99, 53, 99, 13, 99, 100, 99, 6, 99, 101, 101, 102, 101, 12, 101, 103, 101, 104, 101, 82, 101, 44, 105, 106, 105, 4, 105, 61, 105, 14, 107, 22, 107, 38, 108, 87, 108, 109, 108, 110, 108, 111, 112, 113, 112, 114, 112, 50, 112, 115, 112, 8, 8, 116, 8, 117, 8, 0, 0];
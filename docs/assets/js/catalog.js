@@ -0,0 +1,91 @@
+// Catalog loader
+// assets/data/catalog/manifest.json holds only every library's name and
+// category, plus index lists for tags and popularity. Card summaries, full
+// descriptions and links sit in detail shards that are fetched for the cards
+// on screen and the library opened, and the search index is fetched on its
+// own when the search box is first used.
+
+export async function loadCatalog(base) {
+    const response = await fetch(new URL('manifest.json', base), { cache: 'no-cache' });
+    if (!response.ok) throw new Error(`Catalog manifest: HTTP ${response.status}`);
+    return new ShardedCatalog(base, await response.json());
+}
+
+export class ShardedCatalog {
+    constructor(base, { strings, domains, summary, tags, popularity, shards, search }) {
+        this.base = base;
+        this.strings = strings;
+        this.shards = shards;
+        this.search = search;
+        this.loaded = new Map();    // shard index -> Promise of its columns
+
+        const { n, c } = summary;
+        this.summaries = n.map((name, i) => ({
+            n: name,
+            c: strings[c[i]],
+            t: [],
+            p: null
+        }));
+        for (const [tag, indexes] of Object.entries(tags)) {
+            for (const i of indexes) this.summaries[i].t.push(tag);
+        }
+        for (const [score, indexes] of Object.entries(popularity)) {
+            for (const i of indexes) this.summaries[i].p = Number(score);
+        }
+
+        this.domainMap = {};
+        for (let i = 0; i < domains.length; i += 2) {
+            this.domainMap[strings[domains[i]]] = strings[domains[i + 1]];
+        }
+    }
+
+    shardOf(index) {
+        let lo = 0, hi = this.shards.length - 1;
+        while (lo < hi) {
+            const mid = (lo + hi + 1) >> 1;
+            if (this.shards[mid].start <= index) lo = mid;
+            else hi = mid - 1;
+        }
+        return lo;
+    }
+
+    loadShard(k) {
+        if (!this.loaded.has(k)) {
+            const promise = fetch(new URL(this.shards[k].file, this.base))
+                .then(response => {
+                    if (!response.ok) throw new Error(`Catalog shard ${k}: HTTP ${response.status}`);
+                    return response.json();
+                })
+                .catch(error => {
+                    this.loaded.delete(k);  // let the next request retry
+                    throw error;
+                });
+            this.loaded.set(k, promise);
+        }
+        return this.loaded.get(k);
+    }
+
+    // Fuse.js index over every library, prebuilt by the converter; pass it
+    // through Fuse.parseIndex
+    async loadSearchIndex() {
+        const response = await fetch(new URL(this.search, this.base));
+        if (!response.ok) throw new Error(`Search index: HTTP ${response.status}`);
+        return response.json();
+    }
+
+    // { s, d, l } for every library in shard k: card summary, full
+    // description and link, keyed by library index
+    async shardDetails(k) {
+        const shard = await this.loadShard(k);
+        const start = this.shards[k].start;
+        return new Map(shard.d.map((d, j) => [
+            start + j,
+            { s: shard.s[j], d, l: this.strings[shard.o[j]] + shard.l[j] }
+        ]));
+    }
+
+    // { s, d, l } for library index
+    async details(index) {
+        return (await this.shardDetails(this.shardOf(index))).get(index);
+    }
+}
@@ -0,0 +1,67 @@
+"""The external_content/ readers: no guessed URLs, and categories from the entry rather than its whole paragraph"""
+
+import glob
+import json
+import os
+
+import pytest
+
+from external_sources import iter_docx_libraries, iter_html_libraries, project_url
+from extract_from_awesome import write_libraries
+
+EXTERNAL_CONTENT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'external_content')
+
+def source(pattern):
+    paths = glob.glob(os.path.join(EXTERNAL_CONTENT, pattern))
+    if not paths:
+        pytest.skip(f"no {pattern} in external_content/")
+    return paths[0]
+
+@pytest.fixture(scope='module')
+def article():
+    return {lib['name']: lib for lib in iter_html_libraries(source('*.html'))}
+
+@pytest.fixture(scope='module')
+def directory():
+    return {lib['name']: lib for lib in iter_docx_libraries(source('*.docx'))}
+
+@pytest.mark.parametrize('name, category', [
+    ('Tkinter', 'GUI Development'),
+    ('MoviePy', 'Video Processing'),
+    ('Redis', 'Utilities'),
+    ('Pickle', 'Utilities'),
+    ('Pendulum', 'Utilities'),
+    ('Numba', 'Utilities'),
+    ('Wave', 'Utilities'),
+])
+def test_article_category_comes_from_name_and_first_sentence(article, name, category):
+    assert article[name]['category'] == category
+    assert article[name]['app_category'] == category
+
+def test_article_multiprocessing_is_not_gui(article):
+    assert article['Multiprocessing']['category'] != 'GUI Development'
+
+def test_article_urls_are_never_guessed(article):
+    assert all(lib['url'] == '' for lib in article.values())
+
+@pytest.mark.parametrize('name', [
+    'Hugging Face Transformers', 'Holoviz ecosystem', 'Tkinter', 'PyTorch', 'OpenCV', 'Blender (bpy)',
+])
+def test_directory_leaves_uncited_entries_unresolved(directory, name):
+    assert directory[name]['url'] == ''
+
+def test_directory_urls_are_project_owned_citations(directory):
+    resolved = {name: lib['url'] for name, lib in directory.items() if lib['url']}
+    assert resolved
+    assert all(project_url(name, url) == url for name, url in resolved.items())
+
+def test_write_libraries_skips_unresolved_entries(tmp_path):
+    output = str(tmp_path / 'libraries.json')
+    records = [
+        {'name': 'Django', 'url': 'https://www.djangoproject.com/', 'description': 'Web framework',
+         'category': 'Web Development'},
+        {'name': 'Atom', 'url': '', 'description': 'A code editor', 'category': 'Utilities'},
+    ]
+    write_libraries([('source', records)], output)
+    with open(output, 'r', encoding='utf-8') as f:
+        assert [lib['name'] for lib in json.load(f)] == ['Django']
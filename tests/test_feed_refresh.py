@@ -0,0 +1,114 @@
+"""Incremental refresh against a local feed stand-in: only new items are written, and the cursor follows the write"""
+
+import json
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import feed_refresh
+from feed_refresh import load_cursor, refresh
+from fetch_engine import FetchEngine
+
+START = 1700000000
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        if self.path in ('/rss/updates.xml', '/rss/packages.xml'):
+            items = server.updates if self.path == '/rss/updates.xml' else []
+            body = ''.join(
+                f'<item><title>{name} {version}</title>'
+                f'<link>https://pypi.org/project/{name}/{version}/</link>'
+                f'<pubDate>{formatdate(when, usegmt=True)}</pubDate></item>'
+                for name, version, when in sorted(items, key=lambda item: -item[2]))
+            self._send(200, f'<?xml version="1.0"?><rss version="2.0"><channel>{body}</channel></rss>', 'text/xml')
+            return
+
+        parts = self.path.strip('/').split('/')
+        if len(parts) == 3 and parts[0] == 'pypi' and parts[2] == 'json' and parts[1] in server.versions:
+            server.fetched.append(parts[1])
+            info = {'name': parts[1], 'summary': f"{parts[1]} summary", 'version': server.versions[parts[1]]}
+            self._send(200, json.dumps({'info': info, 'releases': {}, 'urls': []}), 'application/json')
+            return
+        self._send(404, 'Not Found', 'text/plain')
+
+    def _send(self, status, body, content_type):
+        body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+@pytest.fixture
+def feed_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+    server.daemon_threads = True
+    server.updates = []       # (name, version, published timestamp)
+    server.versions = {}      # name -> version the JSON API reports
+    server.fetched = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def release(server, name, version, when):
+    server.updates.append((name, version, when))
+    server.versions[name] = version
+
+def versions(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return {record['name']: record['version'] for record in json.load(f)}
+
+def test_refresh_writes_only_new_items_and_advances_cursor_after_write(feed_server, tmp_path, monkeypatch):
+    catalog = tmp_path / 'catalog.json'
+    cursor = tmp_path / 'cursor.json'
+    catalog.write_text(json.dumps([
+        {'name': name, 'description': f"{name} library", 'version': '1.0', 'url': ''}
+        for name in ('alpha', 'beta', 'gamma')
+    ]), encoding='utf-8')
+    base_url = f"http://127.0.0.1:{feed_server.server_port}"
+
+    def run():
+        with FetchEngine(max_workers=2, rate=100.0, burst=10) as engine:
+            return refresh(engine, str(catalog), str(cursor), base_url)
+
+    release(feed_server, 'alpha', '2.0', START)
+    release(feed_server, 'beta', '2.0', START + 60)
+    assert run() == (2, 0, 0)
+    assert versions(catalog) == {'alpha': '2.0', 'beta': '2.0', 'gamma': '1.0'}
+    assert load_cursor(str(cursor))['updates'].timestamp() == START + 60
+
+    # Second run: only gamma's release is newer than the cursor, so alpha is
+    # neither fetched nor rewritten even though its metadata has moved on
+    feed_server.fetched.clear()
+    feed_server.versions['alpha'] = '9.9'
+    release(feed_server, 'gamma', '3.0', START + 120)
+    assert run() == (1, 0, 0)
+    assert feed_server.fetched == ['gamma']
+    assert versions(catalog) == {'alpha': '2.0', 'beta': '2.0', 'gamma': '3.0'}
+    assert load_cursor(str(cursor))['updates'].timestamp() == START + 120
+
+    # A run that fails while writing leaves the cursor where it was
+    release(feed_server, 'beta', '3.0', START + 180)
+    def failing_patch(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(feed_refresh, 'patch_catalog', failing_patch)
+    with pytest.raises(OSError):
+        run()
+    assert load_cursor(str(cursor))['updates'].timestamp() == START + 120
+    assert versions(catalog)['beta'] == '2.0'
+
+    # ... so the next run picks the missed release up
+    monkeypatch.undo()
+    assert run() == (1, 0, 0)
+    assert versions(catalog) == {'alpha': '2.0', 'beta': '3.0', 'gamma': '3.0'}
+    assert load_cursor(str(cursor))['updates'].timestamp() == START + 180
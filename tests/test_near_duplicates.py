@@ -0,0 +1,47 @@
+"""Near-duplicate detection catches display-name aliases of libraries already in the catalog"""
+
+import pytest
+
+from near_duplicates import find_near_duplicates, name_stem
+
+EXISTING = [
+    {'name': 'Selenium', 'url': 'https://github.com/SeleniumHQ/selenium',
+     'description': 'Browser automation framework and ecosystem.'},
+    {'name': 'Plotly', 'url': 'https://github.com/plotly/plotly.py',
+     'description': 'Interactive graphing library for Python.'},
+    {'name': 'pillow', 'url': 'https://github.com/python-pillow/Pillow',
+     'description': 'The friendly PIL fork (Python Imaging Library).'},
+    {'name': 'beautifulsoup', 'url': 'https://www.crummy.com/software/BeautifulSoup/bs4/doc/',
+     'description': 'Providing Pythonic idioms for iterating, searching, and modifying HTML or XML.'},
+    {'name': 'vowpal_porpoise', 'url': 'https://github.com/josephreisinger/vowpal_porpoise',
+     'description': 'A lightweight Python wrapper for Vowpal Wabbit.'},
+]
+
+@pytest.mark.parametrize('candidate, match', [
+    ({'name': 'Selenium (with Python)', 'url': '',
+      'description': 'Automates web browsers for testing and scraping.'}, 'Selenium'),
+    ({'name': 'Plotly (Plotly.py)', 'url': '',
+      'description': 'Interactive, web-ready charts and dashboards.'}, 'Plotly'),
+    ({'name': 'Pillow (PIL)', 'url': 'https://pypi.org/project/pillow/',
+      'description': 'The maintained fork of the Python Imaging Library.'}, 'pillow'),
+    ({'name': 'Beautiful Soup', 'url': 'https://beautiful-soup-4.readthedocs.io/en/latest/',
+      'description': 'Parses HTML and XML documents into navigable trees.'}, 'beautifulsoup'),
+    ({'name': 'vowpal\\_porpoise', 'url': '',
+      'description': 'Wrapper for the Vowpal Wabbit learning system.'}, 'vowpal_porpoise'),
+])
+def test_alias_of_existing_library_is_flagged(candidate, match):
+    duplicates = find_near_duplicates(EXISTING, [candidate])
+    assert [(d['candidate']['name'], d['match']['name']) for d in duplicates] == [(candidate['name'], match)]
+
+def test_matching_pypi_project_is_an_exact_match():
+    existing = [{'name': 'BeautifulSoup', 'url': 'https://pypi.org/project/beautifulsoup4/', 'description': ''}]
+    candidate = {'name': 'bs4 parser', 'url': 'https://pypi.org/project/BeautifulSoup4', 'description': ''}
+    duplicates = find_near_duplicates(existing, [candidate])
+    assert len(duplicates) == 1
+    assert duplicates[0]['reason'] == 'same PyPI project'
+
+@pytest.mark.parametrize('a, b', [('h2', 'h11'), ('pyqt5', 'pyqt6'), ('web3', 'web')])
+def test_version_digits_keep_projects_apart(a, b):
+    assert name_stem(a) != name_stem(b)
+    assert find_near_duplicates([{'name': a, 'url': '', 'description': ''}],
+                                [{'name': b, 'url': '', 'description': ''}]) == []
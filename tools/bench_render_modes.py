@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Render Mode Benchmark
+Loads the same PyPI search pages through pypi_scraper's full, light and http
+modes and reports pages per second for each. Runs against live pypi.org, so
+keep --pages small.
+"""
+
+import argparse
+import asyncio
+import time
+
+from browser_pool import BrowserPool, RENDER_MODES, load_search_page
+from snippet_parser import parse_search_page
+
+async def time_mode(mode, urls, concurrency, rate):
+    """Load every url in one mode; returns (seconds, pages loaded, snippets found, errors)"""
+    loaded = snippets = errors = 0
+
+    async def load(pool, url):
+        nonlocal loaded, snippets, errors
+        async with pool.page() as page:
+            try:
+                content = await load_search_page(pool, page, url)
+            except Exception as e:
+                print(f"  ❌ {mode} {url}: {e}")
+                errors += 1
+                return
+        loaded += 1
+        snippets += len(parse_search_page(content))
+
+    # Browser startup is paid once per scraper run, so it stays out of the timing
+    async with BrowserPool(size=concurrency, rate=rate, mode=mode) as pool:
+        start = time.perf_counter()
+        await asyncio.gather(*(load(pool, url) for url in urls))
+        elapsed = time.perf_counter() - start
+
+    return elapsed, loaded, snippets, errors
+
+async def run(args):
+    urls = [
+        f"https://pypi.org/search/?q={args.query.replace(' ', '+')}&page={page_num}"
+        for page_num in range(1, args.pages + 1)
+    ]
+
+    print("=" * 60)
+    print("Render Mode Benchmark")
+    print("=" * 60)
+    print(f"\n📄 {len(urls)} pages of '{args.query}', {args.concurrency} in flight\n")
+
+    results = {}
+    for mode in args.modes:
+        elapsed, loaded, snippets, errors = await time_mode(mode, urls, args.concurrency, args.rate)
+        results[mode] = loaded / elapsed if elapsed else 0.0
+        print(f"   {mode:<6} {results[mode]:7.2f} pages/s  "
+              f"({loaded} pages, {snippets} snippets, {errors} errors, {elapsed:.1f}s)")
+
+    if 'full' in results and results['full']:
+        for mode, rate in results.items():
+            if mode != 'full':
+                print(f"\n⚡ {mode} vs full: {rate / results['full']:.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pypi_scraper's page loading modes")
+    parser.add_argument('--query', default="web framework", help="search query to page through")
+    parser.add_argument('--pages', type=int, default=10, help="search pages loaded per mode")
+    parser.add_argument('--concurrency', type=int, default=4, help="pages in flight at once")
+    parser.add_argument('--rate', type=float, default=5.0,
+                        help="starting requests per second, high enough not to be the bottleneck")
+    parser.add_argument('--modes', nargs='+', choices=RENDER_MODES, default=list(RENDER_MODES),
+                        help="modes to compare (default: all)")
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
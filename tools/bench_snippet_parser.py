@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Snippet Parser Benchmark
+Compares per-page parse time of the old BeautifulSoup approach against
+snippet_parser.parse_search_page. Pass saved PyPI search pages as arguments,
+or run with none to use a synthetic page shaped like a real one.
+"""
+
+import argparse
+import time
+
+from bs4 import BeautifulSoup
+
+from snippet_parser import parse_search_page
+
+def parse_with_beautifulsoup(html):
+    """The parsing loop the scrapers used before snippet_parser existed"""
+    soup = BeautifulSoup(html, 'html.parser')
+    libraries = []
+
+    for snippet in soup.find_all('a', class_='package-snippet'):
+        name_elem = snippet.find('span', class_='package-snippet__name')
+        if not name_elem:
+            continue
+        desc_elem = snippet.find('p', class_='package-snippet__description')
+        version_elem = snippet.find('span', class_='package-snippet__version')
+        created_elem = snippet.find('span', class_='package-snippet__created')
+
+        libraries.append({
+            'name': name_elem.text.strip(),
+            'description': desc_elem.text.strip() if desc_elem else "No description available",
+            'version': version_elem.text.strip() if version_elem else "unknown",
+            'created': created_elem.text.strip() if created_elem else "unknown",
+        })
+
+    return libraries
+
+def synthetic_page(results=20):
+    """A search page with PyPI's snippet markup and roughly its amount of surrounding chrome"""
+    chrome = ''.join(
+        f'<li class="nav-item"><a href="/help/#{i}" class="nav-link">Help topic {i}</a></li>'
+        for i in range(150)
+    )
+    snippets = ''.join(f'''
+        <li>
+          <a class="package-snippet" href="/project/package-{i}/">
+            <h3 class="package-snippet__title">
+              <span class="package-snippet__name">package-{i}</span>
+              <span class="package-snippet__version">{i}.0.{i}</span>
+              <span class="package-snippet__created"><time datetime="2024-01-01T00:00:00+0000">Jan 1, 2024</time></span>
+            </h3>
+            <p class="package-snippet__description">Package number {i} does something useful with data &amp; text.</p>
+          </a>
+        </li>''' for i in range(results))
+
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>Search results · PyPI</title>'
+        + '<link rel="stylesheet" href="/static/css/warehouse.css">' * 10
+        + f'</head><body><header><nav><ul>{chrome}</ul></nav></header>'
+        + f'<main><p><strong>{results * 50:,}</strong> projects for "<strong>data</strong>"</p>'
+        + f'<ul class="unstyled" aria-label="Search results">{snippets}</ul></main>'
+        + f'<footer><ul>{chrome}</ul></footer></body></html>'
+    ).encode('utf-8')
+
+def time_per_page(parse, pages, repeat):
+    """Best-of-three mean seconds per page"""
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for page in pages:
+                parse(page)
+        best = min(best, (time.perf_counter() - start) / (repeat * len(pages)))
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PyPI search page parsing")
+    parser.add_argument('pages', nargs='*', help="saved search result HTML files")
+    parser.add_argument('--repeat', type=int, default=50, help="passes over the page set per timing")
+    args = parser.parse_args()
+
+    if args.pages:
+        pages = []
+        for path in args.pages:
+            with open(path, 'rb') as f:
+                pages.append(f.read())
+    else:
+        pages = [synthetic_page()]
+
+    # Both parsers must agree before their speed means anything
+    for page in pages:
+        expected = [lib['name'] for lib in parse_with_beautifulsoup(page)]
+        actual = [lib['name'] for lib in parse_search_page(page)]
+        assert expected == actual, "parsers disagree on package names"
+
+    print("=" * 60)
+    print("Snippet Parser Benchmark")
+    print("=" * 60)
+    print(f"\n📄 {len(pages)} page(s), {sum(len(p) for p in pages) / len(pages) / 1024:.1f} KB average")
+
+    baseline = time_per_page(parse_with_beautifulsoup, pages, args.repeat)
+    fast = time_per_page(parse_search_page, pages, args.repeat)
+
+    print(f"\n   BeautifulSoup (html.parser): {baseline * 1000:8.3f} ms/page")
+    print(f"   snippet_parser (lxml):       {fast * 1000:8.3f} ms/page")
+    print(f"\n⚡ Speedup: {baseline / fast:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Browser Pool
+One long-lived Playwright Chromium with a bounded pool of pages, shared by the
+Playwright scraper, its transport plugin and the render-mode benchmark
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from playwright.async_api import Error as PlaywrightError, async_playwright
+
+from fetch_engine import FetchEngine
+from http_cache import CacheMiss, conditional_headers
+
+# Number of browser pages in flight at once
+DEFAULT_CONCURRENCY = 4
+
+# Starting page loads per second; rate control adapts it to how PyPI responds
+DEFAULT_RATE = 1.0
+DEFAULT_BURST = DEFAULT_CONCURRENCY
+
+RENDER_MODES = ("full", "light", "http")
+DEFAULT_MODE = "light"
+
+# Present in a search page's raw HTML when the results are server-rendered
+SNIPPET_MARKER = b'package-snippet'
+SNIPPET_SELECTOR = '.package-snippet'
+
+class BrowserPool:
+    """One long-lived Chromium instance with a bounded pool of reusable pages
+
+    mode picks how pages are loaded:
+      full  - the original behavior: every resource, wait for network idle
+      light - abort everything but the HTML document and wait only for the
+              snippet selector; once a document turns out to carry the
+              snippets without JavaScript, later pages use plain HTTP
+      http  - plain HTTP through a FetchEngine only; no browser is launched
+    """
+
+    def __init__(self, size=DEFAULT_CONCURRENCY, headless=True, cache=None, rate=DEFAULT_RATE,
+                 mode=DEFAULT_MODE, engine=None):
+        self.size = size
+        self.headless = headless
+        self.cache = cache
+        self.mode = mode
+        # Browser and plain-HTTP loads share one engine and so one per-host rate
+        # controller; a caller that already has an engine (the Playwright transport) passes it
+        self._owns_engine = engine is None
+        self.engine = engine or FetchEngine(max_workers=size, rate=rate, burst=DEFAULT_BURST, cache=cache)
+        self.controller = self.engine.controller
+        self.static = mode == "http"
+        self._playwright = None
+        self._browser = None
+        self._contexts = []
+        self._pages = None
+
+    async def __aenter__(self):
+        self._pages = asyncio.Queue()
+        if self.mode == "http":
+            # Slots without pages still cap how many loads are in flight
+            for _ in range(self.size):
+                await self._pages.put(None)
+            return self
+
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+
+        # Each slot gets its own context so cookies/cache don't leak between workers
+        for _ in range(self.size):
+            context = await self._browser.new_context()
+            if self.cache is not None or self.mode == "light":
+                await context.route("**/*", self._route)
+            self._contexts.append(context)
+            await self._pages.put(await context.new_page())
+
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        for context in self._contexts:
+            await context.close()
+        if self._browser is not None:
+            await self._browser.close()
+            await self._playwright.stop()
+        if self._owns_engine:
+            self.engine.close()
+
+    async def _route(self, route):
+        """Drop subresources in light mode and answer document loads from the cache"""
+        request = route.request
+        if request.resource_type != "document":
+            # Only the HTML carries snippets; images, fonts, CSS and scripts are dead weight
+            if self.mode == "light":
+                await route.abort()
+            else:
+                await route.continue_()
+            return
+
+        if self.cache is None or request.method != "GET":
+            await route.continue_()
+            return
+        await self._serve_document(route)
+
+    async def _serve_document(self, route):
+        """Answer a top-level document load from the response cache when possible"""
+        request = route.request
+        url = request.url
+        entry = self.cache.lookup(url)
+        if entry is not None and (entry.fresh or self.cache.offline):
+            await route.fulfill(status=200, body=entry.body, content_type="text/html; charset=utf-8")
+            return
+        if self.cache.offline:
+            print(f"  ⚠️  {CacheMiss(url)!r} (offline mode)")
+            await route.abort()
+            return
+
+        headers = {**request.headers, **conditional_headers(entry)}
+        response = await route.fetch(headers=headers)
+
+        # Playwright lower-cases header names; the cache expects canonical ones
+        validators = {
+            'ETag': response.headers.get('etag'),
+            'Last-Modified': response.headers.get('last-modified'),
+        }
+        if response.status == 304 and entry is not None:
+            self.cache.revalidated(url, validators)
+            await route.fulfill(status=200, body=entry.body, content_type="text/html; charset=utf-8")
+            return
+
+        body = await response.body()
+        if response.ok:
+            self.cache.store(url, body, validators)
+        await route.fulfill(response=response, body=body)
+
+    async def goto(self, page, url, **kwargs):
+        """page.goto() under the shared rate controller, retrying throttled and failed loads"""
+        host = self.controller.host(url)
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            # Waiting for a slot or token blocks, so do it off the event loop
+            waiting = loop.run_in_executor(None, host.acquire)
+            try:
+                ticket = await asyncio.shield(waiting)
+            except asyncio.CancelledError:
+                # The thread still gets its slot; hand it back once it does
+                waiting.add_done_callback(lambda done: done.exception() is None and host.abandon())
+                raise
+            started = time.monotonic()
+            try:
+                response = await page.goto(url, **kwargs)
+            except PlaywrightError as e:
+                delay = self.controller.settle(host, ticket, started, attempt)
+                if delay is None:
+                    raise
+                reason = type(e).__name__
+            except BaseException:
+                # Cancelled, or failed in a way retries won't fix; free the slot either way
+                host.abandon()
+                raise
+            else:
+                # goto() returns None for same-document navigations; nothing to judge
+                status = response.status if response is not None else 200
+                retry_after = response.headers.get('retry-after') if response is not None else None
+                delay = self.controller.settle(host, ticket, started, attempt, status, retry_after)
+                if delay is None:
+                    return response
+                reason = f"HTTP {status}"
+
+            print(f"  ⏳ {url}: {reason}, retry {attempt + 1}/{self.controller.max_retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def render(self, page, url, wait_for=None):
+        """Load url in a browser page per the pool's mode; returns (response, rendered HTML)"""
+        wait_until = "networkidle" if self.mode == "full" else "domcontentloaded"
+        response = await self.goto(page, url, wait_until=wait_until, timeout=30000)
+        if wait_for:
+            await page.wait_for_selector(wait_for, timeout=10000)
+        return response, await page.content()
+
+    async def fetch(self, url):
+        """Plain-HTTP GET of url through the engine's session and cache; returns the body bytes"""
+        # FetchEngine.fetch itself, since the engine may be a transport whose fetch() renders,
+        # and on the loop's executor, since the engine's own workers may all be waiting on us
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, FetchEngine.fetch, self.engine, url)
+
+    @asynccontextmanager
+    async def page(self):
+        """Borrow a page from the pool, waiting if every page is busy (None in http mode)"""
+        page = await self._pages.get()
+        try:
+            yield page
+        finally:
+            await self._pages.put(page)
+
+async def load_search_page(pool, page, url):
+    """Search page HTML over plain HTTP when that is known to work, else from the browser"""
+    if pool.static:
+        content = await pool.fetch(url)
+        if pool.mode == "http" or SNIPPET_MARKER in content:
+            return content
+        # Served something without snippets (a no-results page, or a JavaScript
+        # challenge); let the browser decide which
+        print(f"  ↩️  {url}: no snippets over plain HTTP, rendering in the browser")
+        pool.static = False
+
+    response, content = await pool.render(page, url, wait_for=SNIPPET_SELECTOR)
+    if pool.mode == "light" and not pool.static and response is not None:
+        if SNIPPET_MARKER in await response.body():
+            print("  ⚡ Search pages are server-rendered; switching to plain HTTP")
+            pool.static = True
+    return content
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Library Categorizer
+Keyword rules for guessing a library's category from its description and the
+search query that found it, compiled once into a single regex
+"""
+
+import re
+from functools import lru_cache
+
+# Checked in order: the first category with a matching keyword wins
+CATEGORY_RULES = [
+    ('Web Frameworks', ['django', 'flask', 'fastapi', 'web framework', 'wsgi', 'asgi', 'pyramid', 'bottle', 'tornado']),
+    ('Data Analysis', ['pandas', 'numpy', 'data analysis', 'dataframe', 'polars']),
+    ('Machine Learning', ['machine learning', 'ml', 'scikit', 'xgboost', 'lightgbm']),
+    ('Deep Learning', ['deep learning', 'neural network', 'tensorflow', 'pytorch', 'keras']),
+    ('Data Visualization', ['plot', 'chart', 'visualization', 'graph', 'matplotlib', 'seaborn', 'plotly', 'bokeh']),
+    ('Natural Language Processing', ['nlp', 'natural language', 'text processing', 'spacy', 'nltk', 'transformer']),
+    ('Computer Vision', ['computer vision', 'image processing', 'opencv', 'pillow', 'image']),
+    ('Web Scraping', ['scraping', 'scraper', 'crawler', 'beautiful soup', 'scrapy']),
+    ('Automation', ['automation', 'automate', 'selenium', 'robot']),
+    ('GUI Development', ['gui', 'user interface', 'tkinter', 'qt', 'kivy', 'wxpython']),
+    ('Testing', ['test', 'pytest', 'unittest', 'testing']),
+    ('ORM', ['orm', 'database', 'sqlalchemy', 'sql']),
+    ('RESTful API', ['api', 'rest', 'graphql']),
+    ('Command-line Tools', ['cli', 'command line', 'terminal', 'argparse', 'click']),
+    ('Video Processing', ['video', 'movie', 'ffmpeg']),
+    ('Game Development', ['game', 'pygame']),
+    ('PDF Processing', ['pdf', 'reportlab']),
+    ('Spreadsheet Processing', ['excel', 'spreadsheet', 'openpyxl']),
+    ('Security', ['security', 'cryptography', 'encryption']),
+    ('DevOps', ['devops', 'docker', 'kubernetes', 'ansible']),
+    ('HTTP Clients', ['http', 'requests', 'client', 'httpx']),
+    ('Task Queues', ['queue', 'celery', 'task', 'job']),
+    ('Job Scheduler', ['schedule', 'cron', 'timer']),
+]
+
+DEFAULT_CATEGORY = 'Utilities'
+
+# Keywords this short are acronyms (ml, qt, api, orm...) that collide with
+# pieces of longer words, so they must stand alone (optionally plural)
+SHORT_KEYWORD_LENGTH = 3
+
+def _is_short(word):
+    return len(word) <= SHORT_KEYWORD_LENGTH
+
+def _build_trie():
+    """Character trie of every keyword; each end node records whether it's a short keyword"""
+    root = {}
+    for _, words in CATEGORY_RULES:
+        for word in words:
+            node = root
+            for char in word:
+                node = node.setdefault(char, {})
+            node[None] = 'short' if _is_short(word) else 'prefix'
+    return root
+
+def _trie_pattern(node):
+    """Regex for a trie node, trying longer keywords before shorter ones
+
+    Every keyword starts at a word boundary, so 'ml' no longer fires inside
+    'html'. Short keywords must also end at one (allowing a plural 's');
+    longer ones match as prefixes so 'plot' still covers 'plotting'.
+    """
+    branches = []
+    for char, child in sorted((k, v) for k, v in node.items() if k is not None):
+        atom = r'\s+' if char == ' ' else re.escape(char)
+        branches.append(atom + _trie_pattern(child))
+
+    end = node.get(None)
+    if end == 'short':
+        branches.append(r's?\b')
+    elif end == 'prefix':
+        branches.append('')
+
+    if len(branches) == 1 and end != 'short':
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')'
+
+def _keyword_ranks():
+    """Keyword -> best priority of any rule that fires when that keyword is matched
+
+    The trie pattern reports the longest keyword at a position, and every
+    prefix-style keyword it starts with matches there too ('graphql' also
+    matches 'graph'), so fold those prefixes' priorities in.
+    """
+    ranks = {}
+    for rank, (_, words) in enumerate(CATEGORY_RULES):
+        for word in words:
+            ranks.setdefault(word, rank)
+
+    return {
+        word: min([rank] + [
+            ranks[word[:i]] for i in range(1, len(word))
+            if word[:i] in ranks and not _is_short(word[:i])
+        ])
+        for word, rank in ranks.items()
+    }
+
+# The whole rule set as one trie-shaped alternation inside a lookahead, so a
+# single left-to-right finditer reports the keyword at every word start
+# (overlapping matches included) in time proportional to the text length
+_KEYWORD_REGEX = re.compile(r'\b(?=(' + _trie_pattern(_build_trie()) + '))')
+_KEYWORD_RANKS = _keyword_ranks()
+
+_NO_MATCH = len(CATEGORY_RULES)
+
+def _best_rank(text, limit=_NO_MATCH):
+    """Priority index of the best category matched in text, or limit if none beats it"""
+    best = limit
+    for match in _KEYWORD_REGEX.finditer(text):
+        word = ' '.join(match.group(1).split())
+        # Short keywords may have matched with a plural 's'
+        rank = _KEYWORD_RANKS.get(word)
+        if rank is None:
+            rank = _KEYWORD_RANKS[word[:-1]]
+        if rank < best:
+            best = rank
+            if best == 0:
+                break
+    return best
+
+@lru_cache(maxsize=4096)
+def _query_rank(query):
+    # Search queries repeat across every result they return, so scan each once
+    return _best_rank(query.lower())
+
+def categorize_library(library):
+    """Attempt to categorize a library based on its description and search query"""
+    query_rank = _query_rank(library.get('search_query') or '')
+    rank = _best_rank((library.get('description') or '').lower(), limit=query_rank)
+    return CATEGORY_RULES[rank][0] if rank < _NO_MATCH else DEFAULT_CATEGORY
+
+def categorize_libraries(libraries):
+    """Categorize a whole batch, returning one category per library in order"""
+    return [categorize_library(library) for library in libraries]
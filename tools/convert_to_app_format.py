@@ -1,50 +1,57 @@
 #!/usr/bin/env python3
 """
 Convert awesome_python_libraries.json to the app's libraries.js format
-"""
-
-import json
 
-# Load the extracted libraries
-with open('awesome_python_libraries.json', 'r', encoding='utf-8') as f:
-    libraries = json.load(f)
+libraries.js is columnar: one array per field instead of one object per
+library, with categories, domains and URL origins (https://github.com/ and
+the like) stored once in a string table and referenced by index. Columns are
+streamed to temporary files as records arrive and stitched together at the
+end, so the converter never holds the catalog's text in memory.
+tools/js_literals.py reads it back for the other tools.
 
-print(f"Loaded {len(libraries)} libraries")
+The site itself loads a sharded copy (assets/data/catalog/): a manifest with
+every library's name and category plus per-tag and per-popularity index
+lists, size-bounded shards with card summaries, full descriptions and links
+that the page fetches only for the cards and libraries it shows (see
+assets/js/catalog.js), and a prebuilt Fuse.js search index so the page never
+indexes the catalog itself.
+"""
 
-# Convert to app format (n, c, d, l)
-app_format = []
-for lib in libraries:
-    # Clean description
-    desc = lib['description'].replace('"', '\\"').replace('\n', ' ')
-    if len(desc) > 150:
-        desc = desc[:147] + "..."
+import argparse
+import glob
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import tempfile
 
-    # Use app_category if available, otherwise category
-    category = lib.get('app_category', lib.get('category', 'Utilities'))
+from dedup import iter_records, normalize_name
+from js_literals import load_catalog
 
-    app_format.append({
-        'n': lib['name'],
-        'c': category,
-        'd': desc,
-        'l': lib['url']
-    })
+DEFAULT_INPUT = 'awesome_python_libraries.json'
+DEFAULT_OUTPUT = 'assets/data/libraries.js'
+DEFAULT_SHARD_DIR = 'assets/data/catalog'
+MANIFEST = 'manifest.json'
+MAX_DESCRIPTION = 150
+NUMBERS_PER_LINE = 32
+SHARD_SIZE = 200            # libraries per detail shard
+SUMMARY_LENGTH = 110        # about what a card's three clamped lines show
 
-print(f"Converted {len(app_format)} libraries")
+# Tags like [JOURNALISM] appended to descriptions
+TAG_RE = re.compile(r'\s*\[([A-Z][A-Z ]*)\]')
 
-# Generate JavaScript code
-js_code = "// Python Libraries Data\n"
-js_code += "// Auto-generated from awesome-python collection\n\n"
-js_code += "export const rawLibraries = [\n"
+# Description phrases that set a library's base popularity on the page; checked in order
+POPULARITY_PHRASES = [('very widely used', 95), ('extremely popular', 95), ('widely used', 85), ('niche', 45)]
 
-for i, lib in enumerate(app_format):
-    comma = "," if i < len(app_format) - 1 else ""
-    js_code += f'    {{ n: "{lib["n"]}", c: "{lib["c"]}", d: "{lib["d"]}", l: "{lib["l"]}" }}{comma}\n'
+# Keys and weights the page's Fuse.js instance searches with (assets/js/app.js)
+SEARCH_KEYS = [('name', 0.4), ('description', 0.3), ('domain', 0.2), ('category', 0.1)]
 
-js_code += "];\n\n"
+HEADER = "// Python Libraries Data\n// Auto-generated from awesome-python collection\n\n"
 
-# Add domain mapping
-js_code += """// Domain mapping for categorization
-export const domainMap = {
+# Domain mapping for categorization
+DOMAIN_MAP = {
     "Web Frameworks": "Web", "HTTP Clients": "Web", "Web Content Extracting": "Web",
     "Web Crawling": "Web", "WebSocket": "Web", "WSGI Servers": "Web",
     "RESTful API": "Web", "ASGI Servers": "Web",
@@ -73,24 +80,308 @@ export const domainMap = {
     "Security": "Security", "Cryptography": "Security", "Authentication": "Security",
 
     "Utilities": "Utilities"
-};
-"""
+}
+
+class StringTable:
+    """Interns strings, handing out each distinct one's index in first-seen order"""
+
+    def __init__(self):
+        self.strings = []
+        self._index = {}
+
+    def intern(self, value):
+        if value not in self._index:
+            self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return self._index[value]
+
+def split_url(url):
+    """(origin with trailing slash, rest): https://github.com/psf/requests -> https://github.com/, psf/requests"""
+    scheme_end = url.find('://')
+    if scheme_end < 0:
+        return '', url
+    path_start = url.find('/', scheme_end + 3)
+    if path_start < 0:
+        return url, ''
+    return url[:path_start + 1], url[path_start + 1:]
+
+def app_record(lib, truncate=True):
+    """(name, category, description, url) in the app's terms for an extracted or existing library"""
+    # Clean description
+    desc = (lib.get('description') or '').replace('\n', ' ')
+    if truncate and len(desc) > MAX_DESCRIPTION:
+        desc = desc[:MAX_DESCRIPTION - 3] + "..."
+
+    # Use app_category if available, otherwise category
+    category = lib.get('app_category', lib.get('category', 'Utilities'))
+    return lib['name'], category, desc, lib.get('url') or lib.get('link') or ''
+
+def iter_input(path):
+    """Library records from an extracted .json/.ndjson file or an existing libraries.js
+
+    Descriptions in libraries.js have been edited by hand (and carry tags like
+    [JOURNALISM]), so they are kept whole; extracted ones get truncated.
+    """
+    if path.endswith('.js'):
+        return (app_record(lib, truncate=False) for lib in load_catalog(path))
+    return (app_record(lib) for lib in iter_records(path))
+
+def summarize(desc):
+    """Description without tags, cut at a word boundary to fit a card"""
+    text = TAG_RE.sub('', desc).strip()
+    if len(text) <= SUMMARY_LENGTH:
+        return text
+    cut = text.rfind(' ', 0, SUMMARY_LENGTH)
+    return text[:cut if cut > 0 else SUMMARY_LENGTH].rstrip(' ,.;:') + "…"
+
+def popularity(desc):
+    """Base popularity a description's wording implies, or None for the page's default"""
+    text = desc.lower()
+    return next((score for phrase, score in POPULARITY_PHRASES if phrase in text), None)
+
+def _write_json(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+def field_norm(value):
+    """Fuse.js's field-length norm: 1 / sqrt(number of space-separated tokens), to 3 places"""
+    tokens = len(re.findall(r'[^ ]+', value))
+    return math.floor(1000 / math.sqrt(tokens) + 0.5) / 1000
+
+class SearchIndexWriter:
+    """Fuse.js index over SEARCH_KEYS, streamed to a temporary file record by record
+
+    The output is what Fuse.createIndex(keys, libraries).toJSON() gives in
+    Fuse.js 7, so the page can hand it straight to Fuse.parseIndex. The
+    description indexed is the card summary; full descriptions stay in the
+    detail shards so a search never pulls them in.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.file = tempfile.TemporaryFile('w+', encoding='utf-8')
+
+    def add(self, name, category, desc):
+        fields = {'name': name, 'description': summarize(desc),
+                  'domain': DOMAIN_MAP.get(category, 'Utilities'), 'category': category}
+        values = {}
+        for key_index, (key, _) in enumerate(SEARCH_KEYS):
+            value = fields[key]
+            if value.strip():
+                values[str(key_index)] = {'v': value, 'n': field_norm(value)}
+
+        record = json.dumps({'i': self.count, '$': values}, ensure_ascii=False, separators=(',', ':'))
+        self.file.write(f"{',' if self.count else ''}{record}\n")
+        self.count += 1
+
+    def write(self, directory):
+        """Write search-index.<hash>.json into directory and return its name"""
+        keys = [{'path': [key], 'id': key, 'weight': weight, 'src': key} for key, weight in SEARCH_KEYS]
+        digest = hashlib.sha256()
+        tmp_path = os.path.join(directory, 'search-index.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as out:
+            def emit(text):
+                digest.update(text.encode('utf-8'))
+                out.write(text)
+
+            emit(f'{{"keys":{json.dumps(keys, separators=(",", ":"))},"records":[\n')
+            self.file.seek(0)
+            for line in self.file:
+                emit(line)
+            emit("]}\n")
+        self.file.close()
+
+        name = f"search-index.{digest.hexdigest()[:10]}.json"
+        os.replace(tmp_path, os.path.join(directory, name))
+        return name
+
+class ShardWriter:
+    """Streams libraries into detail shards of shard_size, then writes the manifest
+
+    The search index is written alongside. Shard and index files are named
+    after a hash of their content so browsers can cache them indefinitely;
+    only the manifest has to be revalidated. Files left over from earlier
+    runs are removed once the new manifest is in place.
+    """
+
+    def __init__(self, directory, table, shard_size=SHARD_SIZE):
+        self.directory = directory
+        self.table = table
+        self.shard_size = shard_size
+        self.summary = {'n': [], 'c': []}
+        self.tags = {}              # tag -> indexes of the libraries carrying it
+        self.popularity = {}        # base popularity -> indexes, for the few that aren't the default
+        self.shards = []
+        self._pending = {'s': [], 'd': [], 'o': [], 'l': []}
+        self.search = SearchIndexWriter()
+        os.makedirs(directory, exist_ok=True)
+
+    def add(self, name, category, desc, origin, rest):
+        index = len(self.summary['n'])
+        self.search.add(name, category, desc)
+        self.summary['n'].append(name)
+        self.summary['c'].append(self.table.intern(category))
+        for tag in TAG_RE.findall(desc):
+            self.tags.setdefault(tag, []).append(index)
+        score = popularity(desc)
+        if score is not None:
+            self.popularity.setdefault(str(score), []).append(index)
+        self._pending['s'].append(summarize(desc))
+        self._pending['d'].append(desc)
+        self._pending['o'].append(self.table.intern(origin))
+        self._pending['l'].append(rest)
+        if len(self._pending['d']) >= self.shard_size:
+            self._flush()
+
+    def _flush(self):
+        count = len(self._pending['d'])
+        if not count:
+            return
+        body = json.dumps(self._pending, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        name = f"shard-{len(self.shards):03d}.{hashlib.sha256(body).hexdigest()[:10]}.json"
+        tmp_path = os.path.join(self.directory, f"{name}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, os.path.join(self.directory, name))
+
+        start = sum(shard['count'] for shard in self.shards)
+        self.shards.append({'file': name, 'start': start, 'count': count, 'bytes': len(body)})
+        self._pending = {'s': [], 'd': [], 'o': [], 'l': []}
+
+    def close(self, domains):
+        self._flush()
+        search = self.search.write(self.directory)
+        _write_json(os.path.join(self.directory, MANIFEST), {
+            'count': len(self.summary['n']),
+            'strings': self.table.strings,
+            'domains': domains,
+            'summary': self.summary,
+            'tags': self.tags,
+            'popularity': self.popularity,
+            'shards': self.shards,
+            'search': search,
+        })
+
+        current = {shard['file'] for shard in self.shards} | {search}
+        for pattern in ('shard-*.json', 'search-index.*.json'):
+            for path in glob.glob(os.path.join(self.directory, pattern)):
+                if os.path.basename(path) not in current:
+                    os.remove(path)
+
+class _Column:
+    """One column's values, streamed to a temporary file as a JS array body"""
+
+    def __init__(self, numeric):
+        self.numeric = numeric
+        self.count = 0
+        self.file = tempfile.TemporaryFile('w+', encoding='utf-8')
+
+    def append(self, value):
+        self.count += 1
+        if self.numeric:
+            # Indexes are short, so they share lines
+            end = '\n' if self.count % NUMBERS_PER_LINE == 0 else ''
+            self.file.write(f"{value},{end}")
+        else:
+            self.file.write(f"{json.dumps(value, ensure_ascii=False)},\n")
+
+    def copy_to(self, out):
+        self.file.seek(0)
+        shutil.copyfileobj(self.file, out)
+        self.file.close()
+
+def write_catalog(records, output=DEFAULT_OUTPUT, shard_dir=None, shard_size=SHARD_SIZE):
+    """Stream (name, category, description, url) tuples into a columnar libraries.js
+
+    With shard_dir, the sharded copy the site loads is written there in the
+    same pass, sharing one string table. Libraries whose normalized name
+    already appeared are skipped. Returns {category: count} for what was
+    written. Files are replaced atomically.
+    """
+    table = StringTable()
+    shards = ShardWriter(shard_dir, table, shard_size) if shard_dir else None
+    columns = {'n': _Column(False), 'd': _Column(False), 'c': _Column(True), 'o': _Column(True), 'l': _Column(False)}
+    seen = set()
+    categories = {}
+
+    for name, category, desc, url in records:
+        key = normalize_name(name)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        origin, rest = split_url(url)
+        columns['n'].append(name)
+        columns['d'].append(desc)
+        columns['c'].append(table.intern(category))
+        columns['o'].append(table.intern(origin))
+        columns['l'].append(rest)
+        categories[category] = categories.get(category, 0) + 1
+        if shards:
+            shards.add(name, category, desc, origin, rest)
+
+    # Domains go in the same table, as flat [category, domain, ...] index pairs
+    domains = [table.intern(value) for pair in DOMAIN_MAP.items() for value in pair]
+
+    tmp_path = f"{output}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as out:
+        out.write(HEADER)
+        out.write("// Parallel columns: n name, d description, c category and o URL origin\n")
+        out.write("// (indexes into strings), l the rest of the URL. See tools/js_literals.py.\n")
+        out.write("export const columns = {\n")
+        for key, column in columns.items():
+            out.write(f"{key}: [\n")
+            column.copy_to(out)
+            out.write("\n],\n")
+        out.write("};\n\n")
+
+        out.write("export const strings = [\n")
+        out.write(''.join(f"{json.dumps(value, ensure_ascii=False)},\n" for value in table.strings))
+        out.write("];\n\n")
+
+        out.write("// [category, domain, ...] pairs of indexes into strings\n")
+        out.write(f"export const domains = {json.dumps(domains)};\n")
+    os.replace(tmp_path, output)
+
+    if shards:
+        shards.close(domains)
+
+    return categories
+
+def main():
+    parser = argparse.ArgumentParser(description="Write the app's columnar libraries.js")
+    parser.add_argument('inputs', nargs='*', default=[DEFAULT_INPUT],
+                        help="extracted .json/.ndjson libraries or an existing libraries.js; "
+                             f"the first occurrence of a name wins (default: {DEFAULT_INPUT})")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f"default: {DEFAULT_OUTPUT}")
+    parser.add_argument('--shard-dir', default=DEFAULT_SHARD_DIR,
+                        help=f"where the site's manifest and detail shards go (default: {DEFAULT_SHARD_DIR})")
+    parser.add_argument('--shard-size', type=int, default=SHARD_SIZE,
+                        help=f"libraries per detail shard (default: {SHARD_SIZE})")
+    parser.add_argument('--no-shards', action='store_true', help="only write libraries.js")
+    args = parser.parse_args()
 
-# Save to file
-output_file = 'assets/data/libraries.js'
-with open(output_file, 'w', encoding='utf-8') as f:
-    f.write(js_code)
+    def records():
+        for path in args.inputs:
+            print(f"📖 Loading {path}")
+            yield from iter_input(path)
 
-print(f"\n✅ Saved {len(app_format)} libraries to {output_file}")
+    shard_dir = None if args.no_shards else args.shard_dir
+    categories = write_catalog(records(), args.output, shard_dir, args.shard_size)
+    total = sum(categories.values())
+    print(f"\n✅ Saved {total} libraries to {args.output} ({os.path.getsize(args.output):,} bytes)")
+    if shard_dir:
+        manifest = os.path.join(shard_dir, MANIFEST)
+        print(f"✅ Saved {manifest} ({os.path.getsize(manifest):,} bytes) and its detail shards")
 
-# Print stats by category
-categories = {}
-for lib in app_format:
-    cat = lib['c']
-    categories[cat] = categories.get(cat, 0) + 1
+    # Print stats by category
+    print(f"\n📊 Libraries by Category:")
+    for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+        print(f"   {cat}: {count}")
 
-print(f"\n📊 Libraries by Category:")
-for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
-    print(f"   {cat}: {count}")
+    print(f"\nTotal: {total} libraries")
 
-print(f"\nTotal: {len(app_format)} libraries")
+if __name__ == "__main__":
+    main()
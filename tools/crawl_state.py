@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Crawl State
+Append-only JSONL journal of finished search pages, so an interrupted or
+partially failed scraper run resumes where it stopped instead of starting over
+"""
+
+import json
+import os
+import threading
+
+DEFAULT_JOURNAL = 'pypi_crawl_journal.jsonl'
+
+class CrawlJournal:
+    """Durable record of which (query, page) pairs are done and what they produced
+
+    Every finished page is appended as one JSON line and fsync'd before the
+    scraper moves on, so a crash loses at most the page in flight. Failed
+    pages are simply never written and stay in the frontier for the next run.
+    """
+
+    def __init__(self, path=DEFAULT_JOURNAL):
+        self.path = path
+        self._pages = {}        # (query, page) -> list of records
+        self._exhausted = {}    # query -> first page that came back empty
+        self._lock = threading.Lock()
+        self._load()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+
+        complete = 0    # end of the last newline-terminated line
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                complete += len(line)
+                try:
+                    entry = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+
+                if entry['event'] == 'page':
+                    self._pages[(entry['query'], entry['page'])] = entry['records']
+                elif entry['event'] == 'exhausted':
+                    self._exhausted[entry['query']] = min(
+                        entry['page'], self._exhausted.get(entry['query'], entry['page'])
+                    )
+
+        # A torn final line from a crash mid-write is cut off, so the next append
+        # starts on a fresh line instead of gluing onto it; that page is simply redone
+        if complete < os.path.getsize(self.path):
+            with open(self.path, 'r+b') as f:
+                f.truncate(complete)
+
+    def _append(self, entry):
+        with self._lock:
+            self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    @property
+    def completed_pages(self):
+        return len(self._pages)
+
+    def pending_pages(self, query, max_pages):
+        """Page numbers of query still to fetch (skips finished pages and pages past the end)"""
+        last = min(max_pages, self._exhausted.get(query, max_pages + 1) - 1)
+        return [page for page in range(1, last + 1) if (query, page) not in self._pages]
+
+    def pending(self, queries, max_pages):
+        """Total number of pages left in the frontier for these queries"""
+        return sum(len(self.pending_pages(query, max_pages)) for query in queries)
+
+    def record_page(self, query, page, records):
+        """Mark a page finished along with the records parsed from it"""
+        self._append({'event': 'page', 'query': query, 'page': page, 'records': records})
+        with self._lock:
+            self._pages[(query, page)] = records
+
+    def record_exhausted(self, query, page):
+        """Remember that query needs nothing from this page on (out of results, or not worth it)"""
+        self._append({'event': 'exhausted', 'query': query, 'page': page})
+        with self._lock:
+            self._exhausted[query] = min(page, self._exhausted.get(query, page))
+
+    def records(self, queries):
+        """All journaled records in query order, then page order"""
+        order = {query: i for i, query in enumerate(queries)}
+        with self._lock:
+            keys = sorted(self._pages, key=lambda key: (order.get(key[0], len(order)), key[1]))
+            return [record for key in keys for record in self._pages[key]]
+
+    def close(self):
+        self._file.close()
+
+    def finish(self):
+        """Close and delete the journal once its results are safely written elsewhere"""
+        self.close()
+        os.remove(self.path)
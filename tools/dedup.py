@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Library Deduplication
+PEP 503 name normalization plus an external-memory merge that deduplicates
+records from several sources (PyPI scrape, awesome list, curated list) while
+holding only one sorted run per source in memory at a time
+"""
+
+import argparse
+import heapq
+import itertools
+import json
+import os
+import re
+import tempfile
+
+DEFAULT_RUN_SIZE = 100000
+DEFAULT_PRIORITY = ['curated', 'awesome', 'pypi']
+
+def normalize_name(name):
+    """PEP 503 normalized project name: runs of -, _ and . become one dash, lowercased"""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+def deduplicate_libraries(libraries):
+    """Remove duplicate libraries based on PEP 503 normalized name, keeping the first"""
+    seen = set()
+    unique = []
+
+    for lib in libraries:
+        key = normalize_name(lib['name'])
+        if key not in seen:
+            seen.add(key)
+            unique.append(lib)
+
+    return unique
+
+def iter_records(path):
+    """Yield records from an .ndjson file (streamed) or a .json array"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.ndjson'):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
+def _write_run(entries, tmpdir):
+    entries.sort(key=lambda entry: (entry[0], entry[2]))
+    fd, path = tempfile.mkstemp(suffix='.run', dir=tmpdir)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    return path
+
+def sorted_runs(records, rank, tmpdir, run_size=DEFAULT_RUN_SIZE):
+    """Split records into sorted on-disk runs of at most run_size; returns the run paths
+
+    Each run line is [normalized name, source rank, sequence number, record].
+    The sequence number keeps the first occurrence within a source ahead of
+    later ones.
+    """
+    paths = []
+    entries = []
+    for seq, record in enumerate(records):
+        entries.append([normalize_name(record['name']), rank, seq, record])
+        if len(entries) >= run_size:
+            paths.append(_write_run(entries, tmpdir))
+            entries = []
+    if entries:
+        paths.append(_write_run(entries, tmpdir))
+    return paths
+
+def _read_run(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield json.loads(line)
+
+def merge_sources(sources, priority=DEFAULT_PRIORITY, run_size=DEFAULT_RUN_SIZE, tmpdir=None):
+    """K-way merge records from several sources, yielding one winner per normalized name
+
+    sources maps a source name to an iterable of records. When a name appears
+    in more than one source, the record from the source listed earliest in
+    priority wins (unlisted sources rank last, in the order given). Winners
+    come out sorted by normalized name, tagged with 'source' and with
+    'sources' listing every source that had the name.
+    """
+    order = list(priority) + [name for name in sources if name not in priority]
+    ranks = {name: i for i, name in enumerate(order)}
+
+    with tempfile.TemporaryDirectory(dir=tmpdir) as workdir:
+        runs = []
+        for name, records in sources.items():
+            runs.extend(sorted_runs(records, ranks[name], workdir, run_size))
+
+        merged = heapq.merge(*(_read_run(path) for path in runs),
+                             key=lambda entry: (entry[0], entry[1], entry[2]))
+
+        for _, group in itertools.groupby(merged, key=lambda entry: entry[0]):
+            group = list(group)
+            winner = dict(group[0][3])
+            winner['source'] = order[group[0][1]]
+            winner['sources'] = sorted({order[entry[1]] for entry in group}, key=ranks.get)
+            yield winner
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge and deduplicate library records from several sources")
+    parser.add_argument('--source', action='append', required=True, metavar='NAME=PATH',
+                        help="a source file (.json array or .ndjson); repeat for each source")
+    parser.add_argument('--priority', default=','.join(DEFAULT_PRIORITY),
+                        help=f"comma-separated source names, winner first (default: {','.join(DEFAULT_PRIORITY)})")
+    parser.add_argument('--run-size', type=int, default=DEFAULT_RUN_SIZE,
+                        help=f"records sorted in memory per run (default: {DEFAULT_RUN_SIZE})")
+    parser.add_argument('-o', '--output', default='merged_libraries.ndjson')
+    args = parser.parse_args()
+
+    sources = {}
+    for spec in args.source:
+        name, _, path = spec.partition('=')
+        if not path:
+            parser.error(f"--source must look like NAME=PATH, got {spec!r}")
+        sources[name] = iter_records(path)
+
+    print("=" * 60)
+    print("Library Deduplication")
+    print("=" * 60)
+
+    written = 0
+    by_source = {}
+    with open(args.output, 'w', encoding='utf-8') as f:
+        for record in merge_sources(sources, args.priority.split(','), args.run_size):
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            written += 1
+            by_source[record['source']] = by_source.get(record['source'], 0) + 1
+
+    print(f"\n✅ Saved {written:,} unique libraries to {args.output}")
+    print("\n📁 Winners by Source:")
+    for source, count in sorted(by_source.items(), key=lambda x: x[1], reverse=True):
+        print(f"  {source}: {count:,}")
+
+if __name__ == "__main__":
+    main()
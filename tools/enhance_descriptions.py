@@ -5,28 +5,12 @@ This script extracts library data and creates prompts for AI enhancement.
 """
 
 import json
-import re
+
+from js_literals import load_catalog
 
 def extract_libraries_from_js(filepath):
     """Extract library objects from the libraries.js file."""
-    with open(filepath, 'r') as f:
-        content = f.read()
-
-    # Find all library objects using regex
-    # Pattern: { n: "name", c: "category", d: "description", l: "link" }
-    pattern = r'\{\s*n:\s*"([^"]+)",\s*c:\s*"([^"]+)",\s*d:\s*"([^"]+)",\s*l:\s*"([^"]+)"\s*\}'
-    matches = re.findall(pattern, content)
-
-    libraries = []
-    for match in matches:
-        libraries.append({
-            'name': match[0],
-            'category': match[1],
-            'description': match[2],
-            'link': match[3]
-        })
-
-    return libraries
+    return load_catalog(filepath)
 
 def create_batch_file(libraries, batch_num, batch_size=50):
     """Create a JSON file with a batch of libraries for processing."""
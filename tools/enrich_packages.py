@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Package Detail Enrichment
+Fetches PyPI's JSON metadata for every package in a deduplicated list,
+concurrently over one pooled FetchEngine, and adds GitHub and docs links,
+license and release info. Progress is journaled as NDJSON so a job over
+thousands of packages can be interrupted and resumed.
+"""
+
+import argparse
+import json
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import requests
+
+from dedup import iter_records, normalize_name
+from fetch_engine import FetchEngine, PYPI_URL
+from http_cache import add_cache_arguments, cache_from_args
+
+JSON_API_URL = '{base}/pypi/{name}/json'
+DEFAULT_PROGRESS = 'pypi_details.ndjson'
+DEFAULT_OUTPUT = 'pypi_libraries_enriched.json'
+
+# The JSON API is served from PyPI's CDN, so it takes a much higher starting
+# rate than the search pages; rate control backs off if it pushes back
+ENRICH_WORKERS = 16
+ENRICH_RATE = 10.0
+ENRICH_BURST = 10
+
+GITHUB_RE = re.compile(r'https?://(?:www\.)?github\.com/([\w.-]+)/([\w.-]+)', re.IGNORECASE)
+DOCS_KEYS = ('documentation', 'docs', 'doc')
+DOCS_HOSTS = ('readthedocs.io', 'readthedocs.org', '.github.io', 'docs.')
+LICENSE_CLASSIFIER = 'License :: '
+MAX_LICENSE_LENGTH = 80     # longer license fields are usually the full license text
+
+def json_api_url(name, base_url=PYPI_URL):
+    return JSON_API_URL.format(base=base_url.rstrip('/'), name=normalize_name(name))
+
+def _project_links(info):
+    """(label, url) pairs from project_urls followed by the legacy home page field"""
+    links = list((info.get('project_urls') or {}).items())
+    if info.get('home_page'):
+        links.append(('Homepage', info['home_page']))
+    return [(label.lower(), url) for label, url in links if url]
+
+def _github_link(links):
+    for _, url in links:
+        match = GITHUB_RE.match(url)
+        if match:
+            repo = match.group(2).removesuffix('.git')
+            return f"https://github.com/{match.group(1)}/{repo}"
+    return None
+
+def _docs_link(links):
+    # An explicitly labelled docs link beats a URL that merely looks like one
+    for label, url in links:
+        if any(key in label for key in DOCS_KEYS):
+            return url
+    for _, url in links:
+        if any(host in url for host in DOCS_HOSTS) and 'github.com' not in url:
+            return url
+    return None
+
+def _license(info):
+    if info.get('license_expression'):
+        return info['license_expression']
+
+    text = (info.get('license') or '').strip()
+    if text and len(text) <= MAX_LICENSE_LENGTH and '\n' not in text:
+        return text
+
+    for classifier in info.get('classifiers') or []:
+        if classifier.startswith(LICENSE_CLASSIFIER):
+            return classifier.rsplit(' :: ', 1)[-1]
+    return None
+
+def _upload_times(files):
+    return [f.get('upload_time_iso_8601') or f.get('upload_time') for f in files]
+
+def extract_details(metadata):
+    """Enrichment fields from one PyPI JSON API document"""
+    info = metadata.get('info') or {}
+    links = _project_links(info)
+
+    # Yanked-only or file-less releases have no upload time to go by
+    first_uploads = [
+        min(times) for times in (
+            [t for t in _upload_times(files) if t] for files in (metadata.get('releases') or {}).values()
+        ) if times
+    ]
+    latest_uploads = [t for t in _upload_times(metadata.get('urls') or []) if t]
+
+    return {
+        'name': info.get('name'),
+        'summary': info.get('summary') or None,
+        'version': info.get('version'),
+        'license': _license(info),
+        'github': _github_link(links),
+        'docs': _docs_link(links),
+        'homepage': info.get('home_page') or (info.get('project_urls') or {}).get('Homepage'),
+        'requires_python': info.get('requires_python') or None,
+        'release_count': len(metadata.get('releases') or {}),
+        'first_release': min(first_uploads) if first_uploads else None,
+        'latest_release': max(latest_uploads) if latest_uploads else None,
+    }
+
+def package_details(engine, name, base_url=PYPI_URL):
+    """Enrichment record for one package; missing packages are recorded as such, not retried"""
+    try:
+        body = engine.fetch(json_api_url(name, base_url))
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            return {'name': name, 'missing': True}
+        raise
+
+    details = extract_details(json.loads(body))
+    details['name'] = details['name'] or name
+    return details
+
+class DetailJournal:
+    """Append-only NDJSON of finished packages, keyed by normalized name"""
+
+    def __init__(self, path=DEFAULT_PROGRESS):
+        self.path = path
+        self.details = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash mid-write; that package is simply redone
+                        continue
+                    self.details[record['key']] = record['details']
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def __contains__(self, name):
+        return normalize_name(name) in self.details
+
+    def record(self, name, details):
+        key = normalize_name(name)
+        self._file.write(json.dumps({'key': key, 'details': details}, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.details[key] = details
+
+    def get(self, name):
+        return self.details.get(normalize_name(name))
+
+    def close(self):
+        self._file.close()
+
+def enrich_all(engine, names, journal, window=None, base_url=PYPI_URL):
+    """Fetch details for every name not yet in the journal; returns (done, failed)
+
+    At most `window` requests are queued on the engine at once, so the job
+    never holds more than a few dozen futures no matter how long the list is.
+    """
+    window = window or engine.max_workers * 4
+    pending = iter([name for name in names if name not in journal])
+    in_flight = {}
+    done = failed = 0
+
+    def refill():
+        for name in pending:
+            in_flight[engine.submit(package_details, engine, name, base_url)] = name
+            if len(in_flight) >= window:
+                break
+
+    refill()
+    while in_flight:
+        finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in finished:
+            name = in_flight.pop(future)
+            try:
+                journal.record(name, future.result())
+                done += 1
+            except Exception as e:
+                # Not journaled, so the next run retries it
+                print(f"  ❌ {name}: {e}")
+                failed += 1
+            if (done + failed) % 500 == 0:
+                print(f"  📦 {done + failed:,} packages processed...")
+        refill()
+
+    return done, failed
+
+def merge_details(libraries, journal):
+    """Copy journaled details onto the library records; returns how many were enriched"""
+    enriched = 0
+    for lib in libraries:
+        details = journal.get(lib['name'])
+        if not details or details.get('missing'):
+            continue
+        for field, value in details.items():
+            if field == 'name' or value is None:
+                continue
+            if field == 'summary':
+                # Only fill in descriptions the scrapers couldn't find
+                if lib.get('description') in (None, '', "No description available"):
+                    lib['description'] = value
+                continue
+            lib[field] = value
+        enriched += 1
+    return enriched
+
+def main():
+    parser = argparse.ArgumentParser(description="Add PyPI metadata (links, license, releases) to a library list")
+    parser.add_argument('input', help="deduplicated libraries (.json array or .ndjson)")
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT,
+                        help=f"enriched JSON written once every package is done (default: {DEFAULT_OUTPUT})")
+    parser.add_argument('--progress', default=DEFAULT_PROGRESS,
+                        help=f"NDJSON journal used to resume interrupted runs (default: {DEFAULT_PROGRESS})")
+    parser.add_argument('--workers', type=int, default=ENRICH_WORKERS,
+                        help=f"concurrent fetch threads (default: {ENRICH_WORKERS})")
+    parser.add_argument('--rate', type=float, default=ENRICH_RATE,
+                        help=f"starting requests per second, adapted at runtime (default: {ENRICH_RATE})")
+    parser.add_argument('--base-url', default=PYPI_URL,
+                        help=f"PyPI, or a local stand-in such as pypi_standin.py (default: {PYPI_URL})")
+    add_cache_arguments(parser)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("PyPI Package Enrichment")
+    print("=" * 60)
+
+    libraries = list(iter_records(args.input))
+    journal = DetailJournal(args.progress)
+    print(f"\n📚 {len(libraries):,} packages, {len(journal.details):,} already enriched in {args.progress}")
+
+    with FetchEngine(max_workers=args.workers, rate=args.rate, burst=ENRICH_BURST,
+                     cache=cache_from_args(args)) as engine:
+        done, failed = enrich_all(engine, [lib['name'] for lib in libraries], journal,
+                                  base_url=args.base_url)
+    journal.close()
+
+    print(f"\n✅ Fetched details for {done:,} packages")
+    if failed:
+        print(f"⚠️  {failed:,} packages failed; rerun to retry them")
+        return
+
+    enriched = merge_details(libraries, journal)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(libraries, f, indent=2, ensure_ascii=False)
+    print(f"✅ Saved {enriched:,} enriched libraries to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+External Source Importers
+Streaming readers for the third-party library directories in external_content/,
+yielding the same records as extract_from_awesome.py (name, url, description,
+category):
+
+  .docx - word/document.xml is iterparsed straight out of the zip, one
+          paragraph at a time, without extracting the archive
+  .html - a saved "Top N libraries" article is fed through an incremental
+          tokenizer in chunks, so no tree of the page is ever built
+
+Neither ever holds more than one entry of its source in memory. An entry's
+url is only ever a link its source gives for the project itself; entries
+without one are yielded with an empty url rather than a guessed PyPI slug.
+"""
+
+import re
+import zipfile
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+from lxml import etree
+
+from categorizer import DEFAULT_CATEGORY, categorize_library
+
+CHUNK_SIZE = 64 * 1024
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+W = f'{{{W_NS}}}'
+DOCUMENT_PART = 'word/document.xml'
+RELS_PART = 'word/_rels/document.xml.rels'
+
+# Paragraph styles that start a new category (Heading1 is the document title)
+CATEGORY_STYLES = {'Heading2': 2, 'Heading3': 3}
+
+# Footnote-style citations ("...design[1].") and the "– " that follows an entry's name
+CITATION_RE = re.compile(r'\[\d+\]')
+LEADING_DASH_RE = re.compile(r'^\s*[-–—:]\s*')
+SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+# Browser text-highlight fragments the document's citation links carry
+TEXT_FRAGMENT = '#:~:'
+
+# Article headings look like "12. Scikit-learn"; the FAQ after the list does not
+NUMBERED_HEADING_RE = re.compile(r'^\s*\d+\.\s+(.+?)\s*$')
+
+# "Pillow (PIL)", and entries naming two libraries: "XGBoost & LightGBM", "PyQt / PySide"
+PARENTHETICAL_RE = re.compile(r'\s*\([^)]*\)')
+COMBINED_NAME_RE = re.compile(r'\s+[&/]\s+')
+
+# Most citations are articles about a library; only these identify the project itself
+CODE_HOSTS = {'github.com', 'gitlab.com', 'bitbucket.org', 'codeberg.org'}
+PYPI_HOST = 'pypi.org'
+
+UNRESOLVED_URL = ''
+
+def first_sentence(text):
+    """Collapse whitespace, drop citation markers and keep only the first sentence"""
+    text = ' '.join(CITATION_RE.sub('', text).split())
+    return SENTENCE_END_RE.split(text, maxsplit=1)[0]
+
+def split_names(name):
+    """The library names in an entry heading; [] when a part is not a library name
+
+    "XGBoost & LightGBM" is two libraries, but "Kafka / Streaming Libraries"
+    pairs a library with a description of a field, so it is skipped.
+    """
+    parts = COMBINED_NAME_RE.split(name)
+    if len(parts) == 1:
+        return parts
+    if any(len(PARENTHETICAL_RE.sub('', part).split()) != 1 for part in parts):
+        return []
+    return parts
+
+def _compact(text):
+    return re.sub(r'[^a-z0-9]', '', text.lower())
+
+def project_url(name, url):
+    """url if it points at the project itself (its repository, PyPI page or own site), else None
+
+    A repository or PyPI project must be named after it; a site must have the
+    project's name leading one of its host labels (djangoproject.com,
+    pandas.pydata.org, beautiful-soup-4.readthedocs.io).
+    """
+    key = _compact(PARENTHETICAL_RE.sub('', name))
+    parts = urlsplit(url)
+    host = parts.netloc.lower().removeprefix('www.')
+    if not key or not host:
+        return None
+
+    segments = [s for s in parts.path.split('/') if s]
+    if host in CODE_HOSTS:
+        return url if len(segments) >= 2 and _compact(segments[1].removesuffix('.git')) == key else None
+    if host == PYPI_HOST:
+        return url if len(segments) >= 2 and segments[0] == 'project' and _compact(segments[1]) == key else None
+
+    labels = re.split(r'[.-]', host)
+    runs = (''.join(labels[i:j]) for i in range(len(labels)) for j in range(i + 1, len(labels) + 1))
+    return url if any(run.startswith(key) for run in runs) else None
+
+def _hyperlink_targets(archive):
+    """Relationship id -> URL for every external hyperlink in the document"""
+    targets = {}
+    with archive.open(RELS_PART) as f:
+        for _, elem in etree.iterparse(f, events=('end',), tag=f'{{{REL_NS}}}Relationship'):
+            if elem.get('TargetMode') == 'External':
+                targets[elem.get('Id')] = elem.get('Target')
+            elem.clear()
+    return targets
+
+def _paragraph_parts(paragraph):
+    """(style, is list item, [(text, bold, hyperlink id)]) for one <w:p>"""
+    style = paragraph.find(f'{W}pPr/{W}pStyle')
+    style = style.get(f'{W}val') if style is not None else None
+    listed = paragraph.find(f'{W}pPr/{W}numPr') is not None
+
+    runs = []
+    for run in paragraph.iter(f'{W}r'):
+        text = ''.join(t.text or '' for t in run.iter(f'{W}t'))
+        bold = run.find(f'{W}rPr/{W}b') is not None
+        link = run.getparent().get(f'{{{R_NS}}}id') if run.getparent().tag == f'{W}hyperlink' else None
+        runs.append((text, bold, link))
+    return style, listed, runs
+
+def iter_docx_libraries(docx_file):
+    """Yield library records from a .docx directory of bulleted "**Name** – description" entries
+
+    Each entry's category is the nearest Heading2/Heading3 above it; its url
+    is the first source it cites that is the project's own (see
+    project_url()), or empty when it cites none. An entry naming two
+    libraries yields both.
+    """
+    with zipfile.ZipFile(docx_file) as archive:
+        links = _hyperlink_targets(archive)
+        headings = {}
+
+        with archive.open(DOCUMENT_PART) as f:
+            for _, paragraph in etree.iterparse(f, events=('end',), tag=f'{W}p'):
+                style, listed, runs = _paragraph_parts(paragraph)
+
+                # Done with this paragraph and everything before it
+                paragraph.clear()
+                while paragraph.getprevious() is not None:
+                    del paragraph.getparent()[0]
+
+                if style in CATEGORY_STYLES:
+                    level = CATEGORY_STYLES[style]
+                    headings = {lvl: text for lvl, text in headings.items() if lvl < level}
+                    headings[level] = ''.join(text for text, _, _ in runs).strip()
+                    continue
+
+                # Entries are list items that open with the library's name in bold
+                if not (listed and headings and runs and runs[0][1]):
+                    continue
+
+                name_end = next((i for i, (_, bold, _) in enumerate(runs) if not bold), len(runs))
+                name = ''.join(text for text, _, _ in runs[:name_end]).strip()
+                rest = runs[name_end:]
+                body = ''.join(text for text, _, _ in rest)
+                # Use cases and popularity notes follow the description proper
+                body = body.split('Use cases:', 1)[0]
+                cited = [links[link].split(TEXT_FRAGMENT, 1)[0] for _, _, link in rest if link in links]
+                description = first_sentence(LEADING_DASH_RE.sub('', body))
+
+                for library in split_names(name):
+                    own = (project_url(library, url) for url in cited)
+                    yield {
+                        'name': library,
+                        'url': next((url for url in own if url), UNRESOLVED_URL),
+                        'description': description,
+                        'category': headings[max(headings)]
+                    }
+
+class _ArticleParser(HTMLParser):
+    """Tokenizer for "N. Name" headings each followed by a description paragraph"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self._heading = None      # text of the <h2> being read
+        self._name = None         # entry waiting for its paragraph
+        self._paragraph = None    # text of that paragraph being read
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'h2':
+            self._heading = []
+        elif tag == 'p' and self._name is not None and self._paragraph is None:
+            self._paragraph = []
+
+    def handle_data(self, data):
+        if self._heading is not None:
+            self._heading.append(data)
+        elif self._paragraph is not None:
+            self._paragraph.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == 'h2' and self._heading is not None:
+            match = NUMBERED_HEADING_RE.match(''.join(self._heading))
+            self._heading = None
+            self._name = match.group(1) if match else None
+        elif tag == 'p' and self._paragraph is not None:
+            text = ' '.join(''.join(self._paragraph).split())
+            self._paragraph = None
+            if text:
+                self.records.append(self._record(self._name, text))
+            self._name = None
+
+    @staticmethod
+    def _record(name, text):
+        # The article has no sections and its paragraphs wander (use cases, related
+        # tools), so a name the rules know decides, else only the first sentence.
+        # categorize_library already speaks the app's categories, so that is app_category too
+        description = first_sentence(text)
+        category = categorize_library({'description': name})
+        if category == DEFAULT_CATEGORY:
+            category = categorize_library({'description': description})
+        # The article links to nothing, so no entry has a project url of its own
+        return {
+            'name': name,
+            'url': UNRESOLVED_URL,
+            'description': description,
+            'category': category,
+            'app_category': category
+        }
+
+def iter_html_libraries(html_file, chunk_size=CHUNK_SIZE):
+    """Yield library records from a saved article listing libraries as numbered <h2> headings"""
+    parser = _ArticleParser()
+    with open(html_file, 'r', encoding='utf-8', errors='replace') as f:
+        for chunk in iter(lambda: f.read(chunk_size), ''):
+            parser.feed(chunk)
+            yield from parser.records
+            parser.records.clear()
+    parser.close()
+    yield from parser.records
@@ -1,55 +1,117 @@
 #!/usr/bin/env python3
 """
-Extract libraries from awesome-python-collection.md
+Extract libraries from awesome-python-collection.md and other awesome-style lists
 This is more reliable than scraping PyPI
+
+Each list is memory-mapped and scanned with one precompiled pattern, so no
+file is ever read into a string or split into lines; several lists are parsed
+in parallel processes and their records written out as each one finishes.
+.docx directories and saved .html articles are read by external_sources.py.
 """
 
-import re
+import argparse
 import json
-
-def extract_libraries_from_markdown(md_file='awesome-python-collection.md'):
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from dedup import normalize_name
+from external_sources import iter_docx_libraries, iter_html_libraries
+
+DEFAULT_INPUT = 'awesome-python-collection.md'
+DEFAULT_OUTPUT = 'awesome_python_libraries.json'
+SNIPPET_SIZE = 200
+
+# One pass over the raw bytes finds both category headers (## Category Name)
+# and library entries (- [LibraryName](url) - Description, nested or not)
+LINE_RE = re.compile(
+    rb'^(?:##[ \t]+(?P<category>[^\r\n]+)'
+    rb'|[ \t]*[-*+][ \t]+\[(?P<name>[^\]\r\n]+)\]\((?P<url>[^)\r\n]+)\)[ \t]+-[ \t]+(?P<description>[^\r\n]+))',
+    re.MULTILINE,
+)
+
+def iter_libraries(md_file):
+    """Yield library records from an awesome-style markdown list, in file order"""
+    with open(md_file, 'rb') as f:
+        # mmap refuses empty files, and an empty list has nothing to yield anyway
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            current_category = None
+            for match in LINE_RE.finditer(mapped):
+                if match.group('category') is not None:
+                    current_category = match.group('category').decode('utf-8').strip()
+                    continue
+
+                # Skip if no category yet (the table of contents)
+                if not current_category:
+                    continue
+
+                yield {
+                    'name': match.group('name').decode('utf-8').strip(),
+                    'url': match.group('url').decode('utf-8').strip(),
+                    'description': match.group('description').decode('utf-8').strip(),
+                    'category': current_category
+                }
+
+def extract_libraries_from_markdown(md_file=DEFAULT_INPUT):
     """Parse the awesome-python markdown file"""
-    with open(md_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    libraries = []
-    current_category = None
-
-    # Split by lines
-    lines = content.split('\n')
-
-    for line in lines:
-        # Detect category headers (## Category Name)
-        if line.startswith('## '):
-            current_category = line[3:].strip()
-            continue
-
-        # Skip if no category yet
-        if not current_category:
-            continue
-
-        # Extract library entries (bullet points with links)
-        # Format: - [LibraryName](url) - Description
-        match = re.match(r'-\s+\[([^\]]+)\]\(([^\)]+)\)\s+-\s+(.+)', line)
-        if match:
-            name = match.group(1).strip()
-            url = match.group(2).strip()
-            description = match.group(3).strip()
-
-            libraries.append({
-                'name': name,
-                'url': url,
-                'description': description,
-                'category': current_category
-            })
-
-    return libraries
+    return list(iter_libraries(md_file))
+
+# File extension -> streaming reader yielding name, url, description, category
+SOURCE_READERS = {
+    '.md': iter_libraries,
+    '.docx': iter_docx_libraries,
+    '.html': iter_html_libraries,
+    '.htm': iter_html_libraries,
+}
+
+def extract_libraries(path):
+    """Every library record in one source list, read by the parser for its file type"""
+    return list(iter_source(path))
+
+def iter_source(path):
+    """Yield library records from a markdown list, .docx directory or saved .html article"""
+    reader = SOURCE_READERS.get(os.path.splitext(path)[1].lower())
+    if reader is None:
+        raise ValueError(f"Don't know how to read {path}")
+    return reader(path)
+
+def find_source_files(paths):
+    """Expand directories into the readable lists they contain; files are kept as given"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in sorted(names)
+                             if os.path.splitext(name)[1].lower() in SOURCE_READERS)
+        else:
+            files.append(path)
+    return files
+
+def extract_many(paths, workers=None):
+    """Yield (path, records) for each source list, in the order given
+
+    Lists are parsed in a process pool; each one's records come back as soon
+    as it and every list before it are done, so output can be written
+    incrementally while later lists are still being parsed. With one list or
+    one worker, records are streamed straight from the file instead.
+    """
+    if len(paths) <= 1 or workers == 1:
+        for path in paths:
+            yield path, iter_source(path)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from zip(paths, pool.map(extract_libraries, paths))
 
 def categorize_for_app(category):
     """Map awesome-python categories to our app categories"""
     mapping = {
         # Web
         'Web Frameworks': 'Web Frameworks',
+        'Web Development': 'Web Frameworks',
         'ASGI Servers': 'Web Frameworks',
         'WSGI Servers': 'Web Frameworks',
         'RESTful API': 'RESTful API',
@@ -60,10 +122,13 @@ def categorize_for_app(category):
 
         # Data Science
         'Data Analysis': 'Data Analysis',
+        'Data Analysis & Manipulation': 'Data Analysis',
         'Data Validation': 'Data Analysis',
         'Data Visualization': 'Data Visualization',
+        'Visualization': 'Data Visualization',
         'Science': 'Science',
         'Machine Learning': 'Machine Learning',
+        'Machine Learning & AI': 'Machine Learning',
         'Deep Learning': 'Deep Learning',
         'Natural Language Processing': 'Natural Language Processing',
         'Computer Vision': 'Computer Vision',
@@ -73,6 +138,7 @@ def categorize_for_app(category):
         'Database Drivers': 'Database',
         'ORM': 'ORM',
         'Data Engineering': 'Data Engineering',
+        'Data Engineering & Pipelines': 'Data Engineering',
         'Distributed Computing': 'Distributed Computing',
         'Task Queues': 'Task Queues',
 
@@ -113,37 +179,86 @@ def categorize_for_app(category):
 
     return mapping.get(category, 'Utilities')
 
+def write_libraries(batches, output):
+    """Stream (path, records) batches to output; returns (first SNIPPET_SIZE records, category counts)
+
+    .ndjson output gets one record per line, anything else a JSON array
+    written element by element. Libraries already seen in an earlier list
+    (by normalized name) are skipped, and so are entries whose source gives
+    no link to the project (no url), which may not be packages at all. The
+    file is replaced atomically.
+    """
+    seen = set()
+    first = []
+    categories = {}
+    ndjson = output.endswith('.ndjson')
+    tmp_path = f"{output}.tmp"
+
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        if not ndjson:
+            f.write('[')
+        for path, records in batches:
+            found = added = unresolved = 0
+            for lib in records:
+                found += 1
+                if not lib['url']:
+                    unresolved += 1
+                    continue
+                key = normalize_name(lib['name'])
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                # Categorize for our app, unless the reader already did
+                if 'app_category' not in lib:
+                    lib['app_category'] = categorize_for_app(lib['category'])
+                categories[lib['app_category']] = categories.get(lib['app_category'], 0) + 1
+                if len(first) < SNIPPET_SIZE:
+                    first.append(lib)
+
+                if ndjson:
+                    f.write(json.dumps(lib, ensure_ascii=False) + '\n')
+                else:
+                    f.write(',\n' if len(seen) > 1 else '\n')
+                    f.write(json.dumps(lib, indent=2, ensure_ascii=False))
+                added += 1
+            print(f"   {path}: {found} libraries, {added} new"
+                  + (f", {unresolved} skipped without a project link" if unresolved else ""))
+        if not ndjson:
+            f.write('\n]\n')
+    os.replace(tmp_path, output)
+
+    return first, categories
+
 def main():
+    parser = argparse.ArgumentParser(description="Extract libraries from awesome-style lists and library directories")
+    parser.add_argument('inputs', nargs='*', default=[DEFAULT_INPUT],
+                        help=f"markdown lists, .docx directories, saved .html articles, "
+                             f"or directories of them (default: {DEFAULT_INPUT})")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT,
+                        help=f"where to write every library, .json array or .ndjson (default: {DEFAULT_OUTPUT})")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="processes parsing lists in parallel (default: one per CPU)")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Awesome Python Library Extractor")
     print("=" * 60)
 
-    print("\n📖 Reading awesome-python-collection.md...")
-    libraries = extract_libraries_from_markdown()
-    print(f"   Found {len(libraries)} libraries")
-
-    # Categorize for our app
-    for lib in libraries:
-        lib['app_category'] = categorize_for_app(lib['category'])
-
-    # Get category stats
-    categories = {}
-    for lib in libraries:
-        cat = lib['app_category']
-        categories[cat] = categories.get(cat, 0) + 1
+    paths = find_source_files(args.inputs)
+    print(f"\n📖 Reading {len(paths)} list(s)...")
+    snippet_source, categories = write_libraries(extract_many(paths, args.workers), args.output)
+    print(f"   Found {sum(categories.values())} libraries")
 
     print(f"\n📊 Category Breakdown:")
     for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
         print(f"   {cat}: {count}")
 
-    # Save full data
-    with open('awesome_python_libraries.json', 'w', encoding='utf-8') as f:
-        json.dump(libraries, f, indent=2, ensure_ascii=False)
-    print(f"\n✅ Saved awesome_python_libraries.json")
+    print(f"\n✅ Saved {args.output}")
 
     # Generate HTML snippet format
     snippet_libs = []
-    for lib in libraries[:200]:  # Top 200 most relevant
+    for lib in snippet_source:  # Top 200 most relevant
         # Clean description
         desc = lib['description'].replace('"', '\\"')
         if len(desc) > 120:
@@ -176,7 +291,7 @@ def main():
 
     print("\n🎉 Extraction complete!")
     print(f"\n📋 Next steps:")
-    print("   1. Review awesome_python_libraries.json")
+    print(f"   1. Review {args.output}")
     print("   2. Copy content from libraries_snippet.txt")
     print("   3. Paste into rawLibraries array in index.html")
 
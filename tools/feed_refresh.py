@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Incremental Catalog Refresh
+Reads PyPI's RSS feeds of recent releases and newly added projects, and
+re-fetches and re-categorizes only the packages that changed since the last
+run's cursor, patching them into an existing catalog instead of re-scraping
+everything. Point --base-url at a local stand-in to run it offline.
+"""
+
+import argparse
+import json
+import os
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from lxml import etree
+
+from categorizer import categorize_library
+from dedup import iter_records, normalize_name
+from enrich_packages import package_details
+from fetch_engine import FetchEngine, PYPI_URL
+
+# Feed name -> path under the PyPI base URL; both list newest items first
+FEEDS = {
+    'updates': '/rss/updates.xml',      # latest releases of any project
+    'packages': '/rss/packages.xml',    # newly created projects
+}
+DEFAULT_CATALOG = 'pypi_libraries.json'
+DEFAULT_CURSOR = 'pypi_feed_cursor.json'
+REFRESH_WORKERS = 8
+REFRESH_RATE = 5.0
+CHUNK_SIZE = 16 * 1024
+
+# Enrichment fields kept current on records that already carry them
+DETAIL_FIELDS = ('license', 'github', 'docs', 'homepage', 'requires_python',
+                 'release_count', 'first_release', 'latest_release')
+
+def _parse_date(value):
+    # RFC 822 dates; "-0000" parses as naive, but feed times are always UTC
+    when = parsedate_to_datetime(value)
+    return when if when.tzinfo else when.replace(tzinfo=timezone.utc)
+
+def iter_feed_items(chunks):
+    """Yield (project name, published datetime) for each <item> of an RSS feed arriving in chunks"""
+    parser = etree.XMLPullParser(events=('end',), tag='item')
+
+    def items():
+        for _, elem in parser.read_events():
+            link = elem.findtext('link') or ''
+            published = elem.findtext('pubDate')
+            elem.clear()
+
+            # Links look like /project/<name>/ or /project/<name>/<version>/
+            parts = urlsplit(link.strip()).path.strip('/').split('/')
+            if len(parts) >= 2 and parts[0] == 'project' and published:
+                yield parts[1], _parse_date(published)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from items()
+    parser.close()
+    yield from items()
+
+def load_cursor(path):
+    """Feed name -> datetime of the newest item handled so far"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return {feed: _parse_date(value) for feed, value in json.load(f).items()}
+
+def save_cursor(path, cursor):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({feed: when.strftime('%a, %d %b %Y %H:%M:%S GMT') for feed, when in cursor.items()}, f, indent=2)
+    os.replace(tmp_path, path)
+
+def changed_since(engine, cursor, base_url=PYPI_URL):
+    """Names from every feed newer than its cursor; returns ({normalized: name}, new_cursor, new_projects)
+
+    Feeds are newest first, so each one is read only until it reaches
+    already-seen items and the rest of the download is dropped.
+    """
+    changed = {}
+    new_projects = set()
+    new_cursor = dict(cursor)
+
+    for feed, path in FEEDS.items():
+        since = cursor.get(feed)
+        response = engine.get(base_url.rstrip('/') + path, stream=True)
+        with response:
+            for name, published in iter_feed_items(response.iter_content(CHUNK_SIZE)):
+                if since is not None and published <= since:
+                    break
+                changed.setdefault(normalize_name(name), name)
+                if feed == 'packages':
+                    new_projects.add(normalize_name(name))
+                if feed not in new_cursor or published > new_cursor[feed]:
+                    new_cursor[feed] = published
+
+    return changed, new_cursor, new_projects
+
+def refreshed_record(details, existing=None):
+    """A catalog record for details from the JSON API, keeping what the old record knew"""
+    name = details['name']
+    record = dict(existing or {})
+    record.update({
+        'name': name,
+        'description': details['summary'] or record.get('description') or "No description available",
+        'version': details['version'] or "unknown",
+        'url': f"https://pypi.org/project/{name}/",
+    })
+    record.setdefault('created', (details['first_release'] or "unknown")[:10])
+    record.setdefault('search_query', '')
+    for field in DETAIL_FIELDS:
+        if field in record and details[field] is not None:
+            record[field] = details[field]
+
+    record['category'] = categorize_library(record)
+    return record
+
+def patch_catalog(path, updates, additions=()):
+    """Rewrite the catalog with changed records swapped in; returns (updated, removed, added)
+
+    updates maps normalized name -> new record, or None to drop the package.
+    The catalog's own format is kept: NDJSON is streamed through line by
+    line, a JSON array is rewritten whole. The file is replaced atomically.
+    """
+    updated = removed = 0
+    tmp_path = f"{path}.tmp"
+    ndjson = path.endswith('.ndjson')
+
+    def patched():
+        nonlocal updated, removed
+        for record in iter_records(path):
+            key = normalize_name(record['name'])
+            if key not in updates:
+                yield record
+            elif updates[key] is None:
+                removed += 1
+            else:
+                updated += 1
+                yield updates[key]
+        yield from additions
+
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        if ndjson:
+            for record in patched():
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        else:
+            records = list(patched())
+            records.sort(key=lambda x: x['name'].lower())
+            json.dump(records, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+    return updated, removed, len(additions)
+
+def refresh(engine, catalog, cursor_path=DEFAULT_CURSOR, base_url=PYPI_URL, add_new=False):
+    """One incremental refresh; returns (updated, removed, added)"""
+    cursor = load_cursor(cursor_path)
+    changed, new_cursor, new_projects = changed_since(engine, cursor, base_url)
+    print(f"\n📰 {len(changed)} packages changed since the last refresh")
+
+    # Only packages already in the catalog (plus brand-new projects, if asked) are touched
+    existing = {}
+    for record in iter_records(catalog):
+        key = normalize_name(record['name'])
+        if key in changed:
+            existing[key] = record
+    wanted = [key for key in changed if key in existing or (add_new and key in new_projects)]
+
+    updates = {}
+    additions = []
+    results = engine.map(lambda key: package_details(engine, changed[key], base_url), wanted)
+    for key, details in zip(wanted, results):
+        if details.get('missing'):
+            if key in existing:
+                print(f"  🗑️  {changed[key]}: no longer on PyPI")
+                updates[key] = None
+            continue
+
+        record = refreshed_record(details, existing.get(key))
+        print(f"  🔄 {record['name']} {record['version']} → {record['category']}")
+        if key in existing:
+            updates[key] = record
+        else:
+            additions.append(record)
+
+    counts = patch_catalog(catalog, updates, additions) if updates or additions else (0, 0, 0)
+
+    # Only advance once the catalog is safely written, so a failed run is redone
+    save_cursor(cursor_path, new_cursor)
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description="Patch a library catalog with packages changed since the last run")
+    parser.add_argument('--catalog', default=DEFAULT_CATALOG,
+                        help=f"catalog to patch in place, .json array or .ndjson (default: {DEFAULT_CATALOG})")
+    parser.add_argument('--cursor', default=DEFAULT_CURSOR,
+                        help=f"where the newest handled feed item is remembered (default: {DEFAULT_CURSOR})")
+    parser.add_argument('--add-new', action='store_true',
+                        help="also add newly created projects (for full-index catalogs)")
+    parser.add_argument('--base-url', default=PYPI_URL,
+                        help=f"PyPI (or a local stand-in) to read feeds and metadata from (default: {PYPI_URL})")
+    parser.add_argument('--workers', type=int, default=REFRESH_WORKERS,
+                        help=f"concurrent metadata fetches (default: {REFRESH_WORKERS})")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("PyPI Incremental Refresh")
+    print("=" * 60)
+
+    # No response cache: the point is to see metadata as it is right now
+    with FetchEngine(max_workers=args.workers, rate=REFRESH_RATE) as engine:
+        updated, removed, added = refresh(engine, args.catalog, args.cursor, args.base_url, args.add_new)
+
+    print(f"\n✅ Patched {args.catalog}: {updated} updated, {removed} removed, {added} added")
+
+if __name__ == "__main__":
+    main()
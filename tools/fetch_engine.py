@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Fetch Engine
+Thread-pooled HTTP fetching over one shared, pooled requests.Session,
+with adaptive per-host rate control instead of fixed sleeps
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import CacheMiss, conditional_headers
+from rate_control import DEFAULT_MAX_RETRIES, AdaptiveRateController
+
+PYPI_URL = 'https://pypi.org'    # scrapers take a base URL so they can be pointed at a stand-in
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# Politeness defaults: the old scrapers slept ~2s per page, so start each
+# host at one request every two seconds and let rate control take it from there
+DEFAULT_RATE = 0.5      # starting requests per second, per host
+DEFAULT_BURST = 2       # requests allowed back-to-back before throttling kicks in
+DEFAULT_WORKERS = 8
+
+class FetchEngine:
+    """Shared session + worker pool; use as a context manager
+
+    This is also the transport interface the scrapers are written against:
+    fetch(), get(), submit(), map() and close(). See transports.py for the
+    curl and Playwright variants.
+    """
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, rate=DEFAULT_RATE,
+                 burst=DEFAULT_BURST, timeout=30, headers=None, cache=None,
+                 max_retries=DEFAULT_MAX_RETRIES):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache = cache
+        self.controller = AdaptiveRateController(rate=rate, burst=burst,
+                                                 max_concurrency=max_workers, max_retries=max_retries)
+
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT})
+        if headers:
+            self.session.headers.update(headers)
+
+        # Size the connection pool to the worker count so no thread waits on a socket
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    def _send(self, url, **kwargs):
+        """One GET attempt; transports override this to send it some other way"""
+        return self.session.get(url, **kwargs)
+
+    def get(self, url, **kwargs):
+        """Rate-controlled GET on the shared session, retrying throttling; raises for HTTP errors"""
+        kwargs.setdefault('timeout', self.timeout)
+        response = self.controller.request(url, lambda: self._send(url, **kwargs))
+        response.raise_for_status()
+        return response
+
+    def fetch(self, url):
+        """GET url and return the body bytes, going through the response cache if set
+
+        Fresh cache hits cost no request at all; stale hits are revalidated
+        with If-None-Match / If-Modified-Since. In offline mode a URL that was
+        never cached raises CacheMiss.
+        """
+        if self.cache is None:
+            return self.get(url).content
+
+        entry = self.cache.lookup(url)
+        if entry is not None and (entry.fresh or self.cache.offline):
+            return entry.body
+        if self.cache.offline:
+            raise CacheMiss(url)
+
+        response = self.controller.request(url, lambda: self._send(
+            url, headers=conditional_headers(entry), timeout=self.timeout
+        ))
+        if response.status_code == 304 and entry is not None:
+            self.cache.revalidated(url, response.headers)
+            return entry.body
+
+        response.raise_for_status()
+        self.cache.store(url, response.content, response.headers)
+        return response.content
+
+    def submit(self, fn, *args, **kwargs):
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def map(self, fn, items):
+        """Run fn over items on the worker pool, yielding results in input order"""
+        return self._executor.map(fn, items)
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+HTTP Response Cache
+Persistent on-disk cache shared by the scrapers. Bodies are stored once per
+content hash, an SQLite index maps URLs to bodies along with their validators
+(ETag / Last-Modified), and the total size is capped with LRU eviction.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+DEFAULT_CACHE_DIR = '.scraper_cache'
+DEFAULT_TTL = 24 * 60 * 60              # seconds before an entry must be revalidated
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024   # total body bytes kept on disk
+
+class CacheMiss(Exception):
+    """Raised in offline mode when a URL has never been cached"""
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: bytes
+    etag: str
+    last_modified: str
+    fetched_at: float
+    fresh: bool
+
+class ResponseCache:
+    """Content-addressed response store with TTLs, revalidation and LRU eviction"""
+
+    def __init__(self, path=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL,
+                 max_bytes=DEFAULT_MAX_BYTES, offline=False):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self._bodies = os.path.join(path, 'bodies')
+        os.makedirs(self._bodies, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(path, 'index.sqlite3'), check_same_thread=False)
+        self._db.execute('''
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        ''')
+        self._db.execute('CREATE INDEX IF NOT EXISTS entries_lru ON entries (accessed_at)')
+        self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _body_path(self, digest):
+        return os.path.join(self._bodies, digest[:2], digest)
+
+    def lookup(self, url):
+        """Return the CacheEntry for url, or None if it isn't cached"""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT digest, etag, last_modified, fetched_at FROM entries WHERE url = ?', (url,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            digest, etag, last_modified, fetched_at = row
+            try:
+                with open(self._body_path(digest), 'rb') as f:
+                    body = f.read()
+            except FileNotFoundError:
+                # Body was removed behind our back; treat as never cached
+                self._db.execute('DELETE FROM entries WHERE url = ?', (url,))
+                self._db.commit()
+                return None
+
+            self._db.execute('UPDATE entries SET accessed_at = ? WHERE url = ?', (time.time(), url))
+            self._db.commit()
+
+        fresh = (time.time() - fetched_at) < self.ttl
+        return CacheEntry(url, body, etag, last_modified, fetched_at, fresh)
+
+    def store(self, url, body, headers):
+        """Save a 200 response body and its validators"""
+        digest = hashlib.sha256(body).hexdigest()
+        body_path = self._body_path(digest)
+
+        # Identical bodies (e.g. the same page under two URLs) are written only once
+        if not os.path.exists(body_path):
+            os.makedirs(os.path.dirname(body_path), exist_ok=True)
+            tmp_path = f"{body_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, body_path)
+
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (url, digest, len(body), headers.get('ETag'), headers.get('Last-Modified'), now, now)
+            )
+            self._db.commit()
+            self._evict()
+
+    def revalidated(self, url, headers):
+        """Mark an entry fresh again after a 304 Not Modified"""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                '''UPDATE entries SET fetched_at = ?, accessed_at = ?,
+                   etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified)
+                   WHERE url = ?''',
+                (now, now, headers.get('ETag'), headers.get('Last-Modified'), url)
+            )
+            self._db.commit()
+
+    def _evict(self):
+        """Drop least-recently-used entries until unique body bytes fit under max_bytes"""
+        total = self._db.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM entries)'
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for url, digest, size in self._db.execute(
+            'SELECT url, digest, size FROM entries ORDER BY accessed_at'
+        ).fetchall():
+            self._db.execute('DELETE FROM entries WHERE url = ?', (url,))
+            still_used = self._db.execute(
+                'SELECT 1 FROM entries WHERE digest = ? LIMIT 1', (digest,)
+            ).fetchone()
+            if not still_used:
+                try:
+                    os.remove(self._body_path(digest))
+                except FileNotFoundError:
+                    pass
+                total -= size
+            if total <= self.max_bytes:
+                break
+        self._db.commit()
+
+def conditional_headers(entry):
+    """Request headers that let the server answer 304 for an unchanged entry"""
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+    return headers
+
+def add_cache_arguments(parser):
+    """Register the shared --cache-* / --offline flags on an argparse parser"""
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f"response cache directory (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_TTL,
+                        help="seconds before a cached page is revalidated (default: 1 day)")
+    parser.add_argument('--cache-max-mb', type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                        help="cache size cap in MB; least recently used pages are evicted")
+    parser.add_argument('--offline', action='store_true',
+                        help="serve everything from the cache and never touch the network")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="bypass the response cache entirely")
+
+def cache_from_args(args):
+    """Build a ResponseCache from parsed add_cache_arguments flags (None if disabled)"""
+    if args.no_cache:
+        return None
+    return ResponseCache(
+        path=args.cache_dir,
+        ttl=args.cache_ttl,
+        max_bytes=int(args.cache_max_mb * 1024 * 1024),
+        offline=args.offline
+    )
@@ -4,52 +4,63 @@ Library Integration Tool
 Helps compare and integrate newly discovered libraries with existing ones
 """
 
+import argparse
 import json
-import re
+import os
 
-def load_existing_libraries_from_html(html_file='index.html'):
-    """Extract existing libraries from index.html"""
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Find the rawLibraries array
-    match = re.search(r'const rawLibraries = \[(.*?)\];', content, re.DOTALL)
-    if not match:
-        print("❌ Could not find rawLibraries array in HTML")
-        return []
+from dedup import iter_records, normalize_name
+from js_literals import LiteralError, load_catalog
+from near_duplicates import find_near_duplicates
 
-    array_content = match.group(1)
+DEFAULT_EXISTING = ['assets/data/libraries.js', 'index.html']
+DEFAULT_DISCOVERED = 'awesome_python_libraries.json'
 
-    # Parse library objects
-    existing = []
-    pattern = r'\{\s*n:\s*"([^"]+)",\s*c:\s*"([^"]+)",\s*d:\s*"([^"]+)",\s*l:\s*"([^"]+)"\s*\}'
+def load_existing_libraries(path):
+    """Extract the libraries in libraries.js (columnar or not) or an HTML page that inlines rawLibraries
 
-    for match in re.finditer(pattern, array_content):
-        existing.append({
-            'name': match.group(1),
-            'category': match.group(2),
-            'description': match.group(3),
-            'link': match.group(4)
-        })
+    Exits if the data is there but cannot be read: carrying on without it
+    would propose every discovered library as new.
+    """
+    try:
+        existing = load_catalog(path)
+    except LiteralError as e:
+        raise SystemExit(f"❌ Could not read library data in {path}: {e}")
 
+    if not existing:
+        print(f"⚠️  No library data in {path}")
     return existing
 
-def find_new_libraries(existing, discovered_file='awesome_python_libraries.json'):
-    """Find libraries that aren't in the existing collection"""
-    try:
-        with open(discovered_file, 'r', encoding='utf-8') as f:
-            discovered = json.load(f)
-    except FileNotFoundError:
+def load_existing_libraries_from_html(html_file='index.html'):
+    """Extract existing libraries from index.html"""
+    return load_existing_libraries(html_file)
+
+def build_name_index(existing):
+    """Normalized name -> library, built once so every membership check is a dict lookup"""
+    index = {}
+    for lib in existing:
+        index.setdefault(normalize_name(lib['name']), lib)
+    return index
+
+def find_new_libraries(existing, discovered_file=DEFAULT_DISCOVERED):
+    """Find libraries that aren't in the existing collection
+
+    existing is a list of libraries or an index from build_name_index().
+    discovered_file may be a JSON array or a streamed .ndjson catalog (the
+    full PyPI index, say); names are compared PEP 503-normalized, and a name
+    discovered twice is only proposed once.
+    """
+    index = existing if isinstance(existing, dict) else build_name_index(existing)
+    if not os.path.exists(discovered_file):
         print(f"❌ {discovered_file} not found. Run extract_from_awesome.py first!")
         return []
 
-    # Create set of existing library names (lowercase for comparison)
-    existing_names = {lib['name'].lower() for lib in existing}
-
     # Find new libraries
+    seen = set()
     new_libs = []
-    for lib in discovered:
-        if lib['name'].lower() not in existing_names:
+    for lib in iter_records(discovered_file):
+        key = normalize_name(lib['name'])
+        if key not in index and key not in seen:
+            seen.add(key)
             new_libs.append(lib)
 
     return new_libs
@@ -59,38 +70,59 @@ def generate_html_snippet(libraries):
     snippet = []
 
     for lib in libraries:
-        # Clean up the description for HTML
-        desc = lib['description'].replace('"', '\\"')
-
         # Truncate long descriptions
+        desc = lib['description']
         if len(desc) > 150:
             desc = desc[:147] + "..."
 
         # Use app_category if available, otherwise category
         category = lib.get('app_category', lib.get('category', 'Utilities'))
 
-        snippet.append(
-            f'{{ n: "{lib["name"]}", c: "{category}", d: "{desc}", l: "{lib["url"]}" }},'
-        )
+        # JSON strings are valid JS strings, so quotes and backslashes survive the round trip
+        fields = [json.dumps(value, ensure_ascii=False) for value in (lib['name'], category, desc, lib['url'])]
+        snippet.append('{{ n: {}, c: {}, d: {}, l: {} }},'.format(*fields))
 
     return "\n            ".join(snippet)
 
 def main():
     """Main integration process"""
+    parser = argparse.ArgumentParser(description="Compare discovered libraries with the app's collection")
+    parser.add_argument('--existing', nargs='+', default=DEFAULT_EXISTING,
+                        help=f"libraries.js or pages inlining rawLibraries (default: {' '.join(DEFAULT_EXISTING)})")
+    parser.add_argument('--discovered', default=DEFAULT_DISCOVERED,
+                        help=f"discovered libraries, .json array or .ndjson (default: {DEFAULT_DISCOVERED})")
+    parser.add_argument('--keep-near-duplicates', action='store_true',
+                        help="propose libraries that look like renamed or forked existing ones as new too")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Library Integration Tool")
     print("=" * 60)
 
     # Load existing libraries
-    print("\n📖 Loading existing libraries from index.html...")
-    existing = load_existing_libraries_from_html()
-    print(f"   Found {len(existing)} existing libraries")
+    existing = []
+    for path in args.existing:
+        if os.path.exists(path):
+            print(f"\n📖 Loading existing libraries from {path}...")
+            existing.extend(load_existing_libraries(path))
+    index = build_name_index(existing)
+    print(f"   Found {len(index)} existing libraries")
 
     # Load discovered libraries
-    print("\n🔍 Loading discovered libraries from PyPI...")
-    new_libs = find_new_libraries(existing)
+    print(f"\n🔍 Loading discovered libraries from {args.discovered}...")
+    new_libs = find_new_libraries(index, args.discovered)
     print(f"   Found {len(new_libs)} new libraries not in current collection")
 
+    # Aliases and forks (opencv-python for opencv) slip past exact name matching
+    print("\n🧬 Checking for near-duplicates...")
+    near_dupes = find_near_duplicates(existing, new_libs)
+    print(f"   Found {len(near_dupes)} likely duplicates of existing or other new libraries")
+    for dupe in near_dupes[:10]:
+        print(f"   {dupe['candidate']['name']} ≈ {dupe['match']['name']} ({dupe['reason']})")
+    if not args.keep_near_duplicates:
+        dupe_ids = {id(dupe['candidate']) for dupe in near_dupes}
+        new_libs = [lib for lib in new_libs if id(lib) not in dupe_ids]
+
     if not new_libs:
         print("\n✅ No new libraries to add! Your collection is comprehensive.")
         return
@@ -126,8 +158,9 @@ def main():
     # 3. Detailed report
     with open('integration_report.md', 'w', encoding='utf-8') as f:
         f.write("# Library Integration Report\n\n")
-        f.write(f"**Existing Libraries**: {len(existing)}\n")
-        f.write(f"**Newly Discovered**: {len(new_libs)}\n\n")
+        f.write(f"**Existing Libraries**: {len(index)}\n")
+        f.write(f"**Newly Discovered**: {len(new_libs)}\n")
+        f.write(f"**Likely Duplicates**: {len(near_dupes)}\n\n")
 
         f.write("## Recommended Additions\n\n")
         f.write("These are popular/well-known libraries that should be considered:\n\n")
@@ -154,13 +187,20 @@ def main():
             for lib in sorted(by_category[cat], key=lambda x: x['name']):
                 f.write(f"- **{lib['name']}**: {lib['description']}\n")
 
+        if near_dupes:
+            f.write("\n## Likely Duplicates\n\n")
+            f.write("These look like renamed, aliased or forked versions of libraries already listed:\n\n")
+            for dupe in near_dupes:
+                scores = ', '.join(f"{view} {score:.2f}" for view, score in dupe['scores'].items())
+                f.write(f"- **{dupe['candidate']['name']}** ≈ **{dupe['match']['name']}** ({scores})\n")
+
     print("   ✅ Saved integration_report.md")
 
     print("\n🎉 Integration files generated!")
     print("\n📋 Next steps:")
     print("   1. Review integration_report.md for recommended additions")
-    print("   2. Copy relevant entries from new_libraries_snippet.txt")
-    print("   3. Paste into the rawLibraries array in index.html")
+    print("   2. Trim new_libraries.json to the libraries you want")
+    print("   3. Run: python3 tools/convert_to_app_format.py assets/data/libraries.js new_libraries.json")
     print("   4. Refresh your browser to see the new libraries")
 
 if __name__ == "__main__":
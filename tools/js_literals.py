@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+JS Library Literal Reader
+Tokenizes the `const rawLibraries = [ { n: "...", c: "...", d: "...", l: "..." }, ... ]`
+array index.html and older libraries.js files hold, and the columnar exports
+convert_to_app_format.py now writes, so escaped quotes, single-quoted strings,
+comments and trailing commas are read the way a browser would instead of
+being skipped by a regex
+"""
+
+import re
+
+DEFAULT_ARRAY = 'rawLibraries'
+
+# Short keys used in the app's data -> record fields
+FIELD_KEYS = {'n': 'name', 'c': 'category', 'd': 'description', 'l': 'link'}
+
+TOKEN_RE = re.compile(r'''
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>"(?:[^"\\\n]|\\.|\\\n)*"|'(?:[^'\\\n]|\\.|\\\n)*'|`(?:[^`\\$]|\\.|\$(?!\{))*`)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)
+  | (?P<punct>[{}\[\]():,;=.])
+''', re.VERBOSE | re.DOTALL)
+
+ESCAPE_RE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)', re.DOTALL)
+SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+                  '\n': '', '\r\n': ''}
+
+class LiteralError(ValueError):
+    """The array is not in the { key: "string", ... } format the app uses"""
+
+def _unescape_one(match):
+    escape = match.group(1)
+    if escape[0] in 'ux' and len(escape) > 1:
+        return chr(int(escape[1:].strip('{}'), 16))
+    return SIMPLE_ESCAPES.get(escape, escape)
+
+def js_string(token):
+    """The value of a JS string literal token, quotes included"""
+    value = ESCAPE_RE.sub(_unescape_one, token[1:-1])
+    # \uD83D\uDE00-style pairs come out as lone surrogates; join them up
+    return value.encode('utf-16', 'surrogatepass').decode('utf-16')
+
+def iter_tokens(text, pos=0):
+    """Yield (kind, value, offset) for each significant token from pos on"""
+    end = len(text)
+    while pos < end:
+        match = TOKEN_RE.match(text, pos)
+        if not match:
+            yield 'other', text[pos], pos
+            pos += 1
+            continue
+        if match.lastgroup != 'space':
+            yield match.lastgroup, match.group(), pos
+        pos = match.end()
+
+def _line(text, offset):
+    return text.count('\n', 0, offset) + 1
+
+def _next(tokens, text):
+    token = next(tokens, None)
+    if token is None:
+        raise LiteralError(f"line {_line(text, len(text))}: unexpected end of file")
+    return token
+
+def _fail(text, token, wanted):
+    _, value, offset = token
+    raise LiteralError(f"line {_line(text, offset)}: expected {wanted}, found {value!r}")
+
+KEYWORDS = {'true': True, 'false': False, 'null': None}
+
+def parse_literal(tokens, text, token):
+    """The Python value of the JS literal starting at token (array, object, string, number, keyword)"""
+    kind, value, _ = token
+    if kind == 'string':
+        return js_string(value)
+    if kind == 'number':
+        return float(value) if any(c in value for c in '.eE') else int(value)
+    if kind == 'name' and value in KEYWORDS:
+        return KEYWORDS[value]
+
+    if value == '[':
+        items = []
+        while True:
+            token = _next(tokens, text)
+            if token[1] == ']':
+                return items
+            items.append(parse_literal(tokens, text, token))
+            token = _next(tokens, text)
+            if token[1] == ']':
+                return items
+            if token[1] != ',':
+                _fail(text, token, ", or ]")
+
+    if value == '{':
+        obj = {}
+        while True:
+            token = _next(tokens, text)
+            kind, key, _ = token
+            if key == '}':
+                return obj
+            if kind not in ('name', 'string', 'number'):
+                _fail(text, token, "a key or }")
+            key = js_string(key) if kind == 'string' else key
+            token = _next(tokens, text)
+            if token[1] != ':':
+                _fail(text, token, ":")
+            obj[key] = parse_literal(tokens, text, _next(tokens, text))
+            token = _next(tokens, text)
+            if token[1] == '}':
+                return obj
+            if token[1] != ',':
+                _fail(text, token, ", or }")
+
+    _fail(text, token, "a literal")
+
+def _find_assignment(tokens, target):
+    """Advance tokens past `target = `; False if target is never assigned"""
+    previous = None
+    for _, value, _ in tokens:
+        if value == target and previous != '.':
+            _, value, _ = next(tokens, (None, None, None))
+            if value == '=':
+                return True
+        previous = value
+    return False
+
+def iter_library_literals(text, array=DEFAULT_ARRAY):
+    """Yield one record per object in `array = [ ... ]`, with n/c/d/l spelled out
+
+    Returns nothing if the array isn't defined in text. Raises LiteralError
+    (with the line number) on anything it cannot read, rather than dropping
+    the entry.
+    """
+    tokens = iter_tokens(text)
+    if not _find_assignment(tokens, array):
+        return
+
+    token = _next(tokens, text)
+    if token[1] != '[':
+        _fail(text, token, "[")
+    while True:
+        token = _next(tokens, text)
+        if token[1] == ']':
+            return
+        if token[1] != '{':
+            _fail(text, token, "{ or ]")
+
+        entry = parse_literal(tokens, text, token)
+        if 'n' not in entry:
+            raise LiteralError(f"line {_line(text, token[2])}: library entry without a name")
+        yield {FIELD_KEYS.get(key, key): value for key, value in entry.items()}
+
+        token = _next(tokens, text)
+        if token[1] == ']':
+            return
+        if token[1] != ',':
+            _fail(text, token, ", or ]")
+
+def read_exports(text):
+    """Name -> value for every `export const NAME = <literal>` in a data module"""
+    exports = {}
+    tokens = iter_tokens(text)
+    for _, value, _ in tokens:
+        if value != 'export':
+            continue
+        declaration = [_next(tokens, text) for _ in range(3)]
+        if declaration[0][1] in ('const', 'let', 'var') and declaration[2][1] == '=':
+            exports[declaration[1][1]] = parse_literal(tokens, text, _next(tokens, text))
+    return exports
+
+def iter_columnar_records(exports):
+    """Records from the columnar catalog convert_to_app_format.py writes
+
+    columns holds parallel arrays: n (name), d (description), c (category as
+    an index into strings), o (URL origin as an index into strings) and l (the
+    rest of the URL).
+    """
+    strings = exports['strings']
+    columns = exports['columns']
+    for name, description, category, origin, rest in zip(
+            columns['n'], columns['d'], columns['c'], columns['o'], columns['l']):
+        yield {
+            'name': name,
+            'category': strings[category],
+            'description': description,
+            'link': strings[origin] + rest,
+        }
+
+def load_library_literals(path, array=DEFAULT_ARRAY):
+    """Every library record in the array defined in a .js or .html file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(iter_library_literals(f.read(), array))
+
+def load_catalog(path):
+    """Every library record in a libraries.js, columnar or a rawLibraries array of objects"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    exports = read_exports(text)
+    if 'columns' in exports:
+        return list(iter_columnar_records(exports))
+    return list(iter_library_literals(text))
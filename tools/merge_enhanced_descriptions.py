@@ -4,8 +4,8 @@ Merge enhanced descriptions from all batches back into libraries.js
 Also adds journalism/media relevance tags
 """
 
-import json
-import re
+from convert_to_app_format import write_catalog
+from js_literals import load_catalog
 
 # All enhanced descriptions from the 7 batches
 enhanced_descriptions = {
@@ -400,34 +400,24 @@ journalism_relevant = [
 
 def main():
     # Read current libraries.js
-    with open('../assets/data/libraries.js', 'r') as f:
-        content = f.read()
+    libraries = load_catalog('../assets/data/libraries.js')
 
-    # Find all library objects
-    pattern = r'\{\s*n:\s*"([^"]+)",\s*c:\s*"([^"]+)",\s*d:\s*"([^"]+)",\s*l:\s*"([^"]+)"\s*\}'
+    def merged():
+        for lib in libraries:
+            name = lib['name']
 
-    def replace_description(match):
-        name = match.group(1)
-        category = match.group(2)
-        old_desc = match.group(3)
-        link = match.group(4)
+            # Get enhanced description if available
+            new_desc = enhanced_descriptions.get(name, lib['description'])
 
-        # Get enhanced description if available
-        new_desc = enhanced_descriptions.get(name, old_desc)
+            # Add journalism tag if relevant
+            journalism_tag = ""
+            if name in journalism_relevant:
+                journalism_tag = ' [JOURNALISM]'
 
-        # Add journalism tag if relevant
-        journalism_tag = ""
-        if name in journalism_relevant:
-            journalism_tag = ' [JOURNALISM]'
-
-        return f'{{ n: "{name}", c: "{category}", d: "{new_desc}{journalism_tag}", l: "{link}" }}'
-
-    # Replace all descriptions
-    new_content = re.sub(pattern, replace_description, content)
+            yield name, lib['category'], f"{new_desc}{journalism_tag}", lib['link']
 
     # Write updated content
-    with open('../assets/data/libraries.js', 'w') as f:
-        f.write(new_content)
+    write_catalog(merged(), '../assets/data/libraries.js', '../assets/data/catalog')
 
     print(f"✓ Updated {len(enhanced_descriptions)} library descriptions")
     print(f"✓ Tagged {len(journalism_relevant)} libraries as journalism-relevant")
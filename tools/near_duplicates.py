@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Library Detection
+MinHash signatures over three views of each library (name n-grams, URL
+n-grams and description words) are bucketed with locality-sensitive hashing,
+so only libraries that share a bucket are ever compared. Finding likely
+duplicates (opencv / opencv-python, beautifulsoup / beautifulsoup4, forks of
+the same project) takes roughly linear time instead of comparing every pair.
+Libraries that point at the same PyPI project are matched exactly first.
+"""
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from dedup import normalize_name
+
+NUM_PERM = 64
+BANDS = 8                       # 8 bands of 8 rows: pairs collide from about 0.77 similarity up
+MAX_BUCKET = 50                 # a band shared by more libraries than this is too generic to go on
+SEED = 503
+
+# Jaccard similarity at which each view alone marks a pair as a likely duplicate
+THRESHOLDS = {'name': 0.8, 'url': 0.8, 'description': 0.7}
+MIN_DESCRIPTION_WORDS = 4       # shorter descriptions are too generic to match on
+
+# Packaging affixes that don't change what a project is. Digits stay: h2/h11
+# and pyqt5/pyqt6 are different projects
+NAME_AFFIX_RE = re.compile(r'^(?:python|py)-|-(?:python3?|py3?)$')
+# Markdown escapes (vowpal\_porpoise) and qualifiers ("Pillow (PIL)", "Selenium (with Python)")
+MARKDOWN_ESCAPE_RE = re.compile(r'\\([\\`*_{}\[\]()#+\-.!|])')
+QUALIFIER_RE = re.compile(r'\s+\([^)]*\)')
+WORD_RE = re.compile(r'[a-z0-9]+')
+STOPWORDS = frozenset('''
+    a an and are as at be by for from in into is it its of on or that the this to with
+    python library libraries package module framework tool tools your you using use
+'''.split())
+
+def name_stem(name):
+    """Normalized name without qualifiers, separators or python-/-py style affixes
+
+    "Beautiful Soup", "beautifulsoup" and "beautiful_soup" share a stem, and
+    so do "Pillow (PIL)" and "pillow".
+    """
+    text = MARKDOWN_ESCAPE_RE.sub(r'\1', name)
+    text = QUALIFIER_RE.sub('', text).strip() or text
+    stem = normalize_name('-'.join(text.split()))
+    previous = None
+    while stem != previous:
+        previous, stem = stem, NAME_AFFIX_RE.sub('', stem)
+    return stem.replace('-', '') or normalize_name(name)
+
+def char_ngrams(text, n=3):
+    text = f" {text} "
+    return {text[i:i + n] for i in range(max(1, len(text) - n + 1))}
+
+# Only a code host's owner/repo path identifies a project; other links (PyPI pages,
+# docs sites, articles citing several libraries at once) say little about identity
+CODE_HOSTS = {'github.com', 'gitlab.com', 'bitbucket.org', 'codeberg.org'}
+PYPI_HOST = 'pypi.org'
+
+def repo_path(url):
+    """owner/repo for a code host URL, lowercased and without .git; '' for anything else"""
+    parts = urlsplit((url or '').strip().lower())
+    if parts.netloc.removeprefix('www.') not in CODE_HOSTS:
+        return ''
+    segments = [s for s in parts.path.split('/') if s][:2]
+    return '/'.join(segments).removesuffix('.git') if len(segments) == 2 else ''
+
+def pypi_project(url):
+    """Normalized project name for a pypi.org/project/<name> URL, '' for anything else"""
+    parts = urlsplit((url or '').strip())
+    segments = [s for s in parts.path.split('/') if s]
+    if parts.netloc.lower().removeprefix('www.') != PYPI_HOST or len(segments) < 2 or segments[0] != 'project':
+        return ''
+    return normalize_name(segments[1])
+
+def exact_keys(lib):
+    """Stems a library is known by: its name's and, for a PyPI url, its project's"""
+    project = pypi_project(lib.get('url') or lib.get('link'))
+    return {name_stem(lib['name'])} | ({name_stem(project)} if project else set())
+
+def library_features(lib):
+    """Shingle sets for each view of a library; a view with nothing to go on is empty"""
+    repo = repo_path(lib.get('url') or lib.get('link'))
+    words = {w for w in WORD_RE.findall((lib.get('description') or '').lower()) if w not in STOPWORDS}
+    return {
+        'name': char_ngrams(name_stem(lib['name'])),
+        'url': char_ngrams(repo, 4) if repo else set(),
+        'description': words if len(words) >= MIN_DESCRIPTION_WORDS else set(),
+    }
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+class MinHasher:
+    """NUM_PERM hash functions; signature() keeps each one's minimum over a set of shingles
+
+    Each function is one 64-bit blake2b digest XORed with its own random mask,
+    which keeps signatures to a hash per shingle plus cheap integer ops.
+    """
+
+    def __init__(self, num_perm=NUM_PERM, seed=SEED):
+        rng = random.Random(seed)
+        self.masks = [rng.getrandbits(64) for _ in range(num_perm)]
+
+    @staticmethod
+    def _hash(shingle):
+        return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+
+    def signature(self, shingles):
+        hashes = [self._hash(s) for s in shingles]
+        return tuple(min([h ^ mask for h in hashes]) for mask in self.masks)
+
+class LSHIndex:
+    """Banded LSH over MinHash signatures: items sharing any band are candidate pairs
+
+    Buckets stop growing at max_bucket; a band that many libraries share
+    (a common prefix family like django-*) says nothing useful, and
+    returning it whole would make every addition compare against all of them.
+    """
+
+    def __init__(self, bands=BANDS, num_perm=NUM_PERM, max_bucket=MAX_BUCKET):
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_bucket = max_bucket
+        self.buckets = defaultdict(list)
+
+    def add(self, key, signature):
+        """File key under each of its bands; returns the keys already sharing a bucket with it"""
+        matches = set()
+        for band in range(self.bands):
+            bucket = self.buckets[band, signature[band * self.rows:(band + 1) * self.rows]]
+            if len(bucket) < self.max_bucket:
+                matches.update(bucket)
+                bucket.append(key)
+        return matches
+
+def find_near_duplicates(existing, candidates, hasher=None):
+    """Likely duplicates among existing libraries plus candidates
+
+    Returns a list of dicts (candidate, match, scores, reason), one per
+    candidate that resembles an existing library or an earlier candidate; the
+    best-scoring match is kept. A candidate whose name or PyPI project has the
+    same stem as an earlier library's is matched exactly, before any MinHash.
+    Pairs of existing libraries are not reported.
+    """
+    hasher = hasher or MinHasher()
+    indexes = {view: LSHIndex(num_perm=len(hasher.masks)) for view in THRESHOLDS}
+    known = {}      # exact key -> first library known by it
+    libraries = []
+    features = []
+    duplicates = []
+
+    for is_candidate, lib in [(False, lib) for lib in existing] + [(True, lib) for lib in candidates]:
+        key = len(libraries)
+        views = library_features(lib)
+        libraries.append(lib)
+        features.append(views)
+
+        keys = exact_keys(lib)
+        same = next((known[k] for k in keys if k in known), None)
+        for k in keys:
+            known.setdefault(k, key)
+        if is_candidate and same is not None:
+            scores = {view: jaccard(views[view], features[same][view]) for view in THRESHOLDS}
+            duplicates.append({'candidate': lib, 'match': libraries[same], 'scores': scores,
+                               'reason': 'same name' if name_stem(lib['name']) in exact_keys(libraries[same])
+                               else 'same PyPI project'})
+
+        matches = set()
+        for view, shingles in views.items():
+            if shingles:
+                matches |= indexes[view].add(key, hasher.signature(shingles))
+        if not is_candidate or not matches or same is not None:
+            continue
+
+        # LSH only proposes pairs; exact Jaccard on the shingle sets decides them
+        best = None
+        for other in matches:
+            scores = {view: jaccard(views[view], features[other][view]) for view in THRESHOLDS}
+            flagged = [view for view, score in scores.items() if score >= THRESHOLDS[view]]
+            if flagged and (best is None or max(scores.values()) > max(best['scores'].values())):
+                best = {'candidate': lib, 'match': libraries[other], 'scores': scores,
+                        'reason': ', '.join(flagged)}
+        if best:
+            duplicates.append(best)
+
+    return duplicates
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Adaptive Pagination
+Decides how deep to page through each search query: as far as its result
+count goes (up to a cap), but stopping early once recent pages mostly turn up
+packages we already have
+"""
+
+import math
+from collections import deque
+
+from dedup import normalize_name
+
+PAGE_SIZE = 20              # results PyPI shows per search page
+MAX_SEARCH_PAGES = 500      # PyPI stops paginating after 10,000 results
+DEFAULT_MAX_PAGES = 10
+DEFAULT_SATURATION = 0.8    # stop once this share of recent results is already known
+DEFAULT_WINDOW = 2          # number of recent pages the share is averaged over
+
+def pages_for_count(total):
+    """Number of search pages needed to see total results"""
+    return min(MAX_SEARCH_PAGES, max(1, math.ceil(total / PAGE_SIZE)))
+
+class PaginationPlanner:
+    """Tracks every query's frontier in the crawl journal and cuts off saturated queries
+
+    Call page_done() for each parsed page. The planner journals the page,
+    uses page 1's result count to trim the query's last page, and marks the
+    query finished once the last `window` pages averaged at least
+    `saturation` already-known packages. New-package counts are also fed to
+    an optional QueryYieldStats.
+    """
+
+    def __init__(self, journal, max_pages=DEFAULT_MAX_PAGES,
+                 saturation=DEFAULT_SATURATION, window=DEFAULT_WINDOW, stats=None):
+        self.journal = journal
+        self.stats = stats
+        self.max_pages = min(max_pages, MAX_SEARCH_PAGES)
+        self.saturation = saturation
+        self.window = window
+        self._recent = {}
+
+        # Packages found by earlier (resumed) runs count as known
+        self.known = {normalize_name(lib['name']) for lib in journal.records([])}
+
+    def pending_pages(self, query):
+        return self.journal.pending_pages(query, self.max_pages)
+
+    def wants(self, query, page_num):
+        """Whether page_num of query still needs fetching"""
+        return page_num in self.pending_pages(query)
+
+    def page_done(self, query, page_num, libraries, total=None):
+        """Record a parsed page; returns True while the query is worth paging further"""
+        if not libraries:
+            print(f"  ⚠️  '{query}' page {page_num}: no results")
+            self.journal.record_exhausted(query, page_num)
+            return False
+
+        self.journal.record_page(query, page_num, libraries)
+
+        if total is not None:
+            last_page = pages_for_count(total)
+            if last_page < self.max_pages:
+                self.journal.record_exhausted(query, last_page + 1)
+
+        names = [normalize_name(lib['name']) for lib in libraries]
+        new = len(set(names) - self.known)
+        known_share = 1 - new / len(names)
+        self.known.update(names)
+        if self.stats is not None:
+            self.stats.record(query, page_num, new, len(names))
+
+        recent = self._recent.setdefault(query, deque(maxlen=self.window))
+        recent.append(known_share)
+        print(f"  📄 '{query}' page {page_num}: Found {len(libraries)} packages "
+              f"({known_share:.0%} already known)")
+
+        saturated = len(recent) == self.window and sum(recent) / self.window >= self.saturation
+        if saturated and any(later > page_num for later in self.pending_pages(query)):
+            print(f"  ✋ '{query}': saturated after page {page_num}, skipping the rest")
+            self.journal.record_exhausted(query, page_num + 1)
+            return False
+
+        return bool(self.pending_pages(query))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Fetch/Parse Pipeline
+Fetch threads push raw pages into a bounded queue while a process pool parses
+them on every core, so network waits and parsing overlap instead of taking turns
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+POLL_INTERVAL = 0.05
+
+class FetchParsePipeline:
+    """Producer/consumer pipeline on top of a FetchEngine
+
+    Fetching runs on the engine's thread pool and is paced by its rate
+    controller. Fetched bodies wait in a queue of at most queue_size pages; when
+    parsing falls behind, fetch threads block on the full queue instead of
+    piling up HTML in memory.
+    """
+
+    def __init__(self, engine, parse_workers=None, queue_size=None):
+        self.engine = engine
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.queue_size = queue_size or self.parse_workers * 4
+        # Pages handed to the process pool but not yet parsed
+        self.max_in_flight = self.parse_workers * 2
+
+    def _fetch(self, pages, stopped, key, url, skip):
+        if stopped.is_set():
+            return
+        if skip is not None and skip(key):
+            item = (key, None, None)
+        else:
+            try:
+                item = (key, self.engine.fetch(url), None)
+            except Exception as e:
+                item = (key, None, e)
+
+        # Block while the queue is full (backpressure), unless the consumer went away
+        while not stopped.is_set():
+            try:
+                pages.put(item, timeout=POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def run(self, jobs, parse, skip=None):
+        """Fetch and parse every (key, url) job, yielding (key, result, error) as each finishes
+
+        parse(body, key) must be a picklable module-level function. Jobs for
+        which skip(key) is true at fetch time are not fetched and come back
+        with result and error both None. Results arrive in completion order,
+        not job order.
+        """
+        jobs = list(jobs)
+        pages = queue.Queue(maxsize=self.queue_size)
+        stopped = threading.Event()
+        for key, url in jobs:
+            self.engine.submit(self._fetch, pages, stopped, key, url, skip)
+
+        try:
+            yield from self._consume(pages, len(jobs), parse)
+        finally:
+            # Lets fetch threads exit if the caller stops iterating early
+            stopped.set()
+
+    def _consume(self, pages, total, parse):
+        received = 0
+        in_flight = {}
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as pool:
+            while received < total or in_flight:
+                # Keep the pool fed, but only block on the queue when nothing is parsing
+                while received < total and len(in_flight) < self.max_in_flight:
+                    try:
+                        key, body, error = pages.get(timeout=POLL_INTERVAL if in_flight else None)
+                    except queue.Empty:
+                        break
+                    received += 1
+
+                    if body is None:
+                        yield key, None, error
+                    else:
+                        in_flight[pool.submit(parse, body, key)] = key
+
+                if in_flight:
+                    done, _ = wait(in_flight, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        key = in_flight.pop(future)
+                        try:
+                            yield key, future.result(), None
+                        except Exception as e:
+                            yield key, None, e
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+PyPI Full Index Ingestion
+Streams the complete PyPI project list from the Simple API and writes one
+NDJSON record per project as it goes, deduplicating and categorizing on the
+fly so memory stays flat no matter how large the index gets
+"""
+
+import hashlib
+import json
+
+from lxml import etree
+
+from categorizer import categorize_library
+from dedup import normalize_name
+
+SIMPLE_INDEX_PATH = '/simple/'
+SIMPLE_INDEX_URL = 'https://pypi.org' + SIMPLE_INDEX_PATH
+DEFAULT_OUTPUT = 'pypi_index.ndjson'
+CHUNK_SIZE = 64 * 1024
+
+def iter_project_names(chunks):
+    """Yield project names from Simple API HTML arriving as an iterable of byte chunks
+
+    Each <a> is handled and discarded as soon as it closes, so the tree never
+    holds more than a handful of elements.
+    """
+    parser = etree.HTMLPullParser(events=('end',), tag='a')
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            name = (elem.text or '').strip()
+            if name:
+                yield name
+
+            # Drop this element and any finished siblings before it
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+    parser.close()
+    for _, elem in parser.read_events():
+        name = (elem.text or '').strip()
+        if name:
+            yield name
+
+class SeenNames:
+    """Set of normalized names stored as 64-bit digests instead of full strings"""
+
+    def __init__(self):
+        self._digests = set()
+
+    def add(self, name):
+        """Record name; returns False if an equivalent name was already seen"""
+        digest = int.from_bytes(
+            hashlib.blake2b(normalize_name(name).encode('utf-8'), digest_size=8).digest(), 'big'
+        )
+        if digest in self._digests:
+            return False
+        self._digests.add(digest)
+        return True
+
+def project_record(name):
+    """The scraper record format for a project known only by name"""
+    record = {
+        'name': name,
+        'description': "No description available",
+        'version': "unknown",
+        'created': "unknown",
+        'url': f"https://pypi.org/project/{name}/",
+        'search_query': '',
+    }
+    # The Simple index carries no descriptions, so the name is all there is to go on
+    record['category'] = categorize_library({'description': name.replace('-', ' ').replace('_', ' ')})
+    return record
+
+def ingest_full_index(engine, output=DEFAULT_OUTPUT, index_url=SIMPLE_INDEX_URL):
+    """Stream every project on the index into an NDJSON file; returns (written, duplicates)"""
+    seen = SeenNames()
+    written = duplicates = 0
+
+    response = engine.get(index_url, stream=True, headers={'Accept': 'text/html'})
+    with response, open(output, 'w', encoding='utf-8') as f:
+        for name in iter_project_names(response.iter_content(CHUNK_SIZE)):
+            if not seen.add(name):
+                duplicates += 1
+                continue
+
+            f.write(json.dumps(project_record(name), ensure_ascii=False) + '\n')
+            written += 1
+            if written % 50000 == 0:
+                print(f"  📄 {written:,} projects written...")
+
+    return written, duplicates
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+PyPI Stand-in Server
+A local HTTP server that answers like pypi.org, for load-testing the scrapers
+offline. Pages recorded in a response cache (any scraper run with the cache
+on) are replayed as-is; anything not recorded is synthesized: search pages
+with overlapping results up to a configurable pagination depth, the PEP 503
+Simple index (streamed, at a configurable size), project pages, JSON
+metadata and the RSS feeds. Latency is drawn from a configurable
+distribution and a share of requests can fail with 500s or 429s.
+
+    python3 tools/pypi_standin.py --port 8503 --latency lognormal --latency-ms 80 --throttle-rate 0.02
+    python3 tools/pypi_simple_scraper.py --base-url http://127.0.0.1:8503 --rate 50 --workers 32
+    python3 tools/pypi_simple_scraper.py --full-index --base-url http://127.0.0.1:8503
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from fetch_engine import PYPI_URL
+from http_cache import DEFAULT_CACHE_DIR, ResponseCache
+from pagination import PAGE_SIZE
+
+DEFAULT_PORT = 8503
+DEFAULT_DEPTH = 25          # search pages each query has before results run out
+DEFAULT_POOL_SIZE = 5000    # distinct synthetic packages that queries draw from
+DEFAULT_INDEX_SIZE = 100000 # projects listed in the Simple index
+INDEX_CHUNK_LINES = 2000    # Simple index lines per chunk sent
+LATENCY_MODELS = ('none', 'fixed', 'uniform', 'exponential', 'lognormal')
+FEED_ITEMS = 40
+
+class StandinConfig:
+    """Everything that shapes the stand-in's answers"""
+
+    def __init__(self, depth=DEFAULT_DEPTH, pool_size=DEFAULT_POOL_SIZE, latency='none',
+                 latency_ms=50.0, latency_sigma=0.5, error_rate=0.0, throttle_rate=0.0,
+                 retry_after=1, cache=None, seed=None, index_size=DEFAULT_INDEX_SIZE):
+        self.depth = depth
+        self.pool_size = pool_size
+        self.index_size = index_size
+        self.latency = latency
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.cache = cache
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def delay(self):
+        """Seconds to stall this response, drawn from the latency model"""
+        mean = self.latency_ms / 1000
+        with self.lock:
+            if self.latency == 'fixed':
+                return mean
+            if self.latency == 'uniform':
+                return self.random.uniform(0, 2 * mean)
+            if self.latency == 'exponential':
+                return self.random.expovariate(1 / mean) if mean else 0.0
+            if self.latency == 'lognormal':
+                # Median latency_ms, with a long tail controlled by sigma
+                return self.random.lognormvariate(0, self.latency_sigma) * mean
+        return 0.0
+
+    def injected_status(self):
+        """429, 500 or None for this request"""
+        with self.lock:
+            roll = self.random.random()
+        if roll < self.throttle_rate:
+            return 429
+        if roll < self.throttle_rate + self.error_rate:
+            return 500
+        return None
+
+class StandinStats:
+    """Request counters, including the most requests ever in flight at once"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.statuses = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started = time.monotonic()
+
+    def enter(self):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def leave(self, status):
+        with self.lock:
+            self.in_flight -= 1
+            self.statuses[status] += 1
+
+    def snapshot(self):
+        with self.lock:
+            total = sum(self.statuses.values())
+            elapsed = time.monotonic() - self.started
+            return {
+                'requests': total,
+                'requests_per_second': total / elapsed if elapsed else 0.0,
+                'max_in_flight': self.max_in_flight,
+                'statuses': dict(self.statuses),
+            }
+
+def _package_index(query, position, pool_size):
+    """Deterministic package number for a query's nth result
+
+    Each query reads a run of the pool starting at its own offset, so once
+    queries page deep enough their runs overlap and re-find each other's
+    packages, as real searches do.
+    """
+    offset = int.from_bytes(hashlib.blake2b(query.lower().encode('utf-8'), digest_size=4).digest(), 'big')
+    return (offset + position) % pool_size
+
+def package_name(number):
+    return f"standin-package-{number}"
+
+def search_page(query, page_num, config):
+    """PyPI search page markup for one page of synthetic results"""
+    total = config.depth * PAGE_SIZE
+    numbers = [
+        _package_index(query, (page_num - 1) * PAGE_SIZE + i, config.pool_size) for i in range(PAGE_SIZE)
+    ] if page_num <= config.depth else []
+
+    snippets = ''.join(f'''
+        <li>
+          <a class="package-snippet" href="/project/{package_name(number)}/">
+            <h3 class="package-snippet__title">
+              <span class="package-snippet__name">{package_name(number)}</span>
+              <span class="package-snippet__version">1.{number % 10}.0</span>
+              <span class="package-snippet__created"><time datetime="2024-01-01T00:00:00+0000">Jan 1, 2024</time></span>
+            </h3>
+            <p class="package-snippet__description">Stand-in package {number} for {html.escape(query)} work.</p>
+          </a>
+        </li>''' for number in numbers)
+
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>Search results · PyPI</title></head>'
+        f'<body><main><p><strong>{total:,}</strong> projects for "<strong>{html.escape(query)}</strong>"</p>'
+        f'<ul class="unstyled" aria-label="Search results">{snippets}</ul></main></body></html>'
+    )
+
+def simple_index(config):
+    """PEP 503 Simple index of index_size projects, as chunks of markup
+
+    The first pool_size names are the ones search pages return, so a full
+    index run and a search run see the same packages.
+    """
+    yield ('<!DOCTYPE html><html><head><meta name="pypi:repository-version" content="1.0">'
+           '<title>Simple index</title></head><body>\n')
+    for start in range(0, config.index_size, INDEX_CHUNK_LINES):
+        names = (package_name(number) for number in range(start, min(start + INDEX_CHUNK_LINES, config.index_size)))
+        yield ''.join(f'<a href="/simple/{name}/">{name}</a>\n' for name in names)
+    yield '</body></html>\n'
+
+def project_json(name):
+    return {
+        'info': {
+            'name': name,
+            'summary': f"Stand-in package {name}",
+            'version': '1.0.0',
+            'license': 'MIT',
+            'home_page': None,
+            'project_urls': {
+                'Source': f"https://github.com/standin/{name}",
+                'Documentation': f"https://{name}.readthedocs.io",
+            },
+            'requires_python': '>=3.8',
+        },
+        'releases': {'1.0.0': [{'upload_time_iso_8601': '2024-01-01T00:00:00.000000Z'}]},
+        'urls': [{'upload_time_iso_8601': '2024-01-01T00:00:00.000000Z'}],
+    }
+
+def rss_feed(title, config, new_projects=False):
+    """A feed whose items are the newest synthetic releases, one a minute back from now"""
+    now = time.time()
+    with config.lock:
+        numbers = [config.random.randrange(config.pool_size) for _ in range(FEED_ITEMS)]
+    items = []
+    for i, number in enumerate(numbers):
+        name = package_name(number)
+        link = f"{PYPI_URL}/project/{name}/" if new_projects else f"{PYPI_URL}/project/{name}/1.0.0/"
+        items.append(f'<item><title>{name}{" added to PyPI" if new_projects else " 1.0.0"}</title>'
+                     f'<link>{link}</link><pubDate>{formatdate(now - i * 60, usegmt=True)}</pubDate></item>')
+    return (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>{title}</title>'
+            f'{"".join(items)}</channel></rss>')
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'PyPIStandin/1.0'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        config, stats = self.server.config, self.server.stats
+        stats.enter()
+        status = 500
+        try:
+            if self.path == '/_stats':
+                status = self._send(200, json.dumps(stats.snapshot()), 'application/json')
+                return
+
+            time.sleep(config.delay())
+            injected = config.injected_status()
+            if injected == 429:
+                status = self._send(429, 'Too Many Requests', 'text/plain',
+                                    {'Retry-After': str(config.retry_after)})
+            elif injected == 500:
+                status = self._send(500, 'Internal Server Error', 'text/plain')
+            else:
+                status = self._answer(config)
+        finally:
+            stats.leave(status)
+
+    def _answer(self, config):
+        # Recorded responses win; the cache is keyed by the real pypi.org URL
+        if config.cache is not None:
+            entry = config.cache.lookup(PYPI_URL + self.path)
+            if entry is not None:
+                content_type = 'application/json' if '/json' in self.path else 'text/html; charset=utf-8'
+                return self._send(200, entry.body, content_type)
+
+        url = urlsplit(self.path)
+        parts = url.path.strip('/').split('/')
+        if parts[0] == 'search':
+            params = parse_qs(url.query)
+            query = params.get('q', [''])[0]
+            try:
+                page_num = int(params.get('page', ['1'])[0])
+            except ValueError:
+                page_num = 1
+            if page_num > config.depth + 1:
+                # Like PyPI, paging well past the end is a 404
+                return self._send(404, 'Not Found', 'text/plain')
+            return self._send(200, search_page(query, page_num, config), 'text/html; charset=utf-8')
+        if url.path == '/simple/':
+            return self._send_chunked(200, simple_index(config), 'text/html; charset=utf-8')
+        if parts[0] == 'pypi' and len(parts) == 3 and parts[2] == 'json':
+            return self._send(200, json.dumps(project_json(parts[1])), 'application/json')
+        if parts[0] == 'project' and len(parts) >= 2:
+            body = (f'<html><body><h1 class="package-header__name">{html.escape(parts[1])} 1.0.0</h1>'
+                    f'<p class="package-description__summary">Stand-in package {html.escape(parts[1])}</p>'
+                    '</body></html>')
+            return self._send(200, body, 'text/html; charset=utf-8')
+        if url.path == '/rss/updates.xml':
+            return self._send(200, rss_feed('PyPI recent updates', config), 'text/xml')
+        if url.path == '/rss/packages.xml':
+            return self._send(200, rss_feed('PyPI newest packages', config, new_projects=True), 'text/xml')
+        return self._send(404, 'Not Found', 'text/plain')
+
+    def _send(self, status, body, content_type, headers=None):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        return status
+
+    def _send_chunked(self, status, chunks, content_type):
+        """Stream chunks with chunked transfer encoding, for bodies too large to build up front"""
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for chunk in chunks:
+            data = chunk.encode('utf-8')
+            self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.write(b"0\r\n\r\n")
+        return status
+
+def make_server(config, host='127.0.0.1', port=DEFAULT_PORT):
+    """A ready-to-serve stand-in; port 0 picks a free one (see server.server_port)"""
+    server = ThreadingHTTPServer((host, port), StandinHandler)
+    server.daemon_threads = True
+    server.config = config
+    server.stats = StandinStats()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for pypi.org to load-test the scrapers")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"(default: {DEFAULT_PORT})")
+    parser.add_argument('--depth', type=int, default=DEFAULT_DEPTH,
+                        help=f"search pages per query before results run out (default: {DEFAULT_DEPTH})")
+    parser.add_argument('--pool-size', type=int, default=DEFAULT_POOL_SIZE,
+                        help=f"distinct synthetic packages queries draw from (default: {DEFAULT_POOL_SIZE})")
+    parser.add_argument('--index-size', type=int, default=DEFAULT_INDEX_SIZE,
+                        help=f"projects listed in the /simple/ index (default: {DEFAULT_INDEX_SIZE})")
+    parser.add_argument('--latency', choices=LATENCY_MODELS, default='none',
+                        help="latency distribution (default: none)")
+    parser.add_argument('--latency-ms', type=float, default=50.0,
+                        help="mean latency (median for lognormal) in milliseconds (default: 50)")
+    parser.add_argument('--latency-sigma', type=float, default=0.5,
+                        help="lognormal shape; higher means a longer tail (default: 0.5)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="share of requests answered with 500")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="share of requests answered with 429")
+    parser.add_argument('--retry-after', type=int, default=1, help="Retry-After seconds sent with 429s")
+    parser.add_argument('--replay', metavar='CACHE_DIR', nargs='?', const=DEFAULT_CACHE_DIR,
+                        help=f"replay pages recorded in a scraper response cache (default dir: {DEFAULT_CACHE_DIR})")
+    parser.add_argument('--seed', type=int, default=None, help="seed for reproducible latency and failures")
+    args = parser.parse_args()
+
+    cache = ResponseCache(args.replay, offline=True) if args.replay else None
+    config = StandinConfig(depth=args.depth, pool_size=args.pool_size, latency=args.latency,
+                           latency_ms=args.latency_ms, latency_sigma=args.latency_sigma,
+                           error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                           retry_after=args.retry_after, cache=cache, seed=args.seed,
+                           index_size=args.index_size)
+    server = make_server(config, args.host, args.port)
+
+    print("=" * 60)
+    print("PyPI Stand-in Server")
+    print("=" * 60)
+    print(f"\n🧪 Serving on http://{args.host}:{server.server_port} (stats at /_stats); Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if cache is not None:
+            cache.close()
+
+    snapshot = server.stats.snapshot()
+    print(f"\n📊 {snapshot['requests']:,} requests, {snapshot['requests_per_second']:.1f}/s, "
+          f"at most {snapshot['max_in_flight']} in flight")
+    for status, count in sorted(snapshot['statuses'].items()):
+        print(f"  HTTP {status}: {count:,}")
+
+if __name__ == "__main__":
+    main()
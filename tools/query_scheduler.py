@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Query Scheduler
+Remembers how many previously unseen packages each search query and page
+turned up, and uses that to order and prune the next run's work. Overlapping
+queries ("machine learning" vs "deep learning") stop costing requests once
+they consistently re-find the same packages.
+"""
+
+import json
+import os
+
+from pagination import PAGE_SIZE
+
+DEFAULT_STATS = 'query_yield_stats.json'
+EMA_ALPHA = 0.5             # weight of the newest observation in the running average
+DEFAULT_MIN_YIELD = 1.0     # new packages per request below which a page is pruned
+MIN_OBSERVATIONS = 2        # never prune a page on a single bad run
+REEXPLORE_AFTER = 5         # runs after which a pruned page is tried again
+
+class QueryYieldStats:
+    """Per (query, page) moving average of new packages found, persisted as JSON"""
+
+    def __init__(self, path=DEFAULT_STATS, min_yield=DEFAULT_MIN_YIELD):
+        self.path = path
+        self.min_yield = min_yield
+        self._data = {'runs': 0, 'queries': {}}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self._data = json.load(f)
+        self.run = self._data['runs'] + 1
+
+    def _entry(self, query, page_num):
+        return self._data['queries'].get(query, {}).get(str(page_num))
+
+    def expected_yield(self, query, page_num):
+        """Expected new packages from fetching this page; unexplored pages look maximally promising"""
+        entry = self._entry(query, page_num)
+        return entry['ema'] if entry else float(PAGE_SIZE)
+
+    def is_pruned(self, query, page_num):
+        entry = self._entry(query, page_num)
+        return (
+            entry is not None
+            and entry['fetched'] >= MIN_OBSERVATIONS
+            and entry['ema'] < self.min_yield
+            and self.run - entry['last_run'] < REEXPLORE_AFTER
+        )
+
+    def record(self, query, page_num, new, results):
+        """Fold one fetched page's outcome into the running averages"""
+        pages = self._data['queries'].setdefault(query, {})
+        entry = pages.get(str(page_num))
+        if entry is None:
+            entry = pages[str(page_num)] = {'ema': float(new), 'fetched': 0, 'new': 0, 'results': 0}
+        else:
+            entry['ema'] = EMA_ALPHA * new + (1 - EMA_ALPHA) * entry['ema']
+        entry['fetched'] += 1
+        entry['new'] += new
+        entry['results'] += results
+        entry['last_run'] = self.run
+
+    def schedule(self, jobs, planner):
+        """Drop pruned pages and order the rest by expected yield, best first
+
+        jobs is a list of ((query, page), url). A pruned page also ends its
+        query in the planner's journal, since deeper pages only yield less.
+        """
+        kept = []
+        for (query, page_num), url in jobs:
+            if self.is_pruned(query, page_num):
+                print(f"  ✂️  '{query}' page {page_num}: pruned (recent yield "
+                      f"{self.expected_yield(query, page_num):.1f} new/request)")
+                planner.journal.record_exhausted(query, page_num)
+            else:
+                kept.append(((query, page_num), url))
+
+        # Pruning an earlier page may have ended a query; the stable sort keeps
+        # shallower pages first among equal estimates
+        kept = [job for job in kept if planner.wants(*job[0])]
+        kept.sort(key=lambda job: -self.expected_yield(*job[0]))
+        return kept
+
+    def save(self):
+        self._data['runs'] = self.run
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def report(self, limit=5):
+        """Print the queries with the best and worst lifetime yield per request"""
+        totals = []
+        for query, pages in self._data['queries'].items():
+            fetched = sum(entry['fetched'] for entry in pages.values())
+            if fetched:
+                totals.append((sum(entry['new'] for entry in pages.values()) / fetched, query))
+        if not totals:
+            return
+
+        totals.sort(reverse=True)
+        print("\n📈 Best queries (new packages per request):")
+        for rate, query in totals[:limit]:
+            print(f"  {query}: {rate:.1f}")
+        worst = totals[max(limit, len(totals) - limit):]
+        if worst:
+            print("\n📉 Worst queries:")
+            for rate, query in worst:
+                print(f"  {query}: {rate:.1f}")
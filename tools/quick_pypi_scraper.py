@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 """
-Quick PyPI Scraper - Downloads HTML pages directly with curl
+Quick PyPI Scraper - Downloads the first page of a few searches in parallel
+through any scrape engine transport (a keep-alive requests session by default)
 """
 
+import argparse
 import json
-import subprocess
-from bs4 import BeautifulSoup
+
+from dedup import deduplicate_libraries
+from fetch_engine import PYPI_URL
+from http_cache import add_cache_arguments, cache_from_args
+from snippet_parser import parse_search_page
+from transports import TRANSPORTS, open_transport
 
 # Top categories to search
 SEARCHES = [
@@ -13,67 +19,48 @@ SEARCHES = [
     "testing", "automation", "scraping", "async", "api", "database"
 ]
 
-def download_page(query, page=1):
-    """Download a PyPI search page using curl"""
-    url = f"https://pypi.org/search/?q={query}&page={page}"
+# Only one page per search, so allow a short burst that covers every query
+QUICK_WORKERS = 10
+QUICK_RATE = 2.0
+QUICK_BURST = 10
+
+def download_page(engine, query, page=1, base_url=PYPI_URL):
+    """Download a PyPI search page, returning the raw response bytes"""
+    url = f"{base_url.rstrip('/')}/search/?q={query}&page={page}"
     try:
-        result = subprocess.run(
-            ['curl', '-s', '-L', url],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        return result.stdout
+        return engine.fetch(url)
     except Exception as e:
         print(f"Error downloading {url}: {e}")
         return None
 
 def parse_libraries(html):
-    """Extract libraries from HTML"""
-    soup = BeautifulSoup(html, 'html.parser')
-    libs = []
-
-    for snippet in soup.find_all('a', class_='package-snippet'):
-        try:
-            name_elem = snippet.find('span', class_='package-snippet__name')
-            desc_elem = snippet.find('p', class_='package-snippet__description')
-
-            if name_elem:
-                name = name_elem.text.strip()
-                desc = desc_elem.text.strip() if desc_elem else "No description"
-
-                libs.append({
-                    'name': name,
-                    'description': desc,
-                    'url': f"https://pypi.org/project/{name}/"
-                })
-        except:
-            continue
-
-    return libs
-
-def main():
+    """Extract libraries from HTML (str or undecoded bytes)"""
+    return [
+        {'name': lib['name'], 'description': lib['description'], 'url': lib['url']}
+        for lib in parse_search_page(html)
+    ]
+
+def main(cache=None, transport='requests', base_url=PYPI_URL):
     print("Quick PyPI Scraper")
     print("=" * 50)
 
     all_libs = []
 
-    for query in SEARCHES:
-        print(f"\nSearching: {query.replace('+', ' ')}")
-        html = download_page(query, page=1)
+    with open_transport(transport, max_workers=QUICK_WORKERS, rate=QUICK_RATE, burst=QUICK_BURST,
+                        cache=cache) as engine:
+        pages = engine.map(lambda query: download_page(engine, query, page=1, base_url=base_url), SEARCHES)
+
+        # Pages come back in SEARCHES order; parse each as soon as it is ready
+        for query, html in zip(SEARCHES, pages):
+            print(f"\nSearching: {query.replace('+', ' ')}")
 
-        if html:
-            libs = parse_libraries(html)
-            print(f"  Found {len(libs)} libraries")
-            all_libs.extend(libs)
+            if html:
+                libs = parse_libraries(html)
+                print(f"  Found {len(libs)} libraries")
+                all_libs.extend(libs)
 
     # Deduplicate
-    seen = set()
-    unique = []
-    for lib in all_libs:
-        if lib['name'].lower() not in seen:
-            seen.add(lib['name'].lower())
-            unique.append(lib)
+    unique = deduplicate_libraries(all_libs)
 
     print(f"\nTotal unique libraries: {len(unique)}")
 
@@ -89,4 +76,11 @@ def main():
         print(f"  - {lib['name']}: {lib['description'][:60]}...")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Quickly grab the first page of a few PyPI searches")
+    parser.add_argument('--transport', choices=list(TRANSPORTS), default='requests',
+                        help="how pages are fetched (default: requests)")
+    parser.add_argument('--base-url', default=PYPI_URL,
+                        help=f"PyPI, or a local stand-in such as pypi_standin.py (default: {PYPI_URL})")
+    add_cache_arguments(parser)
+    args = parser.parse_args()
+    main(cache=cache_from_args(args), transport=args.transport, base_url=args.base_url)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Adaptive Rate Control
+Per-host request pacing that backs off when a server pushes back and speeds
+up while it keeps answering quickly. Throttled (429/503) and failed requests
+are retried after the server's Retry-After or a jittered exponential backoff,
+and each host's concurrency and request rate follow additive-increase /
+multiplicative-decrease (AIMD) on its observed latency and error rate.
+"""
+
+import email.utils
+import math
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+THROTTLE_STATUSES = {429, 503}
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+DEFAULT_MAX_RETRIES = 4
+BACKOFF_BASE = 1.0          # seconds before the first retry (before jitter)
+BACKOFF_CAP = 60.0          # longest backoff or Retry-After honored
+RATE_CEILING = 4            # rate may grow to this multiple of the starting rate
+RATE_FLOOR = 8              # ... and shrink to this fraction of it
+DECREASE_FACTOR = 0.5       # multiplicative decrease on throttling, errors or slowdown
+ERROR_THRESHOLD = 0.1       # share of failed requests in a round that counts as trouble
+LATENCY_FACTOR = 2.0        # round latency above this multiple of the best seen counts as trouble
+LATENCY_SLACK = 0.05        # ... unless it is within this many seconds of the best (jitter on fast hosts)
+MIN_ROUND = 8               # fewest completions judged together, however low the concurrency limit
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, holding at most `capacity`"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def set_rate(self, rate):
+        """Change the refill rate; tokens earned so far are kept"""
+        with self._lock:
+            self._refill()
+            self.rate = rate
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+def retry_after_seconds(value):
+    """Seconds to wait according to a Retry-After header (delta-seconds or HTTP date), or None"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return min(float(value), BACKOFF_CAP)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return min(max(0.0, when.timestamp() - time.time()), BACKOFF_CAP)
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    """"Full jitter" exponential backoff: uniform in [0, min(cap, base * 2**attempt)]"""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+class HostController:
+    """AIMD-controlled concurrency limit and token-bucket rate for one host
+
+    Every request is bracketed by acquire() and release(). Completions are
+    judged in rounds of `limit` requests, and never fewer than MIN_ROUND, so
+    a low limit does not turn every single response into a round: a clean,
+    fast round adds one concurrent slot and one starting-rate step; a round
+    with too many errors or too much latency halves both. A throttled response halves them at once
+    and pauses the host for its Retry-After. Only one decrease is applied per
+    round of requests, so a burst of 429s for requests that were already in
+    flight does not collapse the limits.
+    """
+
+    def __init__(self, host, rate, burst, max_concurrency):
+        self.host = host
+        self.rate_step = rate
+        self.min_rate = rate / RATE_FLOOR
+        self.max_rate = rate * RATE_CEILING
+        self.max_concurrency = max_concurrency
+        self.limit = max(1.0, max_concurrency / 2)
+        self.bucket = TokenBucket(rate, burst)
+
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.best_latency = math.inf
+        self._epoch = 0             # bumped on every decrease
+        self._round = []            # (latency, failed) since the last adjustment
+        self._cond = threading.Condition()
+
+    @property
+    def rate(self):
+        return self.bucket.rate
+
+    def acquire(self):
+        """Block until the host is unpaused, has a free slot and has rate budget
+
+        Returns a ticket to hand back to release().
+        """
+        with self._cond:
+            while True:
+                pause = self.paused_until - time.monotonic()
+                if pause > 0:
+                    self._cond.wait(pause)
+                elif self.in_flight >= int(self.limit):
+                    self._cond.wait()
+                else:
+                    break
+            self.in_flight += 1
+            ticket = self._epoch
+
+        self.bucket.acquire()
+        return ticket
+
+    def release(self, ticket, latency, failed=False, throttled=False, retry_after=None):
+        """Free the slot taken by acquire() and fold the request's outcome into the limits"""
+        with self._cond:
+            self.in_flight -= 1
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+
+            if throttled:
+                self._decrease(ticket, "throttled")
+            else:
+                self._round.append((latency, failed))
+                if len(self._round) >= max(int(self.limit), MIN_ROUND):
+                    self._end_round(ticket)
+            self._cond.notify_all()
+
+    def abandon(self):
+        """Free the slot taken by acquire() for a request that ended without an outcome to judge"""
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def _end_round(self, ticket):
+        completed, self._round = self._round, []
+        error_rate = sum(failed for _, failed in completed) / len(completed)
+        latencies = [latency for latency, failed in completed if not failed]
+        if latencies:
+            self.best_latency = min(self.best_latency, min(latencies))
+
+        if error_rate > ERROR_THRESHOLD:
+            self._decrease(ticket, f"{error_rate:.0%} errors")
+        elif latencies and sum(latencies) / len(latencies) > max(
+                LATENCY_FACTOR * self.best_latency, self.best_latency + LATENCY_SLACK):
+            self._decrease(ticket, "latency rising")
+        else:
+            self.limit = min(self.max_concurrency, self.limit + 1)
+            self.bucket.set_rate(min(self.max_rate, self.rate + self.rate_step))
+
+    def _decrease(self, ticket, reason):
+        if ticket != self._epoch:
+            # Already backed off since this request was sent
+            return
+        self._epoch += 1
+        self._round = []
+        self.limit = max(1.0, self.limit * DECREASE_FACTOR)
+        self.bucket.set_rate(max(self.min_rate, self.rate * DECREASE_FACTOR))
+        print(f"  🐢 {self.host}: {reason}, backing off to {int(self.limit)} "
+              f"concurrent, {self.rate:.2f} req/s")
+
+class AdaptiveRateController:
+    """Hands out one HostController per host and runs requests through them with retries"""
+
+    def __init__(self, rate, burst, max_concurrency, max_retries=DEFAULT_MAX_RETRIES):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def host(self, url):
+        name = urlsplit(url).netloc.lower()
+        with self._lock:
+            if name not in self._hosts:
+                self._hosts[name] = HostController(name, self.rate, self.burst, self.max_concurrency)
+            return self._hosts[name]
+
+    def retry_delay(self, attempt, retry_after=None):
+        """Seconds to wait before retry number attempt + 1, or None once retries are used up"""
+        if attempt >= self.max_retries:
+            return None
+        return max(retry_after or 0.0, backoff_delay(attempt))
+
+    def settle(self, host, ticket, started, attempt, status=None, retry_after=None):
+        """Release one finished attempt; returns seconds to wait before retrying, or None when done
+
+        status is the response's HTTP status, or None if the attempt raised.
+        retry_after is the raw Retry-After header, if any.
+        """
+        latency = time.monotonic() - started
+        if status is None:
+            host.release(ticket, latency, failed=True)
+            return self.retry_delay(attempt)
+
+        throttled = status in THROTTLE_STATUSES
+        wait = retry_after_seconds(retry_after) if throttled else None
+        host.release(ticket, latency, failed=status >= 500, throttled=throttled, retry_after=wait)
+        return self.retry_delay(attempt, wait) if status in RETRY_STATUSES else None
+
+    def request(self, url, send, retry_on=(OSError,)):
+        """Call send() for url under its host's limits, retrying throttling and transient failures
+
+        send() must return a response with status_code and headers. The last
+        response is returned once it is not retryable or retries run out; an
+        exception from send() in retry_on is re-raised once retries run out,
+        any other one at once.
+        """
+        host = self.host(url)
+        attempt = 0
+        while True:
+            ticket = host.acquire()
+            started = time.monotonic()
+            try:
+                response = send()
+            except retry_on as e:
+                delay = self.settle(host, ticket, started, attempt)
+                if delay is None:
+                    raise
+                reason = type(e).__name__
+            except BaseException:
+                # Not a failure rate control retries (a bug, a subprocess timeout,
+                # an interrupt), but the slot must still come back
+                host.abandon()
+                raise
+            else:
+                status = response.status_code
+                delay = self.settle(host, ticket, started, attempt, status,
+                                    response.headers.get('Retry-After'))
+                if delay is None:
+                    return response
+                reason = f"HTTP {status}"
+
+            print(f"  ⏳ {url}: {reason}, retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+            time.sleep(delay)
+            attempt += 1
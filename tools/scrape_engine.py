@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+PyPI Scrape Engine
+The one search-scraping pipeline behind all the PyPI scrapers. Pages are
+fetched through a pluggable transport (requests, curl or Playwright; see
+transports.py), parsed on a process pool, paged adaptively and journaled.
+With --transport auto, a short comparison run picks the fastest transport
+that actually returns parseable pages.
+"""
+
+import argparse
+import json
+
+from categorizer import categorize_libraries
+from crawl_state import CrawlJournal, DEFAULT_JOURNAL
+from dedup import deduplicate_libraries
+from fetch_engine import DEFAULT_RATE, DEFAULT_WORKERS, PYPI_URL
+from http_cache import add_cache_arguments, cache_from_args
+from pagination import DEFAULT_MAX_PAGES, DEFAULT_SATURATION, PaginationPlanner
+from pipeline import FetchParsePipeline
+from query_scheduler import DEFAULT_MIN_YIELD, DEFAULT_STATS, QueryYieldStats
+from snippet_parser import parse_search_results
+from transports import (TRANSPORTS, available_transports, compare_transports, open_transport,
+                        pick_transport, print_comparison)
+
+# Categories to search on PyPI
+SEARCH_QUERIES = [
+    "web framework",
+    "data analysis",
+    "machine learning",
+    "deep learning",
+    "automation",
+    "web scraping",
+    "data visualization",
+    "testing",
+    "GUI",
+    "image processing",
+    "video processing",
+    "NLP natural language",
+    "computer vision",
+    "database ORM",
+    "API framework",
+    "async asynchronous",
+    "CLI command line",
+    "authentication",
+    "security cryptography",
+    "file processing",
+    "HTTP client",
+    "task queue",
+    "scheduling",
+    "PDF",
+    "Excel spreadsheet",
+    "scientific computing",
+    "networking",
+    "game development",
+    "3D graphics",
+    "plotting charts",
+    "devops docker kubernetes",
+    "monitoring logging",
+    "cache redis",
+    "queue kafka",
+    "serverless lambda"
+]
+
+# Sample used by --transport auto: the first pages of the first query
+DEFAULT_COMPARE_PAGES = 4
+
+def search_url(query, page_num, base_url=PYPI_URL):
+    return f"{base_url.rstrip('/')}/search/?q={query.replace(' ', '+')}&page={page_num}"
+
+def parse_result_page(content, key):
+    """Parse one fetched search page into (records, result count); runs in a worker process"""
+    query, _ = key
+    return parse_search_results(content, query=query)
+
+def scrape_all(engine, queries, journal, max_pages=DEFAULT_MAX_PAGES, parse_workers=None,
+               saturation=DEFAULT_SATURATION, stats=None, base_url=PYPI_URL):
+    """Fetch and parse search pages in parallel, paging each query only as deep as it pays off"""
+    planner = PaginationPlanner(journal, max_pages=max_pages, saturation=saturation, stats=stats)
+    pipeline = FetchParsePipeline(engine, parse_workers=parse_workers)
+
+    def not_wanted(key):
+        return not planner.wants(*key)
+
+    # Round 1 fetches page 1 of every query, which also reports each query's result
+    # count. Round 2 fetches the remaining pages breadth-first; queries drop out as
+    # soon as their count runs out or their pages stop turning up new packages.
+    for page_range in (range(1, 2), range(2, planner.max_pages + 1)):
+        jobs = [
+            ((query, page_num), search_url(query, page_num, base_url))
+            for page_num in page_range
+            for query in queries
+            if planner.wants(query, page_num)
+        ]
+        if stats is not None:
+            # Spend requests where past runs found the most new packages
+            jobs = stats.schedule(jobs, planner)
+        for (query, page_num), result, error in pipeline.run(jobs, parse_result_page, skip=not_wanted):
+            if error is not None:
+                # Leave the page in the frontier; a rerun will retry it
+                print(f"  ❌ '{query}' page {page_num}: {error}")
+            elif result is not None:
+                planner.page_done(query, page_num, *result)
+
+    # Results from this run and any earlier interrupted runs all live in the journal
+    return journal.records(queries)
+
+def save_results(all_libraries):
+    """Deduplicate, categorize and write pypi_libraries.json and pypi_libraries.md"""
+    print(f"\n📊 Total libraries found: {len(all_libraries)}")
+
+    # Deduplicate
+    unique_libraries = deduplicate_libraries(all_libraries)
+    print(f"📊 Unique libraries: {len(unique_libraries)}")
+
+    # Categorize
+    for lib, category in zip(unique_libraries, categorize_libraries(unique_libraries)):
+        lib['category'] = category
+
+    # Sort by name
+    unique_libraries.sort(key=lambda x: x['name'].lower())
+
+    # Save to JSON
+    output_file = 'pypi_libraries.json'
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(unique_libraries, f, indent=2, ensure_ascii=False)
+
+    print(f"\n✅ Saved {len(unique_libraries)} libraries to {output_file}")
+
+    # Print category breakdown
+    categories = {}
+    for lib in unique_libraries:
+        cat = lib['category']
+        categories[cat] = categories.get(cat, 0) + 1
+
+    print("\n📁 Category Breakdown:")
+    for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+        print(f"  {cat}: {count}")
+
+    # Save a formatted version for easy review
+    output_md = 'pypi_libraries.md'
+    with open(output_md, 'w', encoding='utf-8') as f:
+        f.write("# PyPI Libraries Found\n\n")
+        f.write(f"Total unique libraries: {len(unique_libraries)}\n\n")
+
+        current_category = None
+        for lib in sorted(unique_libraries, key=lambda x: (x['category'], x['name'].lower())):
+            if lib['category'] != current_category:
+                current_category = lib['category']
+                f.write(f"\n## {current_category}\n\n")
+
+            f.write(f"### {lib['name']}\n")
+            f.write(f"- **Description**: {lib['description']}\n")
+            f.write(f"- **URL**: {lib['url']}\n")
+            f.write(f"- **Version**: {lib['version']}\n\n")
+
+    print(f"✅ Saved formatted report to {output_md}")
+
+def choose_transport(names=None, pages=DEFAULT_COMPARE_PAGES, base_url=PYPI_URL, **options):
+    """Run a short comparison on live search pages and return the fastest working transport"""
+    urls = [search_url(SEARCH_QUERIES[0], page_num, base_url) for page_num in range(1, pages + 1)]
+    print(f"\n⚖️  Comparing transports on {len(urls)} search pages...")
+    report = compare_transports(urls, names, **options)
+    print_comparison(report)
+
+    name = pick_transport(report)
+    if name is None:
+        raise SystemExit("\n❌ No transport returned parseable search pages")
+    print(f"\n🏁 Using {name}")
+    return name
+
+def run(transport='requests', workers=DEFAULT_WORKERS, rate=DEFAULT_RATE, cache=None,
+        journal_path=DEFAULT_JOURNAL, parse_workers=None, max_pages=DEFAULT_MAX_PAGES,
+        saturation=DEFAULT_SATURATION, stats_path=DEFAULT_STATS, min_yield=DEFAULT_MIN_YIELD,
+        compare_pages=DEFAULT_COMPARE_PAGES, mode=None, base_url=PYPI_URL):
+    """Scrape every query through one transport and save the results
+
+    mode is the Playwright render mode; the other transports ignore it.
+    """
+    if transport == 'auto':
+        transport = choose_transport(pages=compare_pages, base_url=base_url, max_workers=workers, rate=rate)
+    transport_options = {'mode': mode} if transport == 'playwright' and mode else {}
+
+    journal = CrawlJournal(journal_path)
+    if journal.completed_pages:
+        print(f"\n♻️  Resuming: {journal.completed_pages} pages already in {journal_path}")
+    stats = QueryYieldStats(stats_path, min_yield=min_yield)
+
+    # Pages are fetched concurrently (paced by the transport's rate controller)
+    # and parsed on a process pool while the next ones download
+    with open_transport(transport, max_workers=workers, rate=rate, cache=cache,
+                        **transport_options) as engine:
+        all_libraries = scrape_all(engine, SEARCH_QUERIES, journal, max_pages=max_pages,
+                                   parse_workers=parse_workers, saturation=saturation, stats=stats,
+                                   base_url=base_url)
+
+    stats.save()
+    stats.report()
+    save_results(all_libraries)
+
+    remaining = journal.pending(SEARCH_QUERIES, max_pages)
+    if remaining:
+        journal.close()
+        print(f"\n⚠️  {remaining} pages failed; rerun to resume from {journal_path}")
+    else:
+        journal.finish()
+        print("\n🎉 Scraping complete!")
+
+def add_scrape_arguments(parser, workers=DEFAULT_WORKERS, rate=DEFAULT_RATE):
+    """The options every search scraper shares"""
+    parser.add_argument('--workers', type=int, default=workers,
+                        help=f"pages in flight at once (default: {workers})")
+    parser.add_argument('--rate', type=float, default=rate,
+                        help=f"starting requests per second per host, adapted at runtime (default: {rate})")
+    parser.add_argument('--max-pages', type=int, default=DEFAULT_MAX_PAGES,
+                        help=f"deepest search page fetched for any query (default: {DEFAULT_MAX_PAGES})")
+    parser.add_argument('--saturation', type=float, default=DEFAULT_SATURATION,
+                        help="stop a query once this share of its recent results is already known "
+                             f"(default: {DEFAULT_SATURATION})")
+    parser.add_argument('--stats', default=DEFAULT_STATS,
+                        help=f"per-query yield history used to order and prune pages (default: {DEFAULT_STATS})")
+    parser.add_argument('--min-yield', type=float, default=DEFAULT_MIN_YIELD,
+                        help="skip pages that recently averaged fewer new packages than this "
+                             f"(default: {DEFAULT_MIN_YIELD})")
+    parser.add_argument('--parse-workers', type=int, default=None,
+                        help="processes parsing pages (default: one per CPU)")
+    parser.add_argument('--journal', default=DEFAULT_JOURNAL,
+                        help=f"crawl journal used to resume interrupted runs (default: {DEFAULT_JOURNAL})")
+    parser.add_argument('--base-url', default=PYPI_URL,
+                        help=f"PyPI, or a local stand-in such as pypi_standin.py (default: {PYPI_URL})")
+    add_cache_arguments(parser)
+
+def scrape_options(args):
+    """run() keyword arguments for the options add_scrape_arguments() defined"""
+    return {
+        'workers': args.workers,
+        'rate': args.rate,
+        'cache': cache_from_args(args),
+        'journal_path': args.journal,
+        'parse_workers': args.parse_workers,
+        'max_pages': args.max_pages,
+        'saturation': args.saturation,
+        'stats_path': args.stats,
+        'min_yield': args.min_yield,
+        'base_url': args.base_url,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape PyPI search results through any transport")
+    parser.add_argument('--transport', choices=['auto', *TRANSPORTS], default='auto',
+                        help="how pages are fetched; auto benchmarks the available ones first (default: auto)")
+    parser.add_argument('--compare', action='store_true',
+                        help="only run the transport comparison and print it")
+    parser.add_argument('--compare-pages', type=int, default=DEFAULT_COMPARE_PAGES,
+                        help=f"search pages fetched per transport when comparing (default: {DEFAULT_COMPARE_PAGES})")
+    add_scrape_arguments(parser)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("PyPI Scrape Engine")
+    print("=" * 60)
+    print(f"\n🔌 Available transports: {', '.join(available_transports())}")
+
+    if args.compare:
+        choose_transport(pages=args.compare_pages, base_url=args.base_url,
+                         max_workers=args.workers, rate=args.rate)
+    else:
+        run(transport=args.transport, compare_pages=args.compare_pages, **scrape_options(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+PyPI Search Snippet Parser
+One lxml-based parser for PyPI search result pages, shared by all the scrapers
+"""
+
+import re
+
+from lxml import etree, html as lxml_html
+
+# Every result on a search page is an <a class="package-snippet"> element
+SNIPPET_XPATH = etree.XPath(
+    "//a[contains(concat(' ', normalize-space(@class), ' '), ' package-snippet ')]"
+)
+
+# The "<strong>1,234</strong> projects for ..." summary above the results
+RESULT_COUNT_XPATH = etree.XPath("//p[strong][contains(., 'project')]")
+RESULT_COUNT_RE = re.compile(r'([\d,]+)\+?\s+projects?\b')
+
+# Child element class -> record field it fills
+FIELD_CLASSES = {
+    'package-snippet__name': 'name',
+    'package-snippet__description': 'description',
+    'package-snippet__version': 'version',
+    'package-snippet__created': 'created',
+}
+
+def parse_search_page(page, query=None):
+    """Extract package records from a PyPI search page (str or bytes)
+
+    Returns a list of dicts with name, description, version, created and url,
+    plus search_query when a query is given. An empty list means the page had
+    no results.
+    """
+    root = _parse_html(page)
+    return _parse_snippets(root, query) if root is not None else []
+
+def parse_search_results(page, query=None):
+    """Like parse_search_page, but returns (records, total result count or None)"""
+    root = _parse_html(page)
+    if root is None:
+        return [], None
+    return _parse_snippets(root, query), _parse_result_count(root)
+
+def _parse_html(page):
+    try:
+        return lxml_html.fromstring(page)
+    except (etree.ParserError, ValueError):
+        # Empty or unparseable body
+        return None
+
+def _parse_result_count(root):
+    for elem in RESULT_COUNT_XPATH(root):
+        match = RESULT_COUNT_RE.search(elem.text_content())
+        if match:
+            return int(match.group(1).replace(',', ''))
+    return None
+
+def _parse_snippets(root, query):
+    libraries = []
+    for snippet in SNIPPET_XPATH(root):
+        fields = {}
+
+        # One walk over the snippet's descendants instead of a find() per field
+        for elem in snippet.iter('span', 'p'):
+            for cls in (elem.get('class') or '').split():
+                field = FIELD_CLASSES.get(cls)
+                if field and field not in fields:
+                    fields[field] = elem.text_content().strip()
+
+        name = fields.get('name')
+        if not name:
+            continue
+
+        library = {
+            'name': name,
+            'description': fields.get('description') or "No description available",
+            'version': fields.get('version') or "unknown",
+            'created': fields.get('created') or "unknown",
+            'url': f"https://pypi.org/project/{name}/",
+        }
+        if query is not None:
+            library['search_query'] = query
+        libraries.append(library)
+
+    return libraries
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Scraper Transports
+Interchangeable ways of fetching a page, all exposing FetchEngine's interface
+(fetch, get, submit, map, close) so the scraping pipeline runs on any of them:
+
+  requests   - in-process keep-alive session (FetchEngine itself)
+  curl       - one curl subprocess per request
+  playwright - headless Chromium, for pages that only render with JavaScript
+
+compare_transports() fetches the same pages through each one in its own
+process and reports throughput, latency percentiles and peak memory;
+pick_transport() chooses the fastest one whose pages actually parsed.
+"""
+
+import asyncio
+import importlib.util
+import multiprocessing
+import resource
+import shutil
+import subprocess
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from fetch_engine import DEFAULT_BURST, DEFAULT_RATE, DEFAULT_WORKERS, FetchEngine
+from snippet_parser import parse_search_page
+
+CURL_HEADER_SKIP = {'accept-encoding', 'connection'}     # curl manages these itself
+COMPARE_TIMEOUT = 300       # seconds one transport gets to finish a comparison run
+
+class CurlResponse:
+    """The slice of requests.Response the engine and scrapers use"""
+
+    def __init__(self, url, status_code, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+class CurlTransport(FetchEngine):
+    """Sends each request through a curl subprocess; caching and rate control work as usual"""
+
+    name = 'curl'
+
+    @staticmethod
+    def available():
+        return shutil.which('curl') is not None
+
+    def _send(self, url, headers=None, timeout=None, **kwargs):
+        command = ['curl', '--silent', '--show-error', '--location', '--compressed', '--dump-header', '-']
+        if timeout:
+            command += ['--max-time', str(timeout)]
+        for header, value in {**self.session.headers, **(headers or {})}.items():
+            if header.lower() not in CURL_HEADER_SKIP:
+                command += ['--header', f"{header}: {value}"]
+        command.append(url)
+
+        result = subprocess.run(command, capture_output=True, timeout=(timeout or self.timeout) + 5)
+        if result.returncode != 0:
+            # OSError, so rate control treats it like a dropped connection and retries
+            raise OSError(f"curl exited with {result.returncode}: {result.stderr.decode(errors='replace').strip()}")
+
+        # --location dumps one header block per hop; the last one is the response's
+        out = result.stdout
+        status, header_lines = 0, []
+        while out.startswith(b'HTTP/'):
+            block, _, out = out.partition(b'\r\n\r\n')
+            status_line, *header_lines = block.decode('latin-1').split('\r\n')
+            status = int(status_line.split()[1])
+        headers = CaseInsensitiveDict()
+        for line in header_lines:
+            key, sep, value = line.partition(':')
+            if sep:
+                headers[key.strip()] = value.strip()
+        return CurlResponse(url, status, headers, out)
+
+class PlaywrightTransport(FetchEngine):
+    """Renders each page in a pooled headless Chromium running on its own event loop thread"""
+
+    name = 'playwright'
+
+    @staticmethod
+    def available():
+        return importlib.util.find_spec('playwright') is not None
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, rate=DEFAULT_RATE, burst=DEFAULT_BURST,
+                 cache=None, mode="light", **kwargs):
+        # Imported here so the other transports work without Playwright installed
+        from browser_pool import BrowserPool
+
+        super().__init__(max_workers=max_workers, rate=rate, burst=burst, cache=cache, **kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        # The pool's plain-HTTP loads go through this engine, so there is one session
+        # and one per-host rate controller for both kinds of load
+        self._pool = BrowserPool(size=max_workers, cache=cache, mode=mode, engine=self)
+        try:
+            self._call(self._pool.__aenter__())
+        except Exception:
+            self._stop_loop()
+            raise
+
+    def _call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _stop_loop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _load(self, url):
+        from browser_pool import load_search_page
+
+        async with self._pool.page() as page:
+            content = await load_search_page(self._pool, page, url)
+        return content if isinstance(content, bytes) else content.encode('utf-8')
+
+    def fetch(self, url):
+        """HTML of url as bytes, rendered or over plain HTTP per the pool's mode"""
+        return self._call(self._load(url))
+
+    def close(self):
+        super().close()
+        self._call(self._pool.__aexit__(None, None, None))
+        self._stop_loop()
+
+TRANSPORTS = {
+    'requests': FetchEngine,
+    'curl': CurlTransport,
+    'playwright': PlaywrightTransport,
+}
+
+def available_transports():
+    return [name for name, cls in TRANSPORTS.items() if getattr(cls, 'available', lambda: True)()]
+
+def open_transport(name, **kwargs):
+    """Instantiate a transport by name; kwargs are FetchEngine's (max_workers, rate, burst, cache)"""
+    return TRANSPORTS[name](**kwargs)
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+def _measure(name, urls, options, results):
+    """Comparison run for one transport; runs in a child process so memory is its own"""
+    latencies = []
+    parsed = errors = 0
+    try:
+        with open_transport(name, **options) as transport:
+            # Browser launch and the like happen once per run, so they stay out of the timing
+            started = time.perf_counter()
+
+            def timed(url):
+                start = time.perf_counter()
+                body = transport.fetch(url)
+                return time.perf_counter() - start, body
+
+            futures = [transport.submit(timed, url) for url in urls]
+            for future in futures:
+                try:
+                    latency, body = future.result()
+                except Exception:
+                    errors += 1
+                    continue
+                latencies.append(latency)
+                parsed += bool(parse_search_page(body))
+            elapsed = time.perf_counter() - started
+    except Exception as e:
+        # Some errors (Playwright's missing-browser banner) run to many lines
+        message = (str(e).strip().splitlines() or [''])[0]
+        results.put({'transport': name, 'error': f"{type(e).__name__}: {message}"})
+        return
+
+    # ru_maxrss is in KiB on Linux; children covers curl processes and Chromium
+    peak_kib = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                + resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    results.put({
+        'transport': name,
+        'pages': len(urls),
+        'parsed': parsed,
+        'errors': errors,
+        'throughput': len(latencies) / elapsed if elapsed else 0.0,
+        'p50': percentile(latencies, 50) if latencies else None,
+        'p95': percentile(latencies, 95) if latencies else None,
+        'p99': percentile(latencies, 99) if latencies else None,
+        'peak_mb': peak_kib / 1024,
+    })
+
+def compare_transports(urls, names=None, **options):
+    """Fetch urls through each transport in turn; returns one result dict per transport
+
+    The response cache is never used here, so every transport does real work.
+    """
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    report = []
+    for name in names or available_transports():
+        process = context.Process(target=_measure, args=(name, urls, {**options, 'cache': None}, results))
+        process.start()
+        process.join(COMPARE_TIMEOUT)
+        if process.is_alive():
+            process.terminate()
+            report.append({'transport': name, 'error': f"timed out after {COMPARE_TIMEOUT}s"})
+        elif results.empty():
+            report.append({'transport': name, 'error': f"exited with code {process.exitcode}"})
+        else:
+            report.append(results.get())
+    return report
+
+def pick_transport(report):
+    """Name of the fastest transport whose every page parsed into results, or None"""
+    working = [r for r in report if 'error' not in r and r['parsed'] == r['pages']]
+    if not working:
+        return None
+    return max(working, key=lambda r: r['throughput'])['transport']
+
+def print_comparison(report):
+    print(f"\n   {'transport':<11} {'pages/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'peak MB':>8}  parsed")
+    for r in report:
+        if 'error' in r:
+            print(f"   {r['transport']:<11} ❌ {r['error']}")
+            continue
+        ms = [f"{r[key] * 1000:8.0f}" if r[key] is not None else f"{'-':>8}" for key in ('p50', 'p95', 'p99')]
+        print(f"   {r['transport']:<11} {r['throughput']:8.2f} {' '.join(ms)} {r['peak_mb']:8.0f}  "
+              f"{r['parsed']}/{r['pages']}")